@@ -15,6 +15,8 @@ from flask import Flask, render_template, request
 
 from . import advanced_routes, auth_routes, chat_routes, ecc_routes, encryption_routes, history_routes, tutorials
 from .db_helpers import init_db
+from .dlp_jobs import fail_stale_jobs
+from .dlp_planner import calibrate
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -35,6 +37,8 @@ def create_app():
     _register_routes(app)
     _register_base_pages(app)
     init_db()
+    fail_stale_jobs()
+    calibrate()
 
     return app
 
@@ -1,13 +1,15 @@
 """
 Advanced ECC routes for educational features:
 - Point classification
+- Group structure (Z/n1 x Z/n2)
 - Diffie-Hellman key exchange
 - Discrete logarithm demonstration
 - Utility functions
 """
 
 from flask import jsonify, request
-from .elliptic_curve import EllipticCurve
+from .elliptic_curve import get_curve
+from .point_set import dumps
 
 
 def register_advanced_routes(app):
@@ -20,7 +22,7 @@ def register_advanced_routes(app):
             b = int(data['b'])
             p = int(data['p'])
 
-            curve = EllipticCurve(a, b, p)
+            curve = get_curve(a, b, p)
             classification = curve.classify_points()
 
             # Format for JSON response
@@ -44,6 +46,36 @@ def register_advanced_routes(app):
         except Exception as e:
             return jsonify({'success': False, 'error': str(e)}), 400
 
+    @app.route('/api/group_structure', methods=['POST'])
+    def api_group_structure():
+        """Decompose the curve group as Z/n1 x Z/n2 with generators"""
+        try:
+            data = request.get_json()
+            a = int(data['a'])
+            b = int(data['b'])
+            p = int(data['p'])
+
+            curve = get_curve(a, b, p)
+            structure = curve.group_structure()
+            n1, n2 = structure['invariants']
+
+            def format_point(pt):
+                return None if pt == (None, None) else {'x': pt[0], 'y': pt[1]}
+
+            return jsonify({
+                'success': True,
+                'group_order': n1 * n2,
+                'invariants': [n1, n2],
+                'cyclic': structure['cyclic'],
+                'structure': f"Z/{n1}" if structure['cyclic'] else f"Z/{n1} x Z/{n2}",
+                'generators': [
+                    {'point': format_point(pt), 'order': order}
+                    for pt, order in zip(structure['basis'], (n1, n2))
+                ]
+            })
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+
     @app.route('/api/diffie_hellman', methods=['POST'])
     def api_diffie_hellman():
         """
@@ -56,14 +88,12 @@ def register_advanced_routes(app):
             b = int(data['b'])
             p = int(data['p'])
 
-            curve = EllipticCurve(a, b, p)
-            points = curve.find_all_points()
-
+            curve = get_curve(a, b, p)
             # Select a base point (generator)
             base_point = None
-            for pt in points:
+            for pt in curve.point_set():
                 if pt != (None, None):
-                    order = curve.get_order(pt)
+                    order = curve.get_order(pt, validate=False)
                     if order > 3:  # Want a point with reasonable order
                         base_point = pt
                         break
@@ -79,12 +109,12 @@ def register_advanced_routes(app):
             bob_private = random.randint(2, 10)
 
             # Calculate public keys
-            alice_public = curve.scalar_multiply(alice_private, base_point)
-            bob_public = curve.scalar_multiply(bob_private, base_point)
+            alice_public = curve.scalar_multiply(alice_private, base_point, validate=False, method='fixed_base', secret=True)
+            bob_public = curve.scalar_multiply(bob_private, base_point, validate=False, method='fixed_base', secret=True)
 
             # Calculate shared secrets
-            alice_shared = curve.scalar_multiply(alice_private, bob_public)
-            bob_shared = curve.scalar_multiply(bob_private, alice_public)
+            alice_shared = curve.scalar_multiply(alice_private, bob_public, validate=False, secret=True)
+            bob_shared = curve.scalar_multiply(bob_private, alice_public, validate=False, secret=True)
 
             # Generate step-by-step explanation
             steps = []
@@ -220,7 +250,7 @@ def register_advanced_routes(app):
             b = int(data['b'])
             p = int(data['p'])
 
-            curve = EllipticCurve(a, b, p)
+            curve = get_curve(a, b, p)
             test_vector = curve.generate_test_vector()
 
             return jsonify({'success': True, 'test_vector': test_vector})
@@ -237,8 +267,7 @@ def register_advanced_routes(app):
             p = int(data['p'])
             export_format = data.get('format', 'json')
 
-            curve = EllipticCurve(a, b, p)
-            points = curve.find_all_points()
+            curve = get_curve(a, b, p)
 
             params = {
                 'curve_equation': str(curve),
@@ -248,7 +277,7 @@ def register_advanced_routes(app):
                     'p': p
                 },
                 'discriminant': (4 * a**3 + 27 * b**2) % p,
-                'total_points': len(points)
+                'total_points': curve.group_order()
             }
 
             if export_format == 'python':
@@ -258,7 +287,7 @@ from app.elliptic_curve import EllipticCurve
 # Curve: {curve}
 curve = EllipticCurve(a={a}, b={b}, p={p})
 
-# Total points on curve: {len(points)}
+# Total points on curve: {params['total_points']}
 """
                 return jsonify({'success': True, 'data': code, 'format': 'python'})
 
@@ -269,7 +298,7 @@ const curveParams = {{
     a: {a},
     b: {b},
     p: {p},
-    totalPoints: {len(points)}
+    totalPoints: {params['total_points']}
 }};
 """
                 return jsonify({'success': True, 'data': code, 'format': 'javascript'})
@@ -290,35 +319,22 @@ const curveParams = {{
             p = int(data['p'])
             file_format = data.get('format', 'json')
 
-            curve = EllipticCurve(a, b, p)
-            points = curve.find_all_points()
+            curve = get_curve(a, b, p)
+            points = curve.point_set()
 
             if file_format == 'csv':
-                csv_data = "x,y\n"
-                for pt in points:
-                    if pt == (None, None):
-                        csv_data += "O,O\n"
-                    else:
-                        csv_data += f"{pt[0]},{pt[1]}\n"
-                return jsonify({'success': True, 'data': csv_data, 'format': 'csv'})
+                return jsonify({'success': True, 'data': points.to_csv(), 'format': 'csv'})
 
-            else:  # JSON format
-                formatted_points = []
-                for pt in points:
-                    if pt == (None, None):
-                        formatted_points.append({'x': None, 'y': None, 'display': 'O'})
-                    else:
-                        formatted_points.append({'x': pt[0], 'y': pt[1], 'display': f'({pt[0]}, {pt[1]})'})
-
-                return jsonify({
+            else:  # JSON format, written straight from the point arrays
+                return app.response_class(dumps({
                     'success': True,
                     'data': {
                         'curve': {'a': a, 'b': b, 'p': p},
-                        'points': formatted_points,
+                        'points': points,
                         'count': len(points)
                     },
                     'format': 'json'
-                })
+                }), mimetype='application/json')
 
         except Exception as e:
             return jsonify({'success': False, 'error': str(e)}), 400
@@ -72,6 +72,32 @@ def init_db():
             );
             """
         )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS dlp_jobs (
+                id TEXT PRIMARY KEY,
+                user_id INTEGER,
+                session_id TEXT,
+                status TEXT NOT NULL,
+                algorithm TEXT NOT NULL,
+                parameters TEXT NOT NULL,
+                steps INTEGER DEFAULT 0,
+                expected_steps INTEGER,
+                result TEXT,
+                error TEXT,
+                cancel_requested INTEGER DEFAULT 0,
+                created_at TEXT,
+                started_at TEXT,
+                updated_at TEXT,
+                finished_at TEXT,
+                FOREIGN KEY (user_id) REFERENCES users(id)
+            );
+            """
+        )
+        # Job tables created before updated_at was added.
+        columns = {row['name'] for row in conn.execute("PRAGMA table_info(dlp_jobs)")}
+        if 'updated_at' not in columns:
+            conn.execute("ALTER TABLE dlp_jobs ADD COLUMN updated_at TEXT")
         conn.commit()
     finally:
         conn.close()
@@ -128,3 +154,67 @@ def get_current_user():
         return dict(row)
     finally:
         conn.close()
+
+
+def create_dlp_job(job_id, user_id, session_id, algorithm, parameters, expected_steps):
+    conn = get_db()
+    try:
+        conn.execute(
+            "INSERT INTO dlp_jobs (id, user_id, session_id, status, algorithm, parameters, expected_steps, created_at) VALUES (?,?,?,?,?,?,?,?)",
+            (
+                job_id,
+                user_id,
+                session_id,
+                'queued',
+                algorithm,
+                json.dumps(parameters, ensure_ascii=False),
+                expected_steps,
+                datetime.utcnow().isoformat(),
+            ),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def update_dlp_job(job_id, **fields):
+    """Set columns of a DLP job row; 'result' is stored as JSON."""
+    if 'result' in fields:
+        fields['result'] = json.dumps(fields['result'], ensure_ascii=False)
+    columns = ', '.join(f"{name} = ?" for name in fields)
+    conn = get_db()
+    try:
+        conn.execute(f"UPDATE dlp_jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def fail_stale_dlp_jobs(before, error, finished_at):
+    """Mark running DLP jobs last saved before the given time as failed; returns how many."""
+    conn = get_db()
+    try:
+        cur = conn.execute(
+            "UPDATE dlp_jobs SET status = 'failed', error = ?, finished_at = ? "
+            "WHERE status = 'running' AND COALESCE(updated_at, started_at) < ?",
+            (error, finished_at, before),
+        )
+        conn.commit()
+        return cur.rowcount
+    finally:
+        conn.close()
+
+
+def get_dlp_job(job_id):
+    conn = get_db()
+    try:
+        cur = conn.execute("SELECT * FROM dlp_jobs WHERE id = ?", (job_id,))
+        row = cur.fetchone()
+        if not row:
+            return None
+        job = dict(row)
+        job['parameters'] = json.loads(job['parameters'])
+        job['result'] = json.loads(job['result']) if job['result'] is not None else None
+        return job
+    finally:
+        conn.close()
@@ -0,0 +1,210 @@
+"""
+Background discrete-logarithm jobs
+
+Long solves run in a local process pool instead of tying up the web
+worker that received the request. Everything about a job lives in the
+dlp_jobs table: the pool process records progress and the result there,
+and cancelling only raises a flag that the solver sees on its next
+progress report. Any web worker can therefore report on or cancel any
+job.
+"""
+
+import os
+import secrets
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+from .db_helpers import (create_dlp_job, fail_stale_dlp_jobs, get_dlp_job, save_history, save_operation_history,
+                         update_dlp_job)
+from .dlp_planner import plan
+from .elliptic_curve import get_curve
+
+# /api/discrete_log_solve algorithm names for each Pollard rho variant.
+RHO_ALGORITHMS = {
+    'rho': 'brent',
+    'rho_floyd': 'floyd',
+    'rho_distinguished': 'distinguished',
+}
+
+# Processes solving queued jobs side by side.
+JOB_WORKERS = int(os.environ.get('DLP_JOB_WORKERS') or 2)
+
+# A running job writes its step count (and checks for cancellation) at
+# most this often.
+PROGRESS_SAVE_SECONDS = 0.5
+
+# A running job that has not saved progress for this long lost its pool
+# process (typically to a restart of the web worker that owned it).
+STALE_JOB_SECONDS = 300
+
+FINISHED = ('done', 'failed', 'cancelled')
+
+_POOL = None
+
+
+class JobCancelled(Exception):
+    """Raised inside a running job once cancellation was requested."""
+
+
+def _get_pool():
+    """The job process pool, created on first use."""
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=JOB_WORKERS)
+    return _POOL
+
+
+def _now():
+    return datetime.utcnow().isoformat()
+
+
+def submit_job(params, user_id=None, session_id=None):
+    """
+    Queue a discrete logarithm for the job pool
+
+    Args:
+        params: Dict with a, b, p, gx, gy, qx, qy, algorithm and
+                optionally k_min, k_max and workers; points already validated
+        user_id: Owner, if logged in
+        session_id: Session allowed to poll and cancel the job
+
+    Returns:
+        str: Job id
+    """
+    curve = get_curve(params['a'], params['b'], params['p'])
+    G = (params['gx'], params['gy'])
+    n = curve.get_order(G, validate=False)
+    estimate = plan(curve, G, n, params['algorithm'], params.get('k_min'), params.get('k_max'),
+                    params.get('workers', 1))
+    if estimate['algorithm'] == 'brute_force':
+        # A job has no attempt list to show, so brute force runs as BSGS
+        # and is labelled and costed as such.
+        estimate = plan(curve, G, n, 'bsgs')
+    algorithm, expected = estimate['algorithm'], estimate['estimated_steps']
+
+    job_id = secrets.token_hex(16)
+    create_dlp_job(job_id, user_id, session_id, algorithm, params, expected)
+    _get_pool().submit(_run_job, job_id)
+    return job_id
+
+
+def cancel_job(job_id):
+    """Ask a queued or running job to stop; returns False if already finished."""
+    job = get_dlp_job(job_id)
+    if job is None or job['status'] in FINISHED:
+        return False
+    update_dlp_job(job_id, cancel_requested=1)
+    return True
+
+
+def fail_stale_jobs():
+    """
+    Fail running jobs whose process is gone, so their pollers get an answer
+
+    Called at application startup. Only jobs that have not saved progress
+    for STALE_JOB_SECONDS are touched: other web workers may still be
+    running theirs.
+
+    Returns:
+        int: Number of jobs marked failed
+    """
+    before = (datetime.utcnow() - timedelta(seconds=STALE_JOB_SECONDS)).isoformat()
+    return fail_stale_dlp_jobs(before, 'Interrupted by a server restart; please resubmit', _now())
+
+
+def describe_job(job):
+    """The job row as the status API returns it, with progress and ETA."""
+    steps, expected = job['steps'] or 0, job['expected_steps']
+    eta = None
+    if job['status'] == 'running' and steps and job['started_at']:
+        elapsed = (datetime.utcnow() - datetime.fromisoformat(job['started_at'])).total_seconds()
+        eta = round(max(expected - steps, 0) * elapsed / steps, 1)
+    return {
+        'id': job['id'],
+        'status': job['status'],
+        'algorithm': job['algorithm'],
+        'steps': steps,
+        'expected_steps': expected,
+        'progress': 1.0 if job['status'] == 'done' else min(steps / expected, 1.0) if expected else None,
+        'eta_seconds': eta,
+        'cancel_requested': bool(job['cancel_requested']),
+        'result': job['result'],
+        'error': job['error'],
+        'created_at': job['created_at'],
+        'started_at': job['started_at'],
+        'finished_at': job['finished_at'],
+    }
+
+
+def _solve(curve, G, Q, algorithm, params, progress):
+    """Run one solver; returns (k or None, additions)."""
+    if algorithm == 'kangaroo':
+        k_min = params.get('k_min')
+        k_max = params.get('k_max')
+        k_min = k_min if k_min is not None else 1
+        k_max = k_max if k_max is not None else curve.get_order(G, validate=False)
+        solved = curve.discrete_log_kangaroo(G, Q, k_min, k_max, validate=False, progress=progress)
+    elif algorithm == 'pohlig_hellman':
+        solved = curve.discrete_log_pohlig_hellman(G, Q, validate=False, progress=progress)
+    elif algorithm in RHO_ALGORITHMS:
+        solved = curve.discrete_log_rho(G, Q, cycle=RHO_ALGORITHMS[algorithm], validate=False,
+                                        workers=params.get('workers', 1), progress=progress)
+    elif algorithm == 'bsgs':
+        keys, steps = curve._bsgs_search(G, [Q], validate=False, progress=progress)
+        return keys[0], steps
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    return solved['k'], solved['steps']
+
+
+def _run_job(job_id):
+    """Pool entry point: solve a queued job and record the outcome."""
+    job = get_dlp_job(job_id)
+    if job is None:
+        return
+    if job['cancel_requested']:
+        update_dlp_job(job_id, status='cancelled', finished_at=_now())
+        return
+
+    params = job['parameters']
+    started = _now()
+    update_dlp_job(job_id, status='running', started_at=started, updated_at=started)
+    last = {'steps': 0, 'saved': time.monotonic()}
+
+    def progress(steps):
+        last['steps'] = steps
+        if time.monotonic() - last['saved'] < PROGRESS_SAVE_SECONDS:
+            return
+        last['saved'] = time.monotonic()
+        if get_dlp_job(job_id)['cancel_requested']:
+            raise JobCancelled()
+        update_dlp_job(job_id, steps=steps, updated_at=_now())
+
+    try:
+        curve = get_curve(params['a'], params['b'], params['p'])
+        G = (params['gx'], params['gy'])
+        Q = (params['qx'], params['qy'])
+        found_key, steps = _solve(curve, G, Q, job['algorithm'], params, progress)
+    except JobCancelled:
+        update_dlp_job(job_id, status='cancelled', steps=last['steps'], finished_at=_now())
+        return
+    except Exception as e:
+        update_dlp_job(job_id, status='failed', error=str(e), finished_at=_now())
+        return
+
+    update_dlp_job(job_id, status='done', steps=steps, result={'found_key': found_key},
+                   finished_at=_now())
+    save_history(job['user_id'], 'Discrete Log Solve', f'Found k = {found_key if found_key else "not found"}')
+    try:
+        save_operation_history(
+            user_id=job['user_id'],
+            operation_type='discrete_log',
+            curve_type='Fp',
+            parameters={'a': params['a'], 'b': params['b'], 'p': params['p'],
+                        'G': [params['gx'], params['gy']], 'Q': [params['qx'], params['qy']]},
+            result={'found_key': found_key, 'attempts': steps},
+            session_id=job['session_id'],
+        )
+    except Exception:
+        pass
@@ -0,0 +1,231 @@
+"""
+Cost model for choosing a discrete-logarithm algorithm
+
+Every solver's work is dominated by one kind of point addition: single
+affine additions (one inversion each) for the Brent/Floyd rho walks and
+the kangaroo, batched additions (one inversion per round, shared) for
+baby-step giant-step, distinguished-point rho and brute force. calibrate()
+times these on the host at two field sizes, and plan() multiplies them
+by each algorithm's expected step count for the actual problem - the
+order of G and its factorization, a key interval if one is known, cached
+BSGS tables - to pick the cheapest algorithm that fits the memory budget.
+"""
+
+import math
+import os
+import random
+import time
+
+from .elliptic_curve import _BSGS_TABLES, EllipticCurve
+from .parallel_dlog import MAX_WORKERS
+from .prime_field import _is_prime
+
+# Bytes of memory one solve may use for tables (BSGS baby steps, recorded
+# brute-force attempts, distinguished points).
+MEMORY_BUDGET = int(os.environ.get('DLP_MEMORY_BUDGET') or 256 * 2**20)
+
+# Synchronous requests estimated to take longer than this many seconds are
+# refused (they can still run as background jobs).
+REQUEST_BUDGET = float(os.environ.get('DLP_REQUEST_BUDGET') or 30)
+
+# Approximate memory per stored entry: a baby-step dict item, a recorded
+# brute-force attempt, a distinguished point.
+BSGS_ENTRY_BYTES = 120
+ATTEMPT_BYTES = 450
+DP_ENTRY_BYTES = 250
+
+# Expected additions per sqrt(n) (or sqrt(width) for the kangaroo), as
+# measured for this implementation.
+RHO_STEPS = {'rho': 2.3, 'rho_floyd': 3.5, 'rho_distinguished': 2.0}
+KANGAROO_STEPS = 4.0
+
+ALGORITHMS = ('brute_force', 'bsgs', 'rho', 'rho_floyd', 'rho_distinguished',
+              'kangaroo', 'pohlig_hellman')
+
+# Reference curves for calibration, by field size in bits.
+_REFERENCE_CURVES = {
+    64: (-3, 5, 2**61 - 1),
+    256: (0, 7, 2**256 - 2**32 - 977),
+}
+
+# {bits: {'add', 'batch_add', 'brute_step', 'mul_bit'}} in seconds, filled
+# in by calibrate().
+CALIBRATION = {}
+
+
+def calibrate(samples=256):
+    """
+    Time the basic operations on this host
+
+    Takes a few tens of milliseconds; called once at application startup.
+
+    Args:
+        samples: Additions timed per measurement
+
+    Returns:
+        dict: The new CALIBRATION table
+    """
+    rng = random.Random(0)
+    table = {}
+    for bits, (a, b, p) in _REFERENCE_CURVES.items():
+        curve = EllipticCurve(a, b, p)
+        P = next(curve.iter_points(x_start=1))
+        Q = curve._double(P)
+
+        start = time.perf_counter()
+        R = Q
+        for _ in range(samples):
+            R = curve._add(R, P)
+        add = (time.perf_counter() - start) / samples
+
+        start = time.perf_counter()
+        multiples = curve.multiples(P, samples)
+        batch_add = (time.perf_counter() - start) / samples
+
+        start = time.perf_counter()
+        attempts = [{'k_attempt': k, 'result_x': R[0], 'result_y': R[1], 'found': R == Q}
+                    for k, R in enumerate(curve.multiples(P, samples), 1)]
+        brute_step = (time.perf_counter() - start) / len(attempts)
+
+        start = time.perf_counter()
+        for _ in range(4):
+            curve.scalar_multiply(rng.getrandbits(bits) | 1, P, validate=False, method='binary')
+        mul_bit = (time.perf_counter() - start) / (4 * bits)
+
+        del multiples, attempts
+        table[bits] = {'add': add, 'batch_add': batch_add, 'brute_step': brute_step,
+                       'mul_bit': mul_bit}
+
+    CALIBRATION.clear()
+    CALIBRATION.update(table)
+    return CALIBRATION
+
+
+def unit_costs(bits):
+    """Per-operation costs for a field of the given size, interpolated."""
+    if not CALIBRATION:
+        calibrate()
+    (lo, low), (hi, high) = sorted(CALIBRATION.items())
+    t = max(bits - lo, 0) / (hi - lo)
+    return {name: low[name] + t * (high[name] - low[name]) for name in low}
+
+
+def _candidate(algorithm, steps, seconds, memory):
+    return {
+        'algorithm': algorithm,
+        'estimated_steps': int(steps),
+        'estimated_seconds': round(seconds, 4),
+        'memory_bytes': int(memory),
+        'feasible': memory <= MEMORY_BUDGET,
+    }
+
+
+def estimate(curve, G, n, algorithm, k_min=None, k_max=None, workers=1, keep_attempts=True):
+    """
+    Cost estimate for one algorithm
+
+    Args:
+        curve: EllipticCurve
+        G: Base point (reduced), for the BSGS table cache lookup
+        n: Order of G
+        algorithm: One of ALGORITHMS
+        k_min, k_max: Key interval for the kangaroo (default [1, n])
+        workers: Processes available to distinguished-point rho
+        keep_attempts: Whether brute force holds every attempt in memory
+                       (False when they are streamed out)
+
+    Returns:
+        dict: algorithm, estimated_steps, estimated_seconds, memory_bytes
+              and feasible (within MEMORY_BUDGET)
+    """
+    cost = unit_costs(curve.p.bit_length())
+    root = math.isqrt(n)
+
+    if algorithm == 'brute_force':
+        steps = n / 2
+        return _candidate(algorithm, steps, steps * cost['brute_step'],
+                          steps * ATTEMPT_BYTES if keep_attempts else 0)
+
+    if algorithm == 'bsgs':
+        m = min(root + 1, curve.BSGS_MAX_TABLE)
+        cached = (curve.a, curve.b, curve.p, G, m) in _BSGS_TABLES
+        steps = -(-n // m) / 2 + (0 if cached else m)
+        return _candidate(algorithm, steps, steps * cost['batch_add'] + 2 * n.bit_length() * cost['mul_bit'],
+                          m * BSGS_ENTRY_BYTES)
+
+    if algorithm in RHO_STEPS:
+        steps = RHO_STEPS[algorithm] * root
+        if algorithm == 'rho_distinguished':
+            seconds = steps * cost['batch_add'] / max(1, min(workers, MAX_WORKERS))
+            memory = DP_ENTRY_BYTES * 4 * math.isqrt(root)
+        else:
+            seconds = steps * cost['add']
+            memory = 0
+        return _candidate(algorithm, steps, seconds, memory)
+
+    if algorithm == 'kangaroo':
+        lo = k_min if k_min is not None else 1
+        hi = min(k_max if k_max is not None else n, lo + n - 1)
+        if 4 * (hi - lo) > n:
+            # discrete_log_kangaroo() hands intervals this wide to rho.
+            return {**estimate(curve, G, n, 'rho', workers=workers), 'algorithm': algorithm}
+        steps = KANGAROO_STEPS * math.isqrt(max(hi - lo, 1))
+        return _candidate(algorithm, steps, steps * cost['add'] + hi.bit_length() * cost['mul_bit'], 0)
+
+    if algorithm == 'pohlig_hellman':
+        steps = seconds = memory = 0
+        rest = n
+        for q in curve.group_order_factors():
+            e = 0
+            while rest % q == 0:
+                rest //= q
+                e += 1
+            if not e:
+                continue
+            sq = math.isqrt(q) + 1
+            if q <= curve.PH_BSGS_MAX_Q:
+                # One baby-step table per prime, half a giant walk per digit.
+                steps += sq + e * sq / 2
+                seconds += sq * cost['batch_add'] + e * sq / 2 * cost['add']
+                memory = max(memory, sq * BSGS_ENTRY_BYTES)
+            else:
+                steps += e * RHO_STEPS['rho_distinguished'] * sq
+                seconds += e * RHO_STEPS['rho_distinguished'] * sq * cost['batch_add']
+            # Projections and digit removal: a few multiplications per digit.
+            seconds += 3 * e * n.bit_length() * cost['mul_bit']
+        return _candidate(algorithm, steps, seconds, memory)
+
+    raise ValueError(f"Unknown algorithm: {algorithm}")
+
+
+def plan(curve, G, n, algorithm='auto', k_min=None, k_max=None, workers=1, keep_attempts=True):
+    """
+    Choose the cheapest algorithm (or cost the requested one)
+
+    Args:
+        curve: EllipticCurve
+        G: Base point, reduced mod p
+        n: Order of G
+        algorithm: 'auto' to choose, or one of ALGORITHMS to just estimate
+        k_min, k_max: Key interval, if known; makes the kangaroo a candidate
+        workers: Processes available to distinguished-point rho
+        keep_attempts: Whether brute force holds every attempt in memory
+
+    Returns:
+        dict: The chosen candidate (see estimate()) plus 'candidates', the
+              estimates for every algorithm considered, cheapest first
+    """
+    if algorithm != 'auto':
+        names = [algorithm]
+    else:
+        names = ['brute_force', 'bsgs', 'rho', 'rho_distinguished']
+        if k_min is not None or k_max is not None:
+            names.append('kangaroo')
+        if not _is_prime(n):
+            names.append('pohlig_hellman')
+
+    candidates = sorted((estimate(curve, G, n, name, k_min, k_max, workers, keep_attempts)
+                         for name in names),
+                        key=lambda c: (not c['feasible'], c['estimated_seconds']))
+    return {**candidates[0], 'candidates': candidates}
+
@@ -1,7 +1,41 @@
-from flask import jsonify, request, session
+import itertools
+import json
 
-from .db_helpers import ensure_session_id, get_current_user, save_history, save_operation_history
-from .elliptic_curve import EllipticCurve, RealEllipticCurve
+from flask import Response, jsonify, request, session, stream_with_context
+
+from .db_helpers import ensure_session_id, get_current_user, get_dlp_job, save_history, save_operation_history
+from .dlp_jobs import RHO_ALGORITHMS, cancel_job, describe_job, submit_job
+from .dlp_planner import ALGORITHMS, REQUEST_BUDGET, plan
+from .elliptic_curve import RealEllipticCurve, get_curve
+from .point_set import dumps, format_point
+
+
+def _ndjson_stream(records, kind, field=None):
+    """
+    Stream a route's output as NDJSON, one JSON object per line
+
+    Args:
+        records: Iterable of items followed by the final response body
+        kind: 'type' given to each item line; the last line is 'result'
+        field: Wrap each item as {field: item} (for plain strings)
+
+    Returns:
+        Response: application/x-ndjson, written while records are produced
+    """
+    def lines():
+        previous = None
+        try:
+            for record in records:
+                if previous is not None:
+                    item = {field: previous} if field else previous
+                    yield json.dumps({'type': kind, **item}) + '\n'
+                previous = record
+            yield json.dumps({'type': 'result', **previous}) + '\n'
+        except Exception as e:
+            # The 200 status is already sent; report the failure in-band.
+            yield json.dumps({'type': 'error', 'success': False, 'error': str(e)}) + '\n'
+
+    return Response(stream_with_context(lines()), mimetype='application/x-ndjson')
 
 
 def register_ecc_routes(app):
@@ -13,15 +47,44 @@ def register_ecc_routes(app):
             b = int(data['b'])
             p = int(data['p'])
 
-            curve = EllipticCurve(a, b, p)
-            points = curve.find_all_points()
-
-            formatted_points = []
-            for point in points:
-                if point == (None, None):
-                    formatted_points.append({'x': None, 'y': None, 'display': 'O'})
-                else:
-                    formatted_points.append({'x': point[0], 'y': point[1], 'display': f'({point[0]}, {point[1]})'})
+            curve = get_curve(a, b, p)
+
+            # Optional paging: offset/limit index into the usual point list
+            # (O first, then by x); x_min/x_max (inclusive) restrict it to an
+            # x window, which has no point at infinity. Only the requested
+            # slice is computed.
+            page_keys = ('offset', 'limit', 'x_min', 'x_max')
+            paged = any(data.get(key) is not None for key in page_keys)
+            has_more = False
+            if paged:
+                offset = int(data.get('offset') or 0)
+                limit = None if data.get('limit') is None else int(data['limit'])
+                if offset < 0 or (limit is not None and limit < 0):
+                    return jsonify({'success': False, 'error': 'offset and limit must be non-negative'}), 400
+
+                x_range = data.get('x_min') is not None or data.get('x_max') is not None
+                x_min = int(data.get('x_min') or 0)
+                x_max = p - 1 if data.get('x_max') is None else int(data['x_max'])
+                point_iter = curve.iter_points(x_min, x_max + 1)
+                if not x_range:
+                    point_iter = itertools.chain([(None, None)], point_iter)
+
+                stop = None if limit is None else offset + limit + 1
+                points = list(itertools.islice(point_iter, offset, stop))
+                if limit is not None and len(points) > limit:
+                    points.pop()
+                    has_more = True
+                return jsonify({
+                    'success': True,
+                    'points': [format_point(point) for point in points],
+                    'count': len(points),
+                    'offset': offset,
+                    'limit': limit,
+                    'has_more': has_more
+                })
+
+            # Full listing: serialize straight from the compact point set
+            points = curve.point_set()
 
             user = get_current_user()
             if user:
@@ -39,11 +102,11 @@ def register_ecc_routes(app):
             except Exception:
                 pass
 
-            return jsonify({
+            return app.response_class(dumps({
                 'success': True,
-                'points': formatted_points,
+                'points': points,
                 'count': len(points)
-            })
+            }), mimetype='application/json')
         except Exception as e:
             return jsonify({'success': False, 'error': str(e)}), 400
 
@@ -61,7 +124,9 @@ def register_ecc_routes(app):
             P = (None, None) if p1['x'] is None else (p1['x'], p1['y'])
             Q = (None, None) if p2['x'] is None else (p2['x'], p2['y'])
 
-            curve = EllipticCurve(a, b, p)
+            curve = get_curve(a, b, p)
+            curve.validate_point(P)
+            curve.validate_point(Q)
             steps = []
 
             if P == (None, None):
@@ -170,6 +235,11 @@ def register_ecc_routes(app):
 
     @app.route('/api/scalar_multiply', methods=['POST'])
     def api_scalar_multiply():
+        """
+        Compute k*P with a double-and-add explanation in 'steps'
+        With 'stream' set the reply is NDJSON: one 'step' line per
+        explanation line, then a 'result' line with 'result' and 'points'
+        """
         try:
             data = request.get_json()
             a = int(data['a'])
@@ -180,100 +250,167 @@ def register_ecc_routes(app):
             point_data = data['point']
             P = (None, None) if point_data['x'] is None else (point_data['x'], point_data['y'])
 
-            curve = EllipticCurve(a, b, p)
+            curve = get_curve(a, b, p)
             result = curve.scalar_multiply(k, P)
 
-            steps = []
             pts = []
 
-            # Enhanced explanation of the double-and-add algorithm
-            if k == 0:
-                steps.append("Computing 0·P = O (point at infinity)")
-                steps.append("Any point multiplied by 0 equals the point at infinity")
-            elif k < 0:
-                steps.append(f"Computing {k}·P (negative scalar)")
-                steps.append(f"This is equivalent to {-k}·(-P), where -P = (x, -{point_data['y']} mod {p})")
-                steps.append(f"Proceeding with {-k}·(-P)")
-            else:
-                # Show binary representation
-                binary_k = bin(k)[2:]  # Remove '0b' prefix
-                steps.append(f"Step 0: Decompose scalar using double-and-add algorithm")
-                steps.append(f"k = {k} (decimal) = {binary_k} (binary)")
-                steps.append(f"Algorithm processes bits from RIGHT to LEFT (least significant to most significant)")
-                steps.append("")
+            def trace():
+                """The explanation of the computation, one step string at a time."""
+                # Enhanced explanation of the double-and-add algorithm
+                if k == 0:
+                    yield "Computing 0·P = O (point at infinity)"
+                    yield "Any point multiplied by 0 equals the point at infinity"
+                elif k < 0:
+                    yield f"Computing {k}·P (negative scalar)"
+                    yield f"This is equivalent to {-k}·(-P), where -P = (x, -{point_data['y']} mod {p})"
+                    yield f"Proceeding with {-k}·(-P)"
+                else:
+                    # Show binary representation
+                    binary_k = bin(k)[2:]  # Remove '0b' prefix
+                    yield f"Step 0: Decompose scalar using double-and-add algorithm"
+                    yield f"k = {k} (decimal) = {binary_k} (binary)"
+                    yield f"Algorithm processes bits from RIGHT to LEFT (least significant to most significant)"
+                    yield ""
+
+                    # Show the algorithm structure
+                    yield f"Initialize:"
+                    yield f"  • Result = O (point at infinity)"
+                    yield f"  • Addend = P = ({point_data['x']}, {point_data['y']})"
+                    yield f"  • k = {k}"
+                    yield ""
+
+                    # Simulate double-and-add to show steps and collect intermediate results
+                    result_algo = (None, None)
+                    addend = P if P != (None, None) else (None, None)
+                    k_temp = k
+                    bit_position = 0
+                    pts_collected = []
+
+                    yield "Executing double-and-add algorithm:"
+                    while k_temp > 0:
+                        bit = k_temp & 1
+                        power = 2**bit_position
+                        yield f"  Bit {bit_position} (value = {bit}):"
+
+                        if bit == 1:
+                            # Collect the addend point being used
+                            if addend != (None, None):
+                                # Only add if not already in the list (avoid duplicates)
+                                if not any(p['x'] == addend[0] and p['y'] == addend[1] for p in pts_collected):
+                                    pts_collected.append({'x': addend[0], 'y': addend[1]})
+
+                            # Show addition step
+                            if result_algo == (None, None):
+                                yield f"    → Result is O, initialize to {power}P"
+                                result_algo = addend
+                                if addend != (None, None):
+                                    yield f"    → Result = ({addend[0]}, {addend[1]})"
+                            else:
+                                sum_point = curve.add_points(result_algo, addend, validate=False)
+                                yield f"    → Adding {power}P to Result"
+                                if result_algo != (None, None) and addend != (None, None):
+                                    yield f"    → Result = ({result_algo[0]}, {result_algo[1]}) + ({addend[0]}, {addend[1]})"
+                                if sum_point != (None, None):
+                                    yield f"    → Result = ({sum_point[0]}, {sum_point[1]})"
+                                    # Collect the result point (if not already collected as addend)
+                                    if not any(p['x'] == sum_point[0] and p['y'] == sum_point[1] for p in pts_collected):
+                                        pts_collected.append({'x': sum_point[0], 'y': sum_point[1]})
+                                else:
+                                    yield f"    → Result = O"
+                                result_algo = sum_point
+                        else:
+                            yield f"    → Bit is 0, skip {power}P (do not add)"
 
-                # Show the algorithm structure
-                steps.append(f"Initialize:")
-                steps.append(f"  • Result = O (point at infinity)")
-                steps.append(f"  • Addend = P = ({point_data['x']}, {point_data['y']})")
-                steps.append(f"  • k = {k}")
-                steps.append("")
+                        # Double the addend
+                        if k_temp > 1:  # Only if there are more bits
+                            next_power = 2**(bit_position+1)
+                            doubled = curve.add_points(addend, addend, validate=False) if addend != (None, None) else (None, None)
+                            yield f"    → Prepare next bit: Double {power}P to get {next_power}P"
+                            if addend != (None, None):
+                                if doubled != (None, None):
+                                    yield f"    → Addend = 2·({addend[0]}, {addend[1]}) = ({doubled[0]}, {doubled[1]})"
+                                else:
+                                    yield f"    → Addend = O"
+                            addend = doubled
 
-                # Simulate double-and-add to show steps and collect intermediate results
-                result_algo = (None, None)
-                addend = P if P != (None, None) else (None, None)
-                k_temp = k
-                bit_position = 0
-                pts_collected = []
+                        k_temp >>= 1
+                        bit_position += 1
+                        yield ""
 
-                steps.append("Executing double-and-add algorithm:")
-                while k_temp > 0:
-                    bit = k_temp & 1
-                    power = 2**bit_position
-                    steps.append(f"  Bit {bit_position} (value = {bit}):")
+                    yield "Summary:"
+                    yield f"Total bit positions: {bit_position} (O(log k))"
+                    yield f"Naive method would use: {k} additions (O(k))"
+                    yield f"Efficiency gain: {k / bit_position:.1f}x faster" if bit_position > 0 else ""
 
-                    if bit == 1:
-                        # Collect the addend point being used
-                        if addend != (None, None):
-                            # Only add if not already in the list (avoid duplicates)
-                            if not any(p['x'] == addend[0] and p['y'] == addend[1] for p in pts_collected):
-                                pts_collected.append({'x': addend[0], 'y': addend[1]})
+                    # Use collected intermediate points for visualization
+                    pts.extend(pts_collected)
 
-                        # Show addition step
-                        if result_algo == (None, None):
-                            steps.append(f"    → Result is O, initialize to {power}P")
-                            result_algo = addend
-                            if addend != (None, None):
-                                steps.append(f"    → Result = ({addend[0]}, {addend[1]})")
-                        else:
-                            sum_point = curve.add_points(result_algo, addend)
-                            steps.append(f"    → Adding {power}P to Result")
-                            if result_algo != (None, None) and addend != (None, None):
-                                steps.append(f"    → Result = ({result_algo[0]}, {result_algo[1]}) + ({addend[0]}, {addend[1]})")
-                            if sum_point != (None, None):
-                                steps.append(f"    → Result = ({sum_point[0]}, {sum_point[1]})")
-                                # Collect the result point (if not already collected as addend)
-                                if not any(p['x'] == sum_point[0] and p['y'] == sum_point[1] for p in pts_collected):
-                                    pts_collected.append({'x': sum_point[0], 'y': sum_point[1]})
-                            else:
-                                steps.append(f"    → Result = O")
-                            result_algo = sum_point
-                    else:
-                        steps.append(f"    → Bit is 0, skip {power}P (do not add)")
+            if result == (None, None):
+                result_formatted = {'x': None, 'y': None, 'display': 'O'}
+            else:
+                result_formatted = {'x': result[0], 'y': result[1], 'display': f'({result[0]}, {result[1]})'}
 
-                    # Double the addend
-                    if k_temp > 1:  # Only if there are more bits
-                        next_power = 2**(bit_position+1)
-                        doubled = curve.add_points(addend, addend) if addend != (None, None) else (None, None)
-                        steps.append(f"    → Prepare next bit: Double {power}P to get {next_power}P")
-                        if addend != (None, None):
-                            if doubled != (None, None):
-                                steps.append(f"    → Addend = 2·({addend[0]}, {addend[1]}) = ({doubled[0]}, {doubled[1]})")
-                            else:
-                                steps.append(f"    → Addend = O")
-                        addend = doubled
+            def record_history(steps):
+                user = get_current_user()
+                if user:
+                    save_history(user['id'], 'Scalar Multiply', f'{k} × {point_data["display"]} = {result_formatted["display"]}')
+                try:
+                    save_operation_history(
+                        user_id=session.get('user_id'),
+                        operation_type='multiply_fp',
+                        curve_type='Fp',
+                        parameters={'a': a, 'b': b, 'p': p, 'k': k, 'P': point_data},
+                        result={'R': result_formatted, 'steps': steps},
+                        session_id=session.get('session_id'),
+                    )
+                except Exception:
+                    pass
+
+            # The session cookie has to be set before a stream starts.
+            ensure_session_id()
+            if data.get('stream'):
+                def records():
+                    steps = []
+                    for step in trace():
+                        steps.append(step)
+                        yield step
+                    record_history(steps)
+                    yield {'success': True, 'result': result_formatted, 'points': pts}
+                return _ndjson_stream(records(), 'step', field='text')
+
+            steps = list(trace())
+            record_history(steps)
+            return jsonify({
+                'success': True,
+                'result': result_formatted,
+                'steps': steps,
+                'points': pts
+            })
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
 
-                    k_temp >>= 1
-                    bit_position += 1
-                    steps.append("")
+    @app.route('/api/multi_scalar_multiply', methods=['POST'])
+    def api_multi_scalar_multiply():
+        """
+        Compute a linear combination k1*P1 + ... + kn*Pn in a single pass
+        Expects 'terms': [{'k': int, 'point': {'x', 'y'}}, ...] and an optional 'method'
+        """
+        try:
+            data = request.get_json()
+            a = int(data['a'])
+            b = int(data['b'])
+            p = int(data['p'])
+            method = data.get('method', 'auto')
 
-                steps.append("Summary:")
-                steps.append(f"Total bit positions: {bit_position} (O(log k))")
-                steps.append(f"Naive method would use: {k} additions (O(k))")
-                steps.append(f"Efficiency gain: {k / bit_position:.1f}x faster" if bit_position > 0 else "")
+            terms = []
+            for term in data['terms']:
+                point_data = term['point']
+                P = (None, None) if point_data['x'] is None else (int(point_data['x']), int(point_data['y']))
+                terms.append((int(term['k']), P))
 
-                # Use collected intermediate points for visualization
-                pts = pts_collected
+            curve = get_curve(a, b, p)
+            result = curve.multi_scalar_multiply(terms, method=method)
 
             if result == (None, None):
                 result_formatted = {'x': None, 'y': None, 'display': 'O'}
@@ -282,15 +419,15 @@ def register_ecc_routes(app):
 
             user = get_current_user()
             if user:
-                save_history(user['id'], 'Scalar Multiply', f'{k} × {point_data["display"]} = {result_formatted["display"]}')
+                save_history(user['id'], 'Multi-Scalar Multiply', f'Sum of {len(terms)} terms = {result_formatted["display"]}')
             ensure_session_id()
             try:
                 save_operation_history(
                     user_id=session.get('user_id'),
-                    operation_type='multiply_fp',
+                    operation_type='multi_multiply_fp',
                     curve_type='Fp',
-                    parameters={'a': a, 'b': b, 'p': p, 'k': k, 'P': point_data},
-                    result={'R': result_formatted, 'steps': steps},
+                    parameters={'a': a, 'b': b, 'p': p, 'terms': data['terms'], 'method': method},
+                    result={'R': result_formatted},
                     session_id=session.get('session_id'),
                 )
             except Exception:
@@ -299,8 +436,7 @@ def register_ecc_routes(app):
             return jsonify({
                 'success': True,
                 'result': result_formatted,
-                'steps': steps,
-                'points': pts
+                'num_terms': len(terms)
             })
         except Exception as e:
             return jsonify({'success': False, 'error': str(e)}), 400
@@ -514,7 +650,7 @@ def register_ecc_routes(app):
                             steps.append(f"  {power}P = ({addend[0]:.6g}, {addend[1]:.6g})")
                             result_algo = addend
                         else:
-                            sum_point = curve.add_points(result_algo, addend)
+                            sum_point = curve.add_points(result_algo, addend, validate=False)
                             steps.append(f"  Bit is 1: Add {power}P to Result")
                             steps.append(f"  Result = ({result_algo[0]:.6g}, {result_algo[1]:.6g}) + ({addend[0]:.6g}, {addend[1]:.6g})")
                             if sum_point != (None, None):
@@ -531,7 +667,7 @@ def register_ecc_routes(app):
                     # Double the addend for next bit
                     if k_temp > 1:  # Only if there are more bits
                         next_power = 2**(bit_position+1)
-                        doubled = curve.add_points(addend, addend) if addend != (None, None) else (None, None)
+                        doubled = curve.add_points(addend, addend, validate=False) if addend != (None, None) else (None, None)
                         steps.append(f"  Prepare next bit: Double {power}P to get {next_power}P")
                         if doubled != (None, None):
                             steps.append(f"  {next_power}P = 2·({addend[0]:.6g}, {addend[1]:.6g}) = ({doubled[0]:.6g}, {doubled[1]:.6g})")
@@ -581,7 +717,20 @@ def register_ecc_routes(app):
     def api_discrete_log_solve():
         """
         Solve the discrete logarithm problem: find k such that k*G = Q
-        Uses brute force by default, or Baby-step Giant-step if use_bsgs is True
+        algorithm='auto' (default) lets the cost model in dlp_planner pick the
+        cheapest of brute force, Baby-step Giant-step, Pollard's rho, Pohlig-
+        Hellman and, given k_min and/or k_max, Pollard's kangaroo for that
+        interval; the estimate is returned in 'plan'. Small groups are
+        brute-forced with every attempt listed; use_bsgs forces BSGS. Any of
+        'brute_force', 'bsgs', 'rho', 'rho_floyd', 'rho_distinguished',
+        'pohlig_hellman' or 'kangaroo' can also be requested directly;
+        'rho_distinguished' spreads its walks over up to 'workers' processes.
+        Solves estimated to exceed DLP_REQUEST_BUDGET seconds are refused.
+        An optional 'targets' list of [x, y] points is solved in one batched
+        BSGS pass and answered in 'found_keys'. With 'async' set the solve is
+        queued as a background job instead (see /api/jobs/<job_id>). With
+        'stream' set the reply is NDJSON: one 'attempt' line per brute-force
+        try as it is made, then a 'result' line with the usual fields
         """
         try:
             data = request.get_json()
@@ -593,12 +742,14 @@ def register_ecc_routes(app):
             qx = int(data['qx'])
             qy = int(data['qy'])
             use_bsgs = data.get('use_bsgs', False)
+            algorithm = data.get('algorithm', 'auto')
+            workers = int(data.get('workers', 1))
+            k_min = int(data['k_min']) if data.get('k_min') is not None else None
+            k_max = int(data['k_max']) if data.get('k_max') is not None else None
+            if algorithm != 'auto' and algorithm not in ALGORITHMS:
+                return jsonify({'success': False, 'error': f'Unknown algorithm: {algorithm}'}), 400
 
-            curve = EllipticCurve(a, b, p)
-
-            # Get all non-infinity points on the curve
-            all_points = curve.find_all_points()
-            non_infinity_points = [pt for pt in all_points if pt != (None, None)]
+            curve = get_curve(a, b, p)
 
             G = (gx, gy)
             Q = (qx, qy)
@@ -609,96 +760,158 @@ def register_ecc_routes(app):
             if not curve.is_point_on_curve(qx, qy):
                 return jsonify({'success': False, 'error': 'Q is not on the curve'}), 400
 
-            found_key = None
-            attempts = []
-            max_attempts = len(non_infinity_points)
-
-            # Automatically use BSGS for larger problems
-            if max_attempts > 100:
-                use_bsgs = True
-
-            if use_bsgs and max_attempts > 10:
-                # Baby-step Giant-step algorithm
-                import math
-                m = math.ceil(math.sqrt(max_attempts))
-
-                # Baby step: compute k*G for k = 0, 1, ..., m-1
-                baby_steps = {}
-                temp_point = (None, None)  # Point at infinity
-                for k in range(m):
-                    if temp_point == (None, None):
-                        baby_steps[f"{None}_{None}"] = k
-                    else:
-                        key = f"{temp_point[0]}_{temp_point[1]}"
-                        baby_steps[key] = k
-                    temp_point = curve.add_points(temp_point, G) if temp_point != (None, None) else G
-
-                # Compute m*G (used for giant steps)
-                mG = temp_point
-                for _ in range(m - 1):
-                    mG = curve.add_points(mG, G)
-
-                # Negate m*G: compute -m*G
-                if mG != (None, None):
-                    neg_mG = (mG[0], (-mG[1]) % p)
-                else:
-                    neg_mG = (None, None)
-
-                # Giant step: compute Q - j*m*G for j = 0, 1, ..., m-1
-                gamma = Q
-                for j in range(m):
-                    gamma_key = f"{gamma[0]}_{gamma[1]}" if gamma != (None, None) else f"{None}_{None}"
-                    if gamma_key in baby_steps:
-                        k = (baby_steps[gamma_key] + j * m) % max_attempts
-                        if k > 0:  # k must be positive
-                            # Verify the result
-                            result = (None, None)
-                            for _ in range(k):
-                                result = curve.add_points(result, G) if result != (None, None) else G
-                            if result == Q:
-                                found_key = k
-                                break
-                    gamma = curve.add_points(gamma, neg_mG) if neg_mG != (None, None) else gamma
-
-            if not found_key:
-                # Brute force: try all values of k from 1 to max_attempts
-                result = (None, None)
-                for k in range(1, max_attempts + 1):
-                    result = curve.add_points(result, G) if result != (None, None) else G
-
-                    # Record all attempts for display
-                    attempts.append({
-                        'k_attempt': k,
-                        'result_x': result[0] if result != (None, None) else None,
-                        'result_y': result[1] if result != (None, None) else None,
-                        'found': result == Q
-                    })
-
-                    if result == Q:
-                        found_key = k
-                        break
+            # use_bsgs is the older way to ask for Baby-step Giant-step.
+            if algorithm == 'auto' and use_bsgs:
+                algorithm = 'bsgs'
+
+            if data.get('async'):
+                ensure_session_id()
+                user = get_current_user()
+                job_id = submit_job({
+                    'a': a, 'b': b, 'p': p, 'gx': gx, 'gy': gy, 'qx': qx, 'qy': qy,
+                    'algorithm': algorithm,
+                    'k_min': k_min,
+                    'k_max': k_max,
+                    'workers': workers,
+                }, user_id=user['id'] if user else None, session_id=session.get('session_id'))
+                return jsonify({'success': True, 'job_id': job_id, 'status_url': f'/api/jobs/{job_id}'}), 202
+
+            # Small groups keep the step-by-step brute force demonstration.
+            if algorithm == 'auto' and curve.group_order() <= 101:
+                algorithm = 'brute_force'
+
+            # A streamed brute force sends attempts on instead of keeping them.
+            stream = bool(data.get('stream'))
+            n = curve.get_order(G, validate=False)
+            estimate = plan(curve, G, n, algorithm, k_min, k_max, workers, keep_attempts=not stream)
+            algorithm = estimate['algorithm']
+            if not estimate['feasible']:
+                return jsonify({
+                    'success': False,
+                    'error': f"{algorithm} would need about {estimate['memory_bytes'] // 2**20} MiB, "
+                             f"over the DLP_MEMORY_BUDGET",
+                    'plan': estimate,
+                }), 400
+            if estimate['estimated_seconds'] > REQUEST_BUDGET:
+                return jsonify({
+                    'success': False,
+                    'error': f"{algorithm} would take about {estimate['estimated_seconds']:.0f} s, "
+                             f"over the {REQUEST_BUDGET:.0f} s request budget; resubmit with async",
+                    'plan': estimate,
+                }), 400
+
+            def solve():
+                """Yield each brute-force attempt as it is made, then the response."""
+                found_key = None
+                tried = 0
+                max_attempts = n
+
+                if algorithm == 'kangaroo':
+                    # Pollard's kangaroo: O(sqrt(k_max - k_min)) additions for a
+                    # key known to lie in [k_min, k_max] (default [1, ord(G)]).
+                    solved = curve.discrete_log_kangaroo(G, Q, k_min if k_min is not None else 1,
+                                                         k_max if k_max is not None else n, validate=False)
+                    found_key = solved['k']
+                    max_attempts = solved['steps']
+
+                elif algorithm == 'pohlig_hellman':
+                    # Solve modulo each prime power of ord(G), combine by CRT.
+                    solved = curve.discrete_log_pohlig_hellman(G, Q, validate=False)
+                    found_key = solved['k']
+                    max_attempts = solved['steps']
+
+                elif algorithm in RHO_ALGORITHMS:
+                    # Pollard's rho: O(sqrt(n)) additions in (near) constant
+                    # memory, so it also handles groups far beyond BSGS tables.
+                    solved = curve.discrete_log_rho(G, Q, cycle=RHO_ALGORITHMS[algorithm],
+                                                    validate=False, workers=workers)
+                    found_key = solved['k']
+                    max_attempts = solved['steps']
+
+                elif algorithm == 'bsgs':
+                    # Baby-step giant-step against the table cached for (curve, G)
+                    found_key = curve.discrete_log_bsgs(G, [Q], validate=False)[0]
 
-            user = get_current_user()
-            if user:
-                save_history(user['id'], 'Discrete Log Solve', f'Found k = {found_key if found_key else "not found"}')
+                else:
+                    # Brute force: try all values of k from 1 to max_attempts
+                    multiples = itertools.islice(curve.iter_multiples(G), max_attempts)
+                    for k, result in enumerate(multiples, 1):
+                        tried = k
+                        yield {
+                            'k_attempt': k,
+                            'result_x': result[0] if result != (None, None) else None,
+                            'result_y': result[1] if result != (None, None) else None,
+                            'found': result == Q
+                        }
+
+                        if result == Q:
+                            found_key = k
+                            break
+
+                # Further targets for the same G reuse the cached baby-step table.
+                found_keys = None
+                if data.get('targets'):
+                    targets = [(int(x), int(y)) for x, y in data['targets']]
+                    found_keys = curve.discrete_log_bsgs(G, targets)
+
+                user = get_current_user()
+                if user:
+                    save_history(user['id'], 'Discrete Log Solve', f'Found k = {found_key if found_key else "not found"}')
+                try:
+                    save_operation_history(
+                        user_id=session.get('user_id'),
+                        operation_type='discrete_log',
+                        curve_type='Fp',
+                        parameters={'a': a, 'b': b, 'p': p, 'G': [gx, gy], 'Q': [qx, qy]},
+                        result={'found_key': found_key, 'attempts': tried or max_attempts},
+                        session_id=session.get('session_id'),
+                    )
+                except Exception:
+                    pass
+
+                response = {
+                    'success': True,
+                    'found_key': found_key,
+                    'total_attempts': max_attempts,
+                    'algorithm': algorithm,
+                    'plan': estimate,
+                }
+                if found_keys is not None:
+                    response['found_keys'] = found_keys
+                yield response
+
+            # The session cookie has to be set before a stream starts.
             ensure_session_id()
-            try:
-                save_operation_history(
-                    user_id=session.get('user_id'),
-                    operation_type='discrete_log',
-                    curve_type='Fp',
-                    parameters={'a': a, 'b': b, 'p': p, 'G': [gx, gy], 'Q': [qx, qy]},
-                    result={'found_key': found_key, 'attempts': len(attempts) if attempts else max_attempts},
-                    session_id=session.get('session_id'),
-                )
-            except Exception:
-                pass
+            if stream:
+                return _ndjson_stream(solve(), 'attempt')
 
-            return jsonify({
-                'success': True,
-                'found_key': found_key,
-                'total_attempts': max_attempts,
-                'attempts': attempts
-            })
+            *attempts, response = solve()
+            response['attempts'] = attempts
+            return jsonify(response)
         except Exception as e:
             return jsonify({'success': False, 'error': str(e)}), 400
+
+    def _own_job(job_id):
+        """The job if it belongs to the current session, else None."""
+        job = get_dlp_job(job_id)
+        if job is None or job['session_id'] != session.get('session_id'):
+            return None
+        return job
+
+    @app.route('/api/jobs/<job_id>', methods=['GET'])
+    def api_job_status(job_id):
+        """Progress (steps done, ETA) or result of a background DLP job"""
+        job = _own_job(job_id)
+        if job is None:
+            return jsonify({'success': False, 'error': 'Job not found'}), 404
+        return jsonify({'success': True, 'job': describe_job(job)})
+
+    @app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+    def api_job_cancel(job_id):
+        """Stop a queued or running background DLP job"""
+        job = _own_job(job_id)
+        if job is None:
+            return jsonify({'success': False, 'error': 'Job not found'}), 404
+        if not cancel_job(job_id):
+            return jsonify({'success': False, 'error': f"Job already {job['status']}"}), 409
+        return jsonify({'success': True, 'job': describe_job(get_dlp_job(job_id))})
@@ -8,10 +8,137 @@ This module implements elliptic curve operations over finite fields:
 3. Multiply a point by a scalar
 """
 
+import itertools
+import math
+import random
+
+from .factorization import factorize
+from .group_structure import _CyclicQLog, group_structure
+from .lru_cache import LRUCache
+from .parallel_dlog import collision_search
+from .point_enumeration import (
+    cached_sqrt_table,
+    enumerate_points_numpy,
+    enumerate_points_table,
+    numpy_available,
+    sqrt_table,
+    sqrt_table_available,
+)
+from .point_counting import KNOWN_ORDERS, hasse_interval, mestre_order, schoof_trace
+from .point_set import PointSet
+from .prime_field import get_prime_field
+
+# Odd-multiple tables for wNAF scalar multiplication, keyed by curve
+# parameters and base point so they survive across EllipticCurve instances.
+_WNAF_TABLES = LRUCache(maxsize=256)
+
+# Shared curve instances handed out by get_curve(), keyed by (a, b, p).
+_CURVES = LRUCache(maxsize=64)
+
+# Enumerated point sets keyed by (a, b, p), bounded by the total number of
+# points held (16 bytes each) rather than by the number of curves.
+_POINT_SETS = LRUCache(maxsize=64, max_weight=2**22, weight=len)
+
+# Group orders #E(F_p) keyed by (a, b, p); one small int per curve.
+_GROUP_ORDERS = LRUCache(maxsize=1024)
+
+# Factorizations of those orders, {prime: exponent}, under the same keys.
+_GROUP_ORDER_FACTORS = LRUCache(maxsize=1024)
+
+# group_structure() results keyed by (a, b, p).
+_GROUP_STRUCTURES = LRUCache(maxsize=256)
+
+# Fixed-base window tables for long-lived generators. Each table holds
+# (bits / w) * (2^w - 1) points, so far fewer of them are kept.
+_FIXED_BASE_TABLES = LRUCache(maxsize=32)
+
+# Baby-step tables for discrete_log_bsgs(), keyed by curve parameters, base
+# point and table size: up to BSGS_MAX_TABLE packed-integer keys each, and
+# at most 2^21 keys (about 250 MB) over all tables.
+_BSGS_TABLES = LRUCache(maxsize=8, max_weight=2**21, weight=lambda entry: len(entry[1]))
+
+
+def _wnaf_digits(k, w):
+    """
+    Width-w non-adjacent form of a positive integer k
+
+    Args:
+        k: Positive scalar
+        w: Window width (>= 2)
+
+    Returns:
+        list: Signed odd digits |d| < 2^(w-1) (or 0), least significant first
+    """
+    digits = []
+    modulus = 1 << w
+    half = 1 << (w - 1)
+    while k:
+        if k & 1:
+            d = k & (modulus - 1)
+            if d >= half:
+                d -= modulus
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
+        k >>= 1
+    return digits
+
+
 class EllipticCurve:
     """
     Elliptic Curve E_p(a, b): y^2 = x^3 + ax + b (mod p)
     """
+
+    # wNAF window width and the scalar size from which it beats plain
+    # double-and-add once the precomputed table is amortized.
+    WNAF_WIDTH = 5
+    WNAF_MIN_BITS = 24
+
+    # Window width of the fixed-base tables used for generator points.
+    FIXED_BASE_WIDTH = 4
+
+    # Multi-scalar multiplication: wNAF width for Straus interleaving and
+    # the number of terms from which Pippenger's buckets take over.
+    STRAUS_WIDTH = 4
+    PIPPENGER_MIN_TERMS = 16
+
+    # group_order(): count directly up to this p, Mestre's BSGS up to
+    # MESTRE_MAX_BITS bits (2.5 s at 64 bits, 14 s at 72), then Schoof's
+    # traces mod small primes until the Hasse interval is cut into
+    # residue classes of about SCHOOF_CLASS_WIDTH candidates, and Mestre
+    # within the class. That takes 1 s at 72 bits, 3 s at 88, 7 s at 104,
+    # 13 s at 112 and 30 s at 120, so unknown curves above SCHOOF_MAX_BITS
+    # are refused; raise it for offline use.
+    POINT_COUNT_DIRECT_MAX_P = 2**10
+    MESTRE_MAX_BITS = 64
+    SCHOOF_CLASS_WIDTH = 2**32
+    SCHOOF_MAX_BITS = 112
+
+    # multiples(): independent chains advanced together, sharing one
+    # inversion per round.
+    BATCH_LANES = 128
+
+    # point_set() caches its result (in _POINT_SETS) up to this p.
+    POINT_SET_CACHE_MAX_P = 2**20
+
+    # discrete_log_rho(): partitions of the r-adding walk, and walks run
+    # side by side (one inversion per round) by the distinguished-point
+    # variant.
+    RHO_PARTITIONS = 20
+    RHO_LANES = 64
+
+    # discrete_log_pohlig_hellman(): prime subproblems up to this size use
+    # baby-step giant-step (a table of sqrt(q) points), larger ones rho.
+    PH_BSGS_MAX_Q = 2**32
+
+    # discrete_log_bsgs(): baby steps kept per table. Larger groups take
+    # more giant steps instead of more memory.
+    BSGS_MAX_TABLE = 2**20
+
+    # Discrete-log solvers given a progress callback call it about this
+    # often, measured in point additions.
+    PROGRESS_INTERVAL = 4096
     
     def __init__(self, a, b, p):
         """
@@ -29,45 +156,16 @@ class EllipticCurve:
         if not isinstance(a, int) or not isinstance(b, int) or not isinstance(p, int):
             raise ValueError("Parameters a, b, and p must be integers")
         
-        if p < 2:
-            raise ValueError("Modulus p must be at least 2")
-
-        # Ensure p is prime (field F_p requires prime modulus)
-        def _is_prime(n: int) -> bool:
-            # Quick checks for small numbers
-            if n < 2:
-                return False
-            small_primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37]
-            for sp in small_primes:
-                if n == sp:
-                    return True
-                if n % sp == 0:
-                    return False
-            # Miller-Rabin primality test (deterministic for 64-bit)
-            # write n-1 = d * 2^s with d odd
-            d = n - 1
-            s = 0
-            while d % 2 == 0:
-                d //= 2
-                s += 1
-
-            def _check(a: int, d: int, n: int, s: int) -> bool:
-                x = pow(a, d, n)
-                if x == 1 or x == n - 1:
-                    return True
-                for _ in range(s - 1):
-                    x = (x * x) % n
-                    if x == n - 1:
-                        return True
-                return False
-
-            # Deterministic bases for n < 2^64
-            for a in (2, 3, 5, 7, 11, 13, 17):
-                if not _check(a % n, d, n, s):
-                    return False
-            return True
-
-        if not _is_prime(p):
+        # y^2 = x^3 + ax + b only describes every curve (and the addition
+        # formulas only hold) in characteristic other than 2 and 3.
+        if p < 5:
+            raise ValueError("Modulus p must be at least 5")
+
+        # Ensure p is prime (field F_p requires prime modulus). The verdict
+        # and square-root constants are cached per p and shared by every
+        # curve over the same field.
+        self.field = get_prime_field(p)
+        if not self.field.is_prime:
             raise ValueError("Modulus p must be prime for F_p operations")
         
         self.a = a % p
@@ -78,6 +176,24 @@ class EllipticCurve:
         discriminant = (4 * self.a**3 + 27 * self.b**2) % p
         if discriminant == 0:
             raise ValueError("Invalid curve: discriminant is zero")
+
+        # Curves are shared between requests by get_curve(), so the
+        # parameters are frozen; derived data lives in the module-level
+        # caches keyed by (a, b, p).
+        self._frozen = True
+
+    def __reduce__(self):
+        # Curves travel to worker processes as registry lookups, leaving
+        # the per-instance caches behind.
+        return (get_curve, (self.a, self.b, self.p))
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise AttributeError("EllipticCurve instances are immutable")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError("EllipticCurve instances are immutable")
     
     def is_point_on_curve(self, x, y):
         """
@@ -104,85 +220,91 @@ class EllipticCurve:
         """
         Find square roots of n modulo p using Tonelli-Shanks algorithm
 
+        The decomposition p - 1 = Q * 2^S, the non-residue z and the
+        p mod 4 / p mod 8 fast-path choice come from the shared PrimeField.
+
         Args:
             n: Number to find square root of (mod p)
 
         Returns:
             list: All square roots (empty if none exist, 2 roots or 1 if n=0)
         """
-        n = n % self.p
-        
-        if n == 0:
-            return [0]
-        
-        # Check if n is a quadratic residue using Legendre symbol
-        if pow(n, (self.p - 1) // 2, self.p) != 1:
-            return []
-        
-        # Special case: p ≡ 3 (mod 4)
-        if self.p % 4 == 3:
-            r = pow(n, (self.p + 1) // 4, self.p)
-            return [r, self.p - r] if r != self.p - r else [r]
-        
-        # General Tonelli-Shanks algorithm
-        # Write p - 1 = Q * 2^S with Q odd
-        Q = self.p - 1
-        S = 0
-        while Q % 2 == 0:
-            Q //= 2
-            S += 1
-        
-        # Find a quadratic non-residue z
-        z = 2
-        while pow(z, (self.p - 1) // 2, self.p) != self.p - 1:
-            z += 1
-        
-        M = S
-        c = pow(z, Q, self.p)
-        t = pow(n, Q, self.p)
-        R = pow(n, (Q + 1) // 2, self.p)
-        
-        while True:
-            if t == 0:
-                return [0]
-            if t == 1:
-                return [R, self.p - R] if R != self.p - R else [R]
-            
-            # Find lowest i such that t^(2^i) = 1
-            i = 1
-            temp = (t * t) % self.p
-            while temp != 1 and i < M:
-                temp = (temp * temp) % self.p
-                i += 1
-            
-            b = pow(c, 1 << (M - i - 1), self.p)
-            M = i
-            c = (b * b) % self.p
-            t = (t * c) % self.p
-            R = (R * b) % self.p
+        return self.field.sqrt(n)
     
     def find_all_points(self):
         """
         Find all points on the elliptic curve E_p(a, b)
-        Uses Tonelli-Shanks for efficient square root computation
+
+        Small and medium p (up to SQRT_TABLE_MAX_P) look every x up in a
+        square-root table shared by all curves over F_p. Larger p use
+        Tonelli-Shanks, batched over every x with NumPy when it is
+        installed and p fits in int64 arithmetic
         
         Returns:
             list: List of tuples (x, y) representing all points on the curve,
                   including (None, None) for point at infinity
         """
-        points = [(None, None)]  # Point at infinity
-        
-        for x in range(self.p):
-            # Calculate y^2 = x^3 + ax + b (mod p)
-            y_squared = (x**3 + self.a * x + self.b) % self.p
-            
-            # Find all y values where y^2 = y_squared (mod p)
-            y_values = self.tonelli_shanks(y_squared)
-            for y in y_values:
-                points.append((x, y))
-        
+        return list(self.point_set())
+
+    def point_set(self):
+        """
+        All points on the curve as a compact PointSet
+
+        Same points and order as find_all_points, stored in typed arrays.
+        For p up to POINT_SET_CACHE_MAX_P the set is cached per curve (within
+        the _POINT_SETS total), so repeated requests enumerate once.
+
+        Returns:
+            PointSet: The point at infinity followed by the finite points
+        """
+        key = (self.a, self.b, self.p)
+        points = _POINT_SETS.get(key)
+        if points is None:
+            if sqrt_table_available(self.p):
+                table = sqrt_table(self.p, self.field.sqrt)
+                points = enumerate_points_table(self.a, self.b, self.p, table)
+            elif numpy_available(self.p):
+                points = enumerate_points_numpy(self.a, self.b, self.p)
+            else:
+                points = PointSet.from_points(itertools.chain([(None, None)], self.iter_points()))
+            if self.p <= self.POINT_SET_CACHE_MAX_P:
+                _POINT_SETS.put(key, points)
         return points
-    
+
+    def iter_points(self, x_start=0, x_stop=None):
+        """
+        Lazily yield the affine points with x in [x_start, x_stop)
+
+        Produces the same points, in the same order, as the matching slice
+        of find_all_points, but only evaluates the requested x values and
+        never holds more than one x worth of points. The point at infinity
+        has no x-coordinate and is not yielded.
+
+        Args:
+            x_start: First x-coordinate (clamped to 0)
+            x_stop: End of the x range, exclusive (clamped to p; None for p)
+
+        Yields:
+            tuple: Points (x, y)
+        """
+        p = self.p
+        x_start = max(0, x_start)
+        x_stop = p if x_stop is None else min(p, x_stop)
+
+        # Reuse a square-root table if another request already built one
+        # for this p; a short range is not worth building it for.
+        table = cached_sqrt_table(p)
+        sqrt = self.field.sqrt
+        for x in range(x_start, x_stop):
+            y_squared = (x * x * x + self.a * x + self.b) % p
+            if table is not None:
+                r = table[y_squared]
+                y_values = () if r < 0 else (r,) if r == 0 else (r, p - r)
+            else:
+                y_values = sqrt(y_squared)
+            for y in y_values:
+                yield (x, y)
+
     def mod_inverse(self, a):
         """
         Calculate modular multiplicative inverse using Extended Euclidean Algorithm
@@ -213,13 +335,36 @@ class EllipticCurve:
             raise ValueError(f"Modular inverse does not exist for {a} mod {self.p}")
         return (x % self.p + self.p) % self.p
     
-    def add_points(self, P, Q):
+    def validate_point(self, P):
+        """
+        Check that P is a well-formed point on the curve
+
+        Route handlers call this once at the API boundary; everything
+        derived from a validated point can then use the trusted
+        (validate=False) arithmetic paths.
+
+        Args:
+            P: Tuple (x, y) or (None, None) for point at infinity
+
+        Raises:
+            ValueError: If P is malformed or not on the curve
+        """
+        if P == (None, None):
+            return
+        if P[0] is None or P[1] is None:
+            raise ValueError("Invalid point coordinates")
+        if not self.is_point_on_curve(P[0], P[1]):
+            raise ValueError(f"Point P{tuple(P)} is not on the curve")
+
+    def add_points(self, P, Q, validate=True):
         """
         Add two points P and Q on the elliptic curve
         
         Args:
             P: Tuple (x, y) or (None, None) for point at infinity
             Q: Tuple (x, y) or (None, None) for point at infinity
+            validate: Check both inputs are on the curve; pass False only
+                      for points already known to be valid
             
         Returns:
             tuple: Point P + Q
@@ -227,99 +372,680 @@ class EllipticCurve:
         Raises:
             ValueError: If points are not on the curve
         """
+        if validate:
+            if P != (None, None) and Q != (None, None):
+                x1, y1 = P
+                x2, y2 = Q
+
+                # Validate that x, y are not None when not point at infinity
+                if x1 is None or y1 is None or x2 is None or y2 is None:
+                    raise ValueError("Invalid point coordinates")
+
+                # Verify points are on curve
+                if not self.is_point_on_curve(x1, y1):
+                    raise ValueError(f"Point P({x1}, {y1}) is not on the curve")
+                if not self.is_point_on_curve(x2, y2):
+                    raise ValueError(f"Point Q({x2}, {y2}) is not on the curve")
+
+        return self._add(P, Q)
+
+    def _add(self, P, Q):
+        """Unchecked affine addition for points already known to be on the curve."""
         # Handle point at infinity
         if P == (None, None):
             return Q
         if Q == (None, None):
             return P
-        
+
         x1, y1 = P
         x2, y2 = Q
-        
-        # Validate that x, y are not None when not point at infinity
-        if x1 is None or y1 is None or x2 is None or y2 is None:
-            raise ValueError("Invalid point coordinates")
-        
-        # Verify points are on curve
-        if not self.is_point_on_curve(x1, y1):
-            raise ValueError(f"Point P({x1}, {y1}) is not on the curve")
-        if not self.is_point_on_curve(x2, y2):
-            raise ValueError(f"Point Q({x2}, {y2}) is not on the curve")
-        
-        # Handle point doubling (P = Q)
-        if x1 == x2:
-            if y1 == y2:
-                # Point doubling: P + P
-                if y1 == 0:
-                    return (None, None)  # Result is point at infinity
-                
-                # slope = (3x1^2 + a) / (2y1) mod p
-                numerator = (3 * x1**2 + self.a) % self.p
-                denominator = (2 * y1) % self.p
-                slope = (numerator * self.mod_inverse(denominator)) % self.p
-            else:
-                # P + (-P) = O (point at infinity)
-                return (None, None)
-        else:
-            # Point addition: P != Q
-            # slope = (y2 - y1) / (x2 - x1) mod p
-            numerator = (y2 - y1) % self.p
-            denominator = (x2 - x1) % self.p
-            slope = (numerator * self.mod_inverse(denominator)) % self.p
-        
+        p = self.p
+
+        if (x1 - x2) % p == 0:
+            if (y1 - y2) % p == 0:
+                return self._double(P)
+            # P + (-P) = O (point at infinity)
+            return (None, None)
+
+        # Point addition: P != Q
+        # slope = (y2 - y1) / (x2 - x1) mod p
+        slope = ((y2 - y1) * self.mod_inverse((x2 - x1) % p)) % p
+
         # Calculate resulting point
-        x3 = (slope**2 - x1 - x2) % self.p
-        y3 = (slope * (x1 - x3) - y1) % self.p
-        
+        x3 = (slope * slope - x1 - x2) % p
+        y3 = (slope * (x1 - x3) - y1) % p
         return (x3, y3)
-    
-    def scalar_multiply(self, k, P):
+
+    def _double(self, P):
+        """Unchecked affine doubling for a point already known to be on the curve."""
+        if P == (None, None):
+            return P
+
+        x1, y1 = P
+        p = self.p
+        if y1 % p == 0:
+            return (None, None)  # Result is point at infinity
+
+        # slope = (3x1^2 + a) / (2y1) mod p
+        slope = ((3 * x1 * x1 + self.a) * self.mod_inverse((2 * y1) % p)) % p
+
+        x3 = (slope * slope - 2 * x1) % p
+        y3 = (slope * (x1 - x3) - y1) % p
+        return (x3, y3)
+
+    # ------------------------------------------------------------------
+    # Batched affine arithmetic
+    #
+    # Montgomery's simultaneous inversion turns n inversions into one
+    # inversion and 3(n - 1) multiplications, so many independent affine
+    # additions cost little more than their field multiplications.
+    # ------------------------------------------------------------------
+
+    def _batch_inverse(self, values):
+        """Inverses of non-zero residues mod p with a single mod_inverse."""
+        p = self.p
+        prefix = []
+        acc = 1
+        for v in values:
+            prefix.append(acc)
+            acc = acc * v % p
+        inv = self.mod_inverse(acc) if values else 1
+        result = [0] * len(values)
+        for i in range(len(values) - 1, -1, -1):
+            result[i] = prefix[i] * inv % p
+            inv = inv * values[i] % p
+        return result
+
+    def batch_add(self, pairs):
         """
-        Multiply point P by scalar k using double-and-add algorithm
-        
+        Add many independent pairs of points with one modular inversion
+
+        Args:
+            pairs: Iterable of (P, Q) with both points on the curve and
+                   reduced mod p; P == Q is doubled
+
+        Returns:
+            list: P + Q for each pair, in order
+        """
+        pairs = list(pairs)
+        p = self.p
+        results = [None] * len(pairs)
+        pending, slopes_num, slopes_den = [], [], []
+
+        for i, (P, Q) in enumerate(pairs):
+            if P == (None, None):
+                results[i] = Q
+                continue
+            if Q == (None, None):
+                results[i] = P
+                continue
+            (x1, y1), (x2, y2) = P, Q
+            if (x1 - x2) % p:
+                slopes_num.append(y2 - y1)
+                slopes_den.append((x2 - x1) % p)
+            elif (y1 + y2) % p == 0:
+                results[i] = (None, None)  # Q = -P, including 2-torsion doubling
+                continue
+            else:
+                slopes_num.append(3 * x1 * x1 + self.a)
+                slopes_den.append(2 * y1 % p)
+            pending.append(i)
+
+        for i, num, inv in zip(pending, slopes_num, self._batch_inverse(slopes_den)):
+            (x1, y1), (x2, _) = pairs[i]
+            slope = num * inv % p
+            x3 = (slope * slope - x1 - x2) % p
+            results[i] = (x3, (slope * (x1 - x3) - y1) % p)
+        return results
+
+    def iter_multiples(self, P):
+        """
+        Lazily yield the affine multiples P, 2P, 3P, ...
+
+        Runs up to BATCH_LANES chains side by side: once L consecutive
+        multiples are known, adding L*P to each of them yields the next L
+        in one batch_add, so n multiples cost about n / BATCH_LANES
+        inversions instead of n. The lane count doubles from 1, so short
+        prefixes stay cheap.
+
+        Args:
+            P: Point on the curve, reduced mod p
+
+        Yields:
+            tuple: jP for j = 1, 2, ... (the point at infinity where jP = O)
+        """
+        window, step = [P], P
+        yield P
+        while True:
+            block = self.batch_add((Q, step) for Q in window)
+            yield from block
+            if len(window) < self.BATCH_LANES:
+                window += block
+                step = window[-1]  # len(window) * P
+            else:
+                window = block
+
+    def multiples(self, P, count):
+        """
+        The affine multiples [P, 2P, ..., count * P], batched
+
+        Args:
+            P: Point on the curve, reduced mod p
+            count: Number of multiples to return
+
+        Returns:
+            list: jP for j = 1..count (the point at infinity where jP = O)
+        """
+        return list(itertools.islice(self.iter_multiples(P), max(count, 0)))
+
+    # ------------------------------------------------------------------
+    # Jacobian coordinate arithmetic
+    #
+    # A Jacobian triple (X, Y, Z) represents the affine point (X/Z^2, Y/Z^3);
+    # Z == 0 encodes the point at infinity. Chains of additions and
+    # doublings stay in this form so that only the final conversion back
+    # to affine coordinates needs a modular inversion.
+    # ------------------------------------------------------------------
+
+    JACOBIAN_INFINITY = (1, 1, 0)
+
+    def _to_jacobian(self, P):
+        """Lift an affine point (x, y) or (None, None) to Jacobian coordinates."""
+        if P == (None, None):
+            return self.JACOBIAN_INFINITY
+        return (P[0] % self.p, P[1] % self.p, 1)
+
+    def _from_jacobian(self, J):
+        """Convert a Jacobian triple back to an affine point (one inversion)."""
+        X, Y, Z = J
+        if Z == 0:
+            return (None, None)
+        p = self.p
+        z_inv = self.mod_inverse(Z)
+        z_inv2 = (z_inv * z_inv) % p
+        return ((X * z_inv2) % p, (Y * z_inv2 * z_inv) % p)
+
+    def _jacobian_double(self, J):
+        """Return 2J for a Jacobian point J (no inversion)."""
+        X1, Y1, Z1 = J
+        if Z1 == 0 or Y1 == 0:
+            return self.JACOBIAN_INFINITY
+        p = self.p
+        YY = (Y1 * Y1) % p
+        S = (4 * X1 * YY) % p
+        ZZ = (Z1 * Z1) % p
+        M = (3 * X1 * X1 + self.a * ZZ * ZZ) % p
+        X3 = (M * M - 2 * S) % p
+        Y3 = (M * (S - X3) - 8 * YY * YY) % p
+        Z3 = (2 * Y1 * Z1) % p
+        return (X3, Y3, Z3)
+
+    def _jacobian_add(self, J1, J2):
+        """Return J1 + J2 for two Jacobian points (no inversion)."""
+        X1, Y1, Z1 = J1
+        X2, Y2, Z2 = J2
+        if Z1 == 0:
+            return J2
+        if Z2 == 0:
+            return J1
+        p = self.p
+        Z1Z1 = (Z1 * Z1) % p
+        Z2Z2 = (Z2 * Z2) % p
+        U1 = (X1 * Z2Z2) % p
+        U2 = (X2 * Z1Z1) % p
+        S1 = (Y1 * Z2 * Z2Z2) % p
+        S2 = (Y2 * Z1 * Z1Z1) % p
+        H = (U2 - U1) % p
+        R = (S2 - S1) % p
+        if H == 0:
+            if R == 0:
+                return self._jacobian_double(J1)
+            return self.JACOBIAN_INFINITY
+        HH = (H * H) % p
+        HHH = (H * HH) % p
+        V = (U1 * HH) % p
+        X3 = (R * R - HHH - 2 * V) % p
+        Y3 = (R * (V - X3) - S1 * HHH) % p
+        Z3 = (Z1 * Z2 * H) % p
+        return (X3, Y3, Z3)
+
+    def _jacobian_add_affine(self, J, P):
+        """
+        Mixed addition J + P where P is an affine point (Z = 1).
+
+        Cheaper than the general Jacobian addition and the common case in
+        double-and-add, where the addend is the original affine input.
+        """
+        if P == (None, None):
+            return J
+        X1, Y1, Z1 = J
+        if Z1 == 0:
+            return self._to_jacobian(P)
+        p = self.p
+        x2, y2 = P
+        Z1Z1 = (Z1 * Z1) % p
+        U2 = (x2 * Z1Z1) % p
+        S2 = (y2 * Z1 * Z1Z1) % p
+        H = (U2 - X1) % p
+        R = (S2 - Y1) % p
+        if H == 0:
+            if R == 0:
+                return self._jacobian_double(J)
+            return self.JACOBIAN_INFINITY
+        HH = (H * H) % p
+        HHH = (H * HH) % p
+        V = (X1 * HH) % p
+        X3 = (R * R - HHH - 2 * V) % p
+        Y3 = (R * (V - X3) - Y1 * HHH) % p
+        Z3 = (Z1 * H) % p
+        return (X3, Y3, Z3)
+
+    def scalar_multiply(self, k, P, validate=True, method='auto', secret=False):
+        """
+        Multiply point P by scalar k
+
+        All methods run in Jacobian coordinates, so the whole computation
+        costs a single modular inversion when converting the result back.
+
         Args:
             k: Scalar multiplier (integer)
             P: Point to multiply (tuple)
+            validate: Check P is on the curve; pass False only for points
+                      already known to be valid
+            method: 'binary' (double-and-add), 'wnaf' (width-w NAF with a
+                    cached odd-multiple table for P), 'fixed_base' (one
+                    addition per w-bit window from a cached table of P's
+                    window multiples, read with a full-row masked scan;
+                    meant for generators reused across requests), 'ladder'
+                    (Montgomery ladder: one addition and one doubling per
+                    bit, whatever the bit), 'xladder' (x-only Montgomery
+                    ladder with y recovered at the end) or 'auto' to pick
+                    wNAF for scalars of WNAF_MIN_BITS bits or more
+            secret: k is a private key or nonce; 'auto' then picks the
+                    x-only ladder so the operation sequence does not depend
+                    on the bits of k
             
         Returns:
             tuple: Point k*P
             
         Raises:
-            ValueError: If point is not on curve
+            ValueError: If point is not on curve or method is unknown
             TypeError: If k is not an integer
         """
         if not isinstance(k, int):
             raise TypeError("Scalar k must be an integer")
         
+        if validate:
+            self.validate_point(P)
+
         if P == (None, None):
             return (None, None)
         
-        if P[0] is None or P[1] is None:
-            raise ValueError("Invalid point coordinates")
-        
-        if not self.is_point_on_curve(P[0], P[1]):
-            raise ValueError(f"Point P{P} is not on the curve")
-        
         if k == 0:
             return (None, None)  # Point at infinity
         
-        if k < 0:
-            # Negate the point for negative scalars
-            k = -k
-            P = (P[0], (-P[1]) % self.p)
-        
-        # Double-and-add algorithm (efficient O(log k))
-        result = (None, None)  # Start with point at infinity
-        addend = P
-        
-        while k:
-            if k & 1:  # If bit is 1, add current point
-                result = self.add_points(result, addend)
-            addend = self.add_points(addend, addend)  # Double the point
-            k >>= 1  # Shift to next bit
-        
+        # Multiply by |k| and negate the result for negative scalars, so
+        # both signs share the same cached table for P.
+        negative = k < 0
+        k = abs(k)
+        P = (P[0] % self.p, P[1] % self.p)
+
+        if method == 'auto':
+            if secret:
+                method = 'xladder'
+            else:
+                method = 'wnaf' if k.bit_length() >= self.WNAF_MIN_BITS else 'binary'
+
+        if method == 'fixed_base' and k.bit_length() > self._fixed_base_bits():
+            # Scalar is wider than the table covers (k >> #E); fall back.
+            method = 'xladder' if secret else 'wnaf'
+
+        if method == 'binary':
+            result = self._multiply_binary(k, P)
+        elif method == 'wnaf':
+            result = self._multiply_wnaf(k, P)
+        elif method == 'fixed_base':
+            result = self._multiply_fixed_base(k, P)
+        elif method == 'ladder':
+            result = self._multiply_ladder(k, P)
+        elif method == 'xladder':
+            result = self._multiply_xladder(k, P)
+        else:
+            raise ValueError(f"Unknown scalar multiplication method: {method}")
+
+        result = self._from_jacobian(result)
+        if negative and result != (None, None):
+            result = (result[0], (-result[1]) % self.p)
         return result
-    
+
+    def _multiply_binary(self, k, P):
+        """Left-to-right double-and-add for k > 0; returns a Jacobian point."""
+        # The addend is always the affine input, so every addition is a
+        # mixed addition.
+        result = self._to_jacobian(P)
+        for bit in bin(k)[3:]:
+            result = self._jacobian_double(result)
+            if bit == '1':
+                result = self._jacobian_add_affine(result, P)
+        return result
+
+    # ------------------------------------------------------------------
+    # Montgomery ladders
+    #
+    # Every bit costs exactly one addition and one doubling, and the bit
+    # only steers a conditional swap done with masks, so the sequence of
+    # field operations is the same for every scalar of a given length.
+    # Ladders run over max(k.bit_length(), p.bit_length() + 1) bits, which
+    # covers any scalar below the group order. (CPython big-integer
+    # arithmetic is not constant-time itself; the ladder removes the
+    # key-dependent branching and operation counts.)
+    # ------------------------------------------------------------------
+
+    def _ladder_bits(self, k):
+        return max(k.bit_length(), self.p.bit_length() + 1)
+
+    @staticmethod
+    def _cswap(A, B, bit):
+        """Swap tuples A and B when bit is 1, without branching on bit."""
+        mask = -bit
+        A2, B2 = [], []
+        for u, v in zip(A, B):
+            t = mask & (u ^ v)
+            A2.append(u ^ t)
+            B2.append(v ^ t)
+        return tuple(A2), tuple(B2)
+
+    def _multiply_ladder(self, k, P):
+        """Montgomery ladder in Jacobian coordinates; returns a Jacobian point."""
+        R0 = self.JACOBIAN_INFINITY
+        R1 = self._to_jacobian(P)
+        swapped = 0
+        for i in range(self._ladder_bits(k) - 1, -1, -1):
+            # Swap, step, swap back -- with consecutive swaps merged.
+            bit = (k >> i) & 1
+            R0, R1 = self._cswap(R0, R1, bit ^ swapped)
+            swapped = bit
+            R1 = self._jacobian_add(R0, R1)
+            R0 = self._jacobian_double(R0)
+        R0, R1 = self._cswap(R0, R1, swapped)
+        return R0
+
+    def _multiply_xladder(self, k, P):
+        """
+        x-only Montgomery ladder (Brier-Joye formulas); returns a Jacobian point
+
+        Tracks (X : Z) for kP and (k+1)P, whose difference is always P, so
+        each step is one differential addition and one doubling with no
+        y-coordinates at all. y(kP) is recovered at the end from x(P),
+        y(P), x(kP) and x((k+1)P) (Okeya-Sakurai), sharing one inversion.
+        Points with x = 0 or y = 0, which the formulas cannot use as a
+        difference, take the Jacobian ladder instead.
+        """
+        p, a, b = self.p, self.a, self.b
+        x, y = P
+        if x == 0 or y == 0:
+            return self._multiply_ladder(k, P)
+
+        b4 = 4 * b % p
+        b8 = 2 * b4
+        X0, Z0 = 1, 0  # point at infinity
+        X1, Z1 = x, 1
+        swapped = 0
+        for i in range(self._ladder_bits(k) - 1, -1, -1):
+            # Swap only when the bit differs from the previous one; the
+            # masked swap is inlined as it runs on every bit.
+            bit = (k >> i) & 1
+            mask = -(bit ^ swapped)
+            swapped = bit
+            t = mask & (X0 ^ X1)
+            X0 ^= t
+            X1 ^= t
+            t = mask & (Z0 ^ Z1)
+            Z0 ^= t
+            Z1 ^= t
+
+            # (X1 : Z1) <- R0 + R1, difference P
+            ZZ = Z0 * Z1 % p
+            cross = X0 * Z1 % p
+            other = X1 * Z0 % p
+            t = (X0 * X1 - a * ZZ) % p
+            d = cross - other
+            X1 = (t * t - b4 * ZZ * (cross + other)) % p
+            Z1 = x * (d * d % p) % p
+
+            # (X0 : Z0) <- 2 R0
+            XX = X0 * X0 % p
+            ZZ = Z0 * Z0 % p
+            t = XX - a * ZZ
+            X0, Z0 = ((t * t - b8 * (X0 * Z0 % p) * ZZ) % p,
+                      4 * Z0 * ((XX + a * ZZ) * X0 + b * Z0 * ZZ) % p)
+
+        mask = -swapped
+        t = mask & (X0 ^ X1)
+        X0 ^= t
+        X1 ^= t
+        t = mask & (Z0 ^ Z1)
+        Z0 ^= t
+        Z1 ^= t
+
+        if Z0 == 0:
+            return self.JACOBIAN_INFINITY
+        if Z1 == 0:
+            return (x, (-y) % p, 1)  # (k+1)P = O, so kP = -P
+
+        inv = self.mod_inverse(Z0 * Z1 % p * (2 * y) % p)
+        x0 = X0 * Z1 % p * (2 * y) % p * inv % p
+        x1 = X1 * Z0 % p * (2 * y) % p * inv % p
+        y0 = (2 * b + (a + x * x0) * (x + x0) - x1 * (x - x0) ** 2) * Z0 % p * Z1 % p * inv % p
+        if (y0 * y0 - (x0 * x0 * x0 + a * x0 + b)) % p:
+            return self._multiply_ladder(k, P)  # degenerate (small-order) input
+        return (x0, y0, 1)
+
+    def _wnaf_table(self, P, w):
+        """
+        Odd multiples [P, 3P, 5P, ..., (2^(w-1) - 1)P] in affine form
+
+        Tables are cached per (curve, point, width) in a bounded LRU, so
+        repeated multiplications of the same base point skip rebuilding it.
+        """
+        def build():
+            table = [P]
+            twice = self._double(P)
+            for _ in range((1 << (w - 2)) - 1):
+                table.append(self._add(table[-1], twice))
+            return table
+
+        return _WNAF_TABLES.get_or_create((self.a, self.b, self.p, P, w), build)
+
+    def _multiply_wnaf(self, k, P, w=None):
+        """Width-w NAF scalar multiplication for k > 0; returns a Jacobian point."""
+        w = w or self.WNAF_WIDTH
+        table = self._wnaf_table(P, w)
+        result = self.JACOBIAN_INFINITY
+        for d in reversed(_wnaf_digits(k, w)):
+            result = self._jacobian_double(result)
+            if d:
+                result = self._add_wnaf_digit(result, table, d)
+        return result
+
+    def _add_wnaf_digit(self, J, table, d):
+        """Add d*P to Jacobian J for a non-zero odd wNAF digit d and P's odd-multiple table."""
+        if d > 0:
+            return self._jacobian_add_affine(J, table[d >> 1])
+        Q = table[(-d) >> 1]
+        if Q == (None, None):
+            return J
+        return self._jacobian_add_affine(J, (Q[0], (-Q[1]) % self.p))
+
+    def _fixed_base_bits(self):
+        """Scalar width covered by fixed-base tables (any k up to #E <= 2p)."""
+        return self.p.bit_length() + 1
+
+    def _fixed_base_table(self, P):
+        """
+        Window multiples of a fixed base point, built once per (curve, point)
+
+        Row i holds [1, 2, ..., 2^w - 1] * 2^(w*i) * P as Jacobian triples
+        (Z = 1, or the point at infinity on small-order bases), so a
+        multiplication takes one entry per w-bit window of the scalar and
+        needs no doublings at all. The returned offset, 2^(w*rows) * P, is
+        the accumulator's starting value.
+        """
+        w = self.FIXED_BASE_WIDTH
+
+        def build():
+            rows = []
+            base = P
+            for _ in range(-(-self._fixed_base_bits() // w)):
+                row = self.multiples(base, 1 << w)
+                base = row.pop()  # 2^w * base
+                rows.append([self._to_jacobian(Q) for Q in row])
+            return rows, self._to_jacobian(base)
+
+        return _FIXED_BASE_TABLES.get_or_create((self.a, self.b, self.p, P, w), build)
+
+    def _multiply_fixed_base(self, k, P):
+        """
+        Fixed-base multiplication for k > 0; returns a Jacobian point
+
+        Every window costs the same work whatever its digit: the whole row
+        is scanned and the entry picked with masks, one addition is always
+        made, and a zero digit discards the sum with a masked select rather
+        than a branch. The accumulator starts at a fixed offset, subtracted
+        at the end, so it does not sit at infinity until the first non-zero
+        window.
+        """
+        w = self.FIXED_BASE_WIDTH
+        rows, offset = self._fixed_base_table(P)
+        result = offset
+        for row in rows:
+            digit = k & ((1 << w) - 1)
+            k >>= w
+            zero = -((digit - 1) >> w)  # 1 when digit == 0, else 0
+            index = digit | zero  # zero digits read entry 1 as a dummy
+            X = Y = Z = 0
+            for j, (Xj, Yj, Zj) in enumerate(row, 1):
+                mask = ((index ^ j) - 1) >> w  # -1 when j == index, else 0
+                X |= mask & Xj
+                Y |= mask & Yj
+                Z |= mask & Zj
+            total = self._jacobian_add(result, (X, Y, Z))
+            result, _ = self._cswap(total, result, zero)
+        X, Y, Z = offset
+        return self._jacobian_add(result, (X, (-Y) % self.p, Z))
+
+    def multi_scalar_multiply(self, terms, validate=True, method='auto'):
+        """
+        Compute the linear combination k1*P1 + k2*P2 + ... + kn*Pn
+
+        Evaluates the whole sum in one pass, sharing the doublings between
+        all terms, which is much cheaper than n separate scalar_multiply
+        calls followed by n - 1 additions.
+
+        Args:
+            terms: Iterable of (k, P) pairs with integer scalars and points
+            validate: Check every P is on the curve; pass False only for
+                      points already known to be valid
+            method: 'shamir' (simultaneous double-and-add, exactly two
+                    terms), 'straus' (interleaved wNAF), 'pippenger' (bucket
+                    accumulation) or 'auto' to pick Shamir for two terms,
+                    Straus for a few and Pippenger from PIPPENGER_MIN_TERMS
+
+        Returns:
+            tuple: Point sum(k_i * P_i)
+
+        Raises:
+            ValueError: If a point is not on the curve or method is unknown
+            TypeError: If a scalar is not an integer
+        """
+        pairs = []
+        for k, P in terms:
+            if not isinstance(k, int):
+                raise TypeError("Scalar k must be an integer")
+            if validate:
+                self.validate_point(P)
+            if k == 0 or P == (None, None):
+                continue
+            P = (P[0] % self.p, P[1] % self.p)
+            if k < 0:
+                # Fold the sign into the point so every scalar is positive.
+                k, P = -k, (P[0], (-P[1]) % self.p)
+            pairs.append((k, P))
+
+        if not pairs:
+            return (None, None)
+        if len(pairs) == 1:
+            return self.scalar_multiply(pairs[0][0], pairs[0][1], validate=False)
+
+        if method == 'auto':
+            if len(pairs) == 2:
+                method = 'shamir'
+            elif len(pairs) < self.PIPPENGER_MIN_TERMS:
+                method = 'straus'
+            else:
+                method = 'pippenger'
+
+        if method == 'shamir':
+            if len(pairs) != 2:
+                raise ValueError("Shamir's trick combines exactly two terms")
+            result = self._multi_shamir(pairs)
+        elif method == 'straus':
+            result = self._multi_straus(pairs)
+        elif method == 'pippenger':
+            result = self._multi_pippenger(pairs)
+        else:
+            raise ValueError(f"Unknown multi-scalar multiplication method: {method}")
+
+        return self._from_jacobian(result)
+
+    def _multi_shamir(self, pairs):
+        """Shamir's trick for k1*P + k2*Q with k1, k2 > 0; returns a Jacobian point."""
+        (k1, P), (k2, Q) = pairs
+        # Indexed by (bit of k2, bit of k1); P + Q may be the point at infinity.
+        table = [None, P, Q, self._add(P, Q)]
+        result = self.JACOBIAN_INFINITY
+        for i in range(max(k1.bit_length(), k2.bit_length()) - 1, -1, -1):
+            result = self._jacobian_double(result)
+            idx = ((k1 >> i) & 1) | (((k2 >> i) & 1) << 1)
+            if idx:
+                result = self._jacobian_add_affine(result, table[idx])
+        return result
+
+    def _multi_straus(self, pairs):
+        """Straus interleaved wNAF for positive scalars; returns a Jacobian point."""
+        w = self.STRAUS_WIDTH
+        expansions = [(_wnaf_digits(k, w), self._wnaf_table(P, w)) for k, P in pairs]
+        result = self.JACOBIAN_INFINITY
+        for i in range(max(len(digits) for digits, _ in expansions) - 1, -1, -1):
+            result = self._jacobian_double(result)
+            for digits, table in expansions:
+                if i < len(digits) and digits[i]:
+                    result = self._add_wnaf_digit(result, table, digits[i])
+        return result
+
+    def _multi_pippenger(self, pairs):
+        """Pippenger bucket method for positive scalars; returns a Jacobian point."""
+        # Window width grows with log2(n) so bucket sums stay amortized.
+        c = max(2, len(pairs).bit_length() - 2)
+        mask = (1 << c) - 1
+        bits = max(k.bit_length() for k, _ in pairs)
+        result = self.JACOBIAN_INFINITY
+        for shift in range(((bits + c - 1) // c - 1) * c, -1, -c):
+            for _ in range(c):
+                result = self._jacobian_double(result)
+            buckets = [self.JACOBIAN_INFINITY] * mask
+            for k, P in pairs:
+                digit = (k >> shift) & mask
+                if digit:
+                    buckets[digit - 1] = self._jacobian_add_affine(buckets[digit - 1], P)
+            # sum(d * bucket_d) via running suffix sums: 2 additions per bucket.
+            running = window = self.JACOBIAN_INFINITY
+            for bucket in reversed(buckets):
+                running = self._jacobian_add(running, bucket)
+                window = self._jacobian_add(window, running)
+            result = self._jacobian_add(result, window)
+        return result
+
     def __str__(self):
         """String representation of the curve"""
         return f"E_{self.p}({self.a}, {self.b}): y^2 = x^3 + {self.a}x + {self.b} (mod {self.p})"
@@ -328,48 +1054,149 @@ class EllipticCurve:
         """Developer-friendly representation"""
         return f"EllipticCurve(a={self.a}, b={self.b}, p={self.p})"
 
-    def get_order(self, P):
+    def group_order(self):
+        """
+        Number of points #E(F_p), including the point at infinity
+
+        Computed without enumerating the curve for anything but tiny p:
+        Mestre's baby-step giant-step in the Hasse interval (O(p^(1/4))
+        group operations) up to MESTRE_MAX_BITS; above, up to
+        SCHOOF_MAX_BITS, Schoof's algorithm finds the trace modulo a few
+        small primes and Mestre only searches the matching residue class.
+        Results are cached per curve across instances.
+
+        Returns:
+            int: Group order, equal to len(find_all_points())
+
+        Raises:
+            ValueError: If p is beyond SCHOOF_MAX_BITS and the order is not
+                        already known
+        """
+        key = (self.a, self.b, self.p)
+
+        def compute():
+            if key in KNOWN_ORDERS:
+                return KNOWN_ORDERS[key]
+            if self.p <= self.POINT_COUNT_DIRECT_MAX_P:
+                return len(self.point_set())
+            if self.p.bit_length() <= self.MESTRE_MAX_BITS:
+                return mestre_order(self, self._quadratic_twist())
+            if self.p.bit_length() > self.SCHOOF_MAX_BITS:
+                raise ValueError(
+                    f"Counting points on a {self.p.bit_length()}-bit curve is too slow here "
+                    f"(limit {self.SCHOOF_MAX_BITS} bits unless the curve is a known standard one)")
+            lo, hi = hasse_interval(self.p)
+            t, modulus = schoof_trace(self.a, self.b, self.p, (hi - lo) // self.SCHOOF_CLASS_WIDTH)
+            return mestre_order(self, self._quadratic_twist(),
+                                residue=(self.p + 1 - t) % modulus, modulus=modulus)
+
+        return _GROUP_ORDERS.get_or_create(key, compute)
+
+    def group_order_factors(self):
+        """
+        Prime factorization of group_order(), cached per curve
+
+        Returns:
+            dict: {prime: exponent} with N = prod(q**e)
+        """
+        key = (self.a, self.b, self.p)
+        return _GROUP_ORDER_FACTORS.get_or_create(key, lambda: factorize(self.group_order()))
+
+    def group_structure(self):
+        """
+        Decompose E(F_p) as Z/n1 x Z/n2 with an explicit basis
+
+        Built per Sylow subgroup from random points, cofactor
+        multiplications and small discrete logarithms (no pairings);
+        cached per curve, so later calls cost nothing.
+
+        Returns:
+            dict: 'invariants' (n1, n2) with n2 | n1 and n1 * n2 = #E,
+                  'basis' (P1, P2) of orders n1 and n2 (P2 is the point at
+                  infinity when n2 = 1) and 'cyclic' (n2 == 1)
+        """
+        def compute():
+            n1, n2, P1, P2 = group_structure(self)
+            return {'invariants': (n1, n2), 'basis': (P1, P2), 'cyclic': n2 == 1}
+
+        return _GROUP_STRUCTURES.get_or_create((self.a, self.b, self.p), compute)
+
+    def _quadratic_twist(self):
+        """Twist y^2 = x^3 + a*d^2*x + b*d^3 by the field's non-residue d."""
+        d = self.field.z
+        p = self.p
+        return EllipticCurve(self.a * d * d % p, self.b * d * d * d % p, p)
+
+    def get_order(self, P, validate=True):
         """
         Find the order of a point P (smallest positive k such that kP = O)
 
+        By Lagrange the order divides N = #E. Starting from N, each prime
+        power q^e of N is stripped and q is multiplied back until the
+        cofactor multiple of P reaches infinity, so a query costs
+        O(log^2 N) group operations instead of walking P, 2P, 3P, ...
+
         Args:
             P: Point on the curve
+            validate: Check P is on the curve; pass False only for points
+                      already known to be valid
 
         Returns:
             int: Order of the point
+
+        Raises:
+            ValueError: If N * P is not the point at infinity, i.e. the
+                        group order does not hold for this curve
         """
+        if validate:
+            self.validate_point(P)
+
         if P == (None, None):
             return 1
 
-        current = P
-        order = 1
-        max_iterations = self.p + 1  # Hasse's theorem: order is at most p + 1
-
-        while current != (None, None) and order < max_iterations:
-            current = self.add_points(current, P)
-            order += 1
-
-        return order if current == (None, None) else -1
+        # One-off points: plain double-and-add keeps them out of the
+        # shared wNAF table cache.
+        P = (P[0] % self.p, P[1] % self.p)
+        order = self.group_order()
+        for q, e in self.group_order_factors().items():
+            order //= q ** e
+            R = self.scalar_multiply(order, P, validate=False, method='binary')
+            for _ in range(e):
+                if R == (None, None):
+                    break
+                R = self.scalar_multiply(q, R, validate=False, method='binary')
+                order *= q
+            if R != (None, None):
+                raise ValueError(f"Point order does not divide the group order {self.group_order()}")
+        return order
 
     def classify_points(self):
         """
         Classify all points on the curve by their properties
 
+        Sweeps cyclic subgroups instead of treating points independently:
+        for each point P not yet seen, one order query gives n = ord(P) and
+        a walk over half of <P> assigns every jP (and -jP) its order
+        n / gcd(j, n). Each orbit is walked once, so the whole
+        classification is a near-linear number of group operations.
+
         Returns:
             dict: Contains lists of generators, torsion points, and group order
         """
-        all_points = self.find_all_points()
-        group_order = len(all_points)
-
-        # Remove point at infinity for analysis
-        finite_points = [p for p in all_points if p != (None, None)]
+        group_order = self.group_order()
+        torsion_bound = max(2, int(group_order ** 0.5))
 
         generators = []
         torsion_points = []
         orders = {}
-
-        for point in finite_points:
-            order = self.get_order(point)
+        seen = {}
+
+        for point in self.point_set():
+            if point == (None, None):
+                continue
+            if point not in seen:
+                self._sweep_orbit(point, seen)
+            order = seen[point]
             orders[point] = order
 
             # A generator has order equal to group order or a large divisor
@@ -377,7 +1204,7 @@ class EllipticCurve:
                 generators.append(point)
 
             # Torsion points have small order (< sqrt(group_order))
-            if order <= max(2, int(group_order ** 0.5)):
+            if order <= torsion_bound:
                 torsion_points.append(point)
 
         return {
@@ -387,6 +1214,512 @@ class EllipticCurve:
             'orders': orders
         }
 
+    def _sweep_orbit(self, P, seen):
+        """
+        Record the order of every point in the cyclic subgroup <P>
+
+        jP and (n - j)P = -jP share the order n / gcd(j, n), so only
+        j <= n / 2 is walked.
+
+        Args:
+            P: Finite point on the curve, reduced mod p
+            seen: Dict mapping points to orders, updated in place
+        """
+        n = self.get_order(P, validate=False)
+        p = self.p
+        for j, R in enumerate(self.multiples(P, n // 2), 1):
+            if R not in seen:
+                order = n // math.gcd(j, n)
+                seen[R] = order
+                seen[(R[0], (-R[1]) % p)] = order
+
+    # ------------------------------------------------------------------
+    # Discrete logarithms: Pollard's rho
+    #
+    # The r-adding walk R -> R + M_j, with j = x(R) mod r and precomputed
+    # M_j = c_j*G + d_j*Q, behaves like a random map on <G> while keeping
+    # every visited point in the form a*G + b*Q. Any point reached with two
+    # different (a, b) gives (b' - b) * k = a - a' (mod n), so a collision
+    # after about sqrt(pi*n/2) additions solves Q = k*G without storing a
+    # table of baby steps.
+    # ------------------------------------------------------------------
+
+    def discrete_log_rho(self, G, Q, order=None, cycle='brent', seed=None,
+                         max_steps=None, validate=True, workers=1, progress=None):
+        """
+        Solve Q = k*G with Pollard's rho
+
+        Args:
+            G: Base point
+            Q: Target point
+            order: Order of G if already known (computed otherwise)
+            cycle: 'brent' or 'floyd' for cycle detection on a single walk
+                   (constant memory), or 'distinguished' for RHO_LANES walks
+                   (per worker) advanced together that only remember points
+                   whose x has its low bits clear (about n^(1/4) of them)
+            seed: Seed for the walks; runs are reproducible when given
+            max_steps: Give up after this many point additions
+                       (default 50 * sqrt(n))
+            validate: Check G and Q are on the curve
+            workers: Processes sharing the distinguished-point walks
+                     (capped at parallel_dlog.MAX_WORKERS)
+            progress: Optional callable receiving the additions done so
+                      far every PROGRESS_INTERVAL or so; an exception
+                      raised from it aborts the search
+
+        Returns:
+            dict: 'k' (in [1, n] with k*G = Q, or None if Q was not found in
+                  <G>), 'order' (n = ord(G)) and 'steps' (additions done)
+
+        Raises:
+            ValueError: If a point is not on the curve, cycle is unknown or
+                        workers > 1 is asked of a single-walk cycle mode
+        """
+        if cycle not in ('brent', 'floyd', 'distinguished'):
+            raise ValueError(f"Unknown cycle detection: {cycle}")
+        if workers > 1 and cycle != 'distinguished':
+            raise ValueError("Only distinguished-point walks run in parallel")
+        if validate:
+            self.validate_point(G)
+            self.validate_point(Q)
+        if G != (None, None):
+            G = (G[0] % self.p, G[1] % self.p)
+        if Q != (None, None):
+            Q = (Q[0] % self.p, Q[1] % self.p)
+
+        n = order if order is not None else self.get_order(G, validate=False)
+        result = {'k': None, 'order': n, 'steps': 0}
+        if self.scalar_multiply(n, Q, validate=False, method='binary') != (None, None):
+            return result  # ord(Q) does not divide n, so Q is not in <G>
+        if n <= 4 * self.RHO_PARTITIONS:
+            # Too small for a random walk: walk <G> directly.
+            for k, R in enumerate(self.multiples(G, n), 1):
+                if R == Q:
+                    result.update(k=k, steps=k)
+                    break
+            return result
+
+        if max_steps is None:
+            max_steps = 50 * math.isqrt(n)
+        rng = random.Random(seed)
+        if cycle == 'distinguished':
+            k, steps = collision_search(self, G, Q, n, rng, max_steps, workers, progress)
+        else:
+            k, steps = self._rho_single(G, Q, n, rng, max_steps, cycle, progress)
+        result.update(k=k, steps=steps)
+        return result
+
+    def _rho_walk(self, G, Q, n, rng):
+        """Random r-adding walk: the (c_j, d_j) coefficients and M_j points."""
+        coeffs = [(rng.randrange(n), rng.randrange(n)) for _ in range(self.RHO_PARTITIONS)]
+        table = [self.multi_scalar_multiply([(c, G), (d, Q)], validate=False)
+                 for c, d in coeffs]
+        return coeffs, table
+
+    def _rho_start(self, G, Q, n, rng):
+        """A random walk state (a*G + b*Q, a, b)."""
+        a, b = rng.randrange(n), rng.randrange(n)
+        return self.multi_scalar_multiply([(a, G), (b, Q)], validate=False), a, b
+
+    def _rho_solve(self, G, Q, n, a1, b1, a2, b2):
+        """k in [1, n] with k*G = Q from a1*G + b1*Q = a2*G + b2*Q, or None."""
+        db, da = (b2 - b1) % n, (a1 - a2) % n
+        g = math.gcd(db, n)
+        # For composite n there are g candidate solutions; too many means
+        # the collision carries little information and a new walk is cheaper.
+        if db == 0 or da % g or g > 1024:
+            return None
+        m = n // g
+        k = (da // g) * pow(db // g, -1, m) % m
+        for k in range(k, n, m):
+            if self.scalar_multiply(k, G, validate=False, method='binary') == Q:
+                return k or n
+        return None
+
+    def _rho_single(self, G, Q, n, rng, max_steps, cycle, progress=None):
+        """One walk at a time with Floyd's or Brent's cycle detection."""
+        r = self.RHO_PARTITIONS
+        steps = 0
+        report_at = self.PROGRESS_INTERVAL
+        while steps < max_steps:
+            coeffs, table = self._rho_walk(G, Q, n, rng)
+
+            def step(state):
+                R, a, b = state
+                j = 0 if R == (None, None) else R[0] % r
+                c, d = coeffs[j]
+                return self._add(R, table[j]), (a + c) % n, (b + d) % n
+
+            tortoise = self._rho_start(G, Q, n, rng)
+            if cycle == 'floyd':
+                # Tortoise one step, hare two, until they meet in the cycle.
+                hare = tortoise
+                while steps < max_steps:
+                    tortoise = step(tortoise)
+                    hare = step(step(hare))
+                    steps += 3
+                    if tortoise[0] == hare[0]:
+                        break
+                    if progress is not None and steps >= report_at:
+                        progress(steps)
+                        report_at += self.PROGRESS_INTERVAL
+            else:
+                # Brent: park the tortoise at powers of two and let the hare
+                # run; one walk and fewer additions than Floyd.
+                hare = step(tortoise)
+                steps += 1
+                power = lam = 1
+                while tortoise[0] != hare[0] and steps < max_steps:
+                    if power == lam:
+                        tortoise = hare
+                        power *= 2
+                        lam = 0
+                    hare = step(hare)
+                    lam += 1
+                    steps += 1
+                    if progress is not None and steps >= report_at:
+                        progress(steps)
+                        report_at += self.PROGRESS_INTERVAL
+
+            if tortoise[0] == hare[0]:
+                k = self._rho_solve(G, Q, n, tortoise[1], tortoise[2], hare[1], hare[2])
+                if k is not None:
+                    return k, steps
+        return None, steps
+
+    def _rho_advance(self, G, Q, n, walk, states, d, rounds, rng):
+        """
+        Advance distinguished-point walks by a number of rounds
+
+        All walks step together through batch_add, one inversion per
+        round. A walk carries on past each distinguished point (x // r with
+        its low d bits clear); one that runs 20 * 2^d steps without meeting
+        any is assumed stuck in a short cycle and restarted at random.
+
+        Args:
+            walk: (coeffs, table) from _rho_walk
+            states: List of [R, a, b, trail length], one per walk, updated
+                    in place
+            d: Number of distinguishing bits
+            rounds: Additions to perform per walk
+            rng: Random source for restarts
+
+        Returns:
+            tuple: (dps, steps) with dps a list of (walk index, R, a, b)
+        """
+        coeffs, table = walk
+        r = self.RHO_PARTITIONS
+        mask = (1 << d) - 1
+        trail_limit = 20 << d
+        dps = []
+
+        for _ in range(rounds):
+            parts = [0 if s[0] == (None, None) else s[0][0] % r for s in states]
+            points = self.batch_add((s[0], table[j]) for s, j in zip(states, parts))
+            for i, (s, j, R) in enumerate(zip(states, parts, points)):
+                c, e = coeffs[j]
+                s[0], s[1], s[2], s[3] = R, (s[1] + c) % n, (s[2] + e) % n, s[3] + 1
+                if R != (None, None) and (R[0] // r) & mask == 0:
+                    s[3] = 0
+                    dps.append((i, R, s[1], s[2]))
+                elif s[3] > trail_limit:
+                    states[i] = list(self._rho_start(G, Q, n, rng)) + [0]
+        return dps, rounds * len(states)
+
+    def discrete_log_kangaroo(self, G, Q, k_min, k_max, seed=None, max_steps=None,
+                              validate=True, progress=None):
+        """
+        Solve Q = k*G for k in [k_min, k_max] with Pollard's kangaroo
+
+        A tame kangaroo starts at k_max*G and hops forward by 2^j * G, with
+        j chosen from x, so the mean hop is about sqrt(w)/2 for an interval
+        of width w; where it stops it leaves a trap. A wild kangaroo starts
+        at Q under the same rule: once it lands on any point of the tame
+        path it follows it into the trap, and the distances travelled give
+        k. That is a few sqrt(w) additions in constant memory, whatever the
+        group order; a missed trap retries with a reshuffled hop rule. The
+        interval is capped at ord(G) candidates, and one covering more than
+        a quarter of them is left to discrete_log_rho().
+
+        Args:
+            G: Base point
+            Q: Target point
+            k_min: Smallest candidate scalar (>= 0)
+            k_max: Largest candidate scalar
+            seed: Seed for the reshuffled hop rules of later attempts
+            max_steps: Give up after this many point additions
+                       (default 20 * sqrt(w))
+            validate: Check G and Q are on the curve
+            progress: Optional callable receiving the additions done so
+                      far, as for discrete_log_rho()
+
+        Returns:
+            dict: 'k' (in [k_min, k_max] with k*G = Q, or None) and 'steps'
+                  (additions done)
+
+        Raises:
+            ValueError: If a point is not on the curve or the interval is
+                        empty or negative
+        """
+        if not 0 <= k_min <= k_max:
+            raise ValueError("Need 0 <= k_min <= k_max")
+        if validate:
+            self.validate_point(G)
+            self.validate_point(Q)
+        p = self.p
+        if G != (None, None):
+            G = (G[0] % p, G[1] % p)
+        if Q != (None, None):
+            Q = (Q[0] % p, Q[1] % p)
+
+        # k is only unique mod ord(G): a wider interval holds every residue
+        # already.
+        n = self.get_order(G, validate=False)
+        k_max = min(k_max, k_min + n - 1)
+
+        result = {'k': None, 'steps': 0}
+        w = k_max - k_min
+        if w <= 4 * self.RHO_PARTITIONS:
+            # Narrow enough to step through directly.
+            R = self.scalar_multiply(k_min, G, validate=False)
+            for k in range(k_min, k_max + 1):
+                if R == Q:
+                    result['k'] = k
+                    break
+                R = self._add(R, G)
+                result['steps'] += 1
+            return result
+
+        if 4 * w > n:
+            # Paths this long wrap around the group, so the wild kangaroo can
+            # start just ahead of the tame one and never reach its trap. The
+            # interval is most of the group anyway: solve there with rho.
+            solved = self.discrete_log_rho(G, Q, order=n, seed=seed, max_steps=max_steps,
+                                           validate=False, progress=progress)
+            if solved['k'] is not None:
+                # The interval may hold fewer than n candidates; a key
+                # outside it counts as not found, like a missed trap.
+                k = k_min + (solved['k'] - k_min) % n
+                result['k'] = k if k <= k_max else None
+            result['steps'] = solved['steps']
+            return result
+
+        root = math.isqrt(w)
+        if max_steps is None:
+            max_steps = 20 * root
+        # Hops 2^j * G for j < m, with mean (2^m - 1) / m ~ sqrt(w) / 2.
+        m = 1
+        while ((1 << m) - 1) // m < root // 2:
+            m += 1
+        hops = [G]
+        for _ in range(m - 1):
+            hops.append(self._double(hops[-1]))
+
+        rng = random.Random(seed)
+        top = self.scalar_multiply(k_max, G, validate=False)
+        scale, shift = 1, 0
+
+        report_at = self.PROGRESS_INTERVAL
+
+        def hop(R):
+            nonlocal report_at
+            result['steps'] += 1
+            if progress is not None and result['steps'] >= report_at:
+                progress(result['steps'])
+                report_at += self.PROGRESS_INTERVAL
+            j = 0 if R == (None, None) else (R[0] * scale + shift) % p % m
+            return self._add(R, hops[j]), 1 << j
+
+        while result['steps'] < max_steps:
+            # Tame kangaroo: about sqrt(w) hops, travelling ~w/2 past k_max.
+            trap, tame = top, 0
+            for _ in range(root):
+                trap, jump = hop(trap)
+                tame += jump
+
+            # Wild kangaroo: from k, it must reach k_max + tame to be caught.
+            wild, R = 0, Q
+            while wild <= w + tame and result['steps'] < max_steps:
+                if R == trap:
+                    k = k_max + tame - wild
+                    if k_min <= k <= k_max and self.scalar_multiply(k, G, validate=False) == Q:
+                        result['k'] = k
+                        return result
+                    break
+                R, jump = hop(R)
+                wild += jump
+
+            scale, shift = rng.randrange(1, p), rng.randrange(p)
+        return result
+
+    def discrete_log_pohlig_hellman(self, G, Q, order=None, solver='auto', validate=True,
+                                    progress=None):
+        """
+        Solve Q = k*G by Pohlig-Hellman over the factored order of G
+
+        For n = ord(G) = prod q^e, k mod q^e is found digit by digit in the
+        order-q subgroup of <(n / q^e) * G>, and the residues are combined
+        with the Chinese remainder theorem. The work is dominated by
+        e * sqrt(q) for the largest prime q instead of sqrt(n).
+
+        Args:
+            G: Base point
+            Q: Target point
+            order: Order of G if already known (computed otherwise)
+            solver: 'bsgs' or 'rho' for the prime-order subproblems, or
+                    'auto' for BSGS up to PH_BSGS_MAX_Q and rho above
+            validate: Check G and Q are on the curve
+            progress: Optional callable receiving the additions done so
+                      far, as for discrete_log_rho()
+
+        Returns:
+            dict: 'k' (in [1, n] with k*G = Q, or None if Q is not in <G>),
+                  'order' (n), 'steps' (additions spent in the
+                  subproblems) and 'factors' ({q: e} for n)
+
+        Raises:
+            ValueError: If a point is not on the curve or solver is unknown
+        """
+        if solver not in ('auto', 'bsgs', 'rho'):
+            raise ValueError(f"Unknown subproblem solver: {solver}")
+        if validate:
+            self.validate_point(G)
+            self.validate_point(Q)
+        if G != (None, None):
+            G = (G[0] % self.p, G[1] % self.p)
+        if Q != (None, None):
+            Q = (Q[0] % self.p, Q[1] % self.p)
+
+        n = order if order is not None else self.get_order(G, validate=False)
+        # n divides #E, so its factors come from the cached group order ones.
+        factors = {}
+        for q in self.group_order_factors():
+            e = 0
+            while n % q ** (e + 1) == 0:
+                e += 1
+            if e:
+                factors[q] = e
+        result = {'k': None, 'order': n, 'steps': 0, 'factors': factors}
+        if self.scalar_multiply(n, Q, validate=False, method='binary') != (None, None):
+            return result  # ord(Q) does not divide n, so Q is not in <G>
+
+        k, modulus = 0, 1
+        for q, e in factors.items():
+            cofactor = n // q ** e
+            dlog = _CyclicQLog(
+                self, self.scalar_multiply(cofactor, G, validate=False, method='binary'), q, e,
+                solver=solver if solver != 'auto' else 'bsgs' if q <= self.PH_BSGS_MAX_Q else 'rho')
+            if progress is not None:
+                done = result['steps']
+                dlog.progress = lambda steps, done=done: progress(done + steps)
+            x = dlog.log(self.scalar_multiply(cofactor, Q, validate=False, method='binary'))
+            result['steps'] += dlog.steps
+            if x is None:
+                return result
+            # CRT: lift k mod modulus to k mod modulus * q^e.
+            qe = q ** e
+            k += modulus * ((x - k) * pow(modulus, -1, qe) % qe)
+            modulus *= qe
+
+        # Q lies in <G> only if the combined residue actually works.
+        if self.scalar_multiply(k, G, validate=False) == Q:
+            result['k'] = k or n
+        return result
+
+    @staticmethod
+    def _pack_point(R):
+        """A point as one int: 2x + (y mod 2), or -1 for infinity (p is odd)."""
+        return -1 if R == (None, None) else R[0] << 1 | R[1] & 1
+
+    def _bsgs_table(self, G, n):
+        """
+        Baby steps {packed jG: j} for 0 <= j < m, built once per (curve, G)
+
+        m is about sqrt(n) but at most BSGS_MAX_TABLE.
+        """
+        m = min(math.isqrt(n - 1) + 1, self.BSGS_MAX_TABLE)
+
+        def build():
+            table = {-1: 0}
+            for j, R in enumerate(self.multiples(G, m - 1), 1):
+                table.setdefault(self._pack_point(R), j)
+            return m, table
+
+        return _BSGS_TABLES.get_or_create((self.a, self.b, self.p, G, m), build)
+
+    def discrete_log_bsgs(self, G, targets, order=None, validate=True, progress=None):
+        """
+        Solve Q = k*G for a batch of targets with baby-step giant-step
+
+        The baby-step table depends only on G, so it is cached and shared
+        by every call (and every target) for the same curve and base point.
+        The giant steps Q - i*m*G of all targets advance together through
+        batch_add, one inversion per round for the whole batch.
+
+        Args:
+            G: Base point
+            targets: Iterable of target points Q
+            order: Order of G if already known (computed otherwise)
+            validate: Check G and the targets are on the curve
+            progress: Optional callable receiving the giant-step additions
+                      done so far, as for discrete_log_rho()
+
+        Returns:
+            list: For each target, k in [1, n] with k*G = Q, or None if Q
+                  is not in <G>
+        """
+        return self._bsgs_search(G, targets, order, validate, progress)[0]
+
+    def _bsgs_search(self, G, targets, order=None, validate=True, progress=None):
+        """discrete_log_bsgs(), also counting the work: (keys, giant-step additions)."""
+        targets = list(targets)
+        if validate:
+            self.validate_point(G)
+            for Q in targets:
+                self.validate_point(Q)
+        p = self.p
+        if G != (None, None):
+            G = (G[0] % p, G[1] % p)
+        targets = [Q if Q == (None, None) else (Q[0] % p, Q[1] % p) for Q in targets]
+
+        n = order if order is not None else self.get_order(G, validate=False)
+        m, table = self._bsgs_table(G, n)
+        mG = self.scalar_multiply(m, G, validate=False)
+        stride = (None, None) if mG == (None, None) else (mG[0], (-mG[1]) % p)
+
+        # Each target's ceil(n / m) giant steps are split over up to
+        # BATCH_LANES lanes, lane l starting at Q - l*span*m*G, so even a
+        # single target shares every inversion across many steps.
+        rounds = -(-n // m)
+        lanes = min(self.BATCH_LANES, rounds)
+        span = -(-rounds // lanes)
+        offsets = [(None, None)] + self.multiples(
+            self.scalar_multiply(-span * m, G, validate=False), lanes - 1)
+
+        found = [None] * len(targets)
+        report_at = self.PROGRESS_INTERVAL
+        active = []
+        for t, Q in enumerate(targets):
+            starts = self.batch_add((Q, offset) for offset in offsets)
+            active.extend((t, l, Y) for l, Y in enumerate(starts))
+        steps = len(active)
+
+        for step in range(span):
+            for t, l, Y in active:
+                j = table.get(self._pack_point(Y))
+                if j is not None and found[t] is None:
+                    found[t] = ((l * span + step) * m + j) % n or n
+            active = [lane for lane in active if found[lane[0]] is None]
+            if not active:
+                break
+            moved = self.batch_add((Y, stride) for _, _, Y in active)
+            active = [(t, l, Y) for (t, l, _), Y in zip(active, moved)]
+            steps += len(active)
+            if progress is not None and steps >= report_at:
+                progress(steps)
+                report_at = steps + self.PROGRESS_INTERVAL
+        return found, steps
+
     def generate_test_vector(self):
         """
         Generate a test vector for the curve with sample operations
@@ -394,13 +1727,13 @@ class EllipticCurve:
         Returns:
             dict: Test vector data
         """
-        points = self.find_all_points()
+        points = self.point_set()
 
-        # Pick some non-identity points for testing
-        test_points = [p for p in points if p != (None, None)][:3]
+        # Pick some non-identity points for testing (O comes first)
+        test_points = list(points[1:4])
 
         if len(test_points) < 2:
-            test_points = points[:3]
+            test_points = list(points[:3])
 
         P = test_points[0] if len(test_points) > 0 else (None, None)
         Q = test_points[1] if len(test_points) > 1 else (None, None)
@@ -440,6 +1773,30 @@ class EllipticCurve:
         return test_vector
 
 
+def get_curve(a, b, p):
+    """
+    Shared EllipticCurve for (a, b, p), from a bounded LRU registry
+
+    Route handlers see the same few curves over and over; handing out one
+    immutable instance per curve skips re-validation and keeps everything
+    derived from it hot: the point set, group order, its factorization,
+    group structure (and thus generator) and scalar multiplication tables,
+    which are cached under the same curve key.
+
+    Args:
+        a, b, p: Curve parameters, as for EllipticCurve
+
+    Returns:
+        EllipticCurve: Cached instance (a fresh one on a miss)
+
+    Raises:
+        ValueError: If the parameters do not define a valid curve
+    """
+    if not all(isinstance(v, int) for v in (a, b, p)) or p < 2:
+        return EllipticCurve(a, b, p)  # raises the usual ValueError
+    return _CURVES.get_or_create((a % p, b % p, p), lambda: EllipticCurve(a, b, p))
+
+
 class RealEllipticCurve:
     """
     Elliptic Curve E(a, b) over R: y^2 = x^3 + a*x + b
@@ -501,7 +1858,7 @@ class RealEllipticCurve:
 
         return abs(lhs - rhs) <= tol
 
-    def add_points(self, P, Q, tol=1e-12):
+    def add_points(self, P, Q, tol=1e-12, validate=True):
         """
         Add two points P and Q on the curve over R.
 
@@ -509,6 +1866,9 @@ class RealEllipticCurve:
             P: (x1, y1) or (None, None) for infinity
             Q: (x2, y2) or (None, None) for infinity
             tol: tolerance for float comparisons
+            validate: Check both inputs are on the curve; pass False for
+                      intermediate results whose rounding error may exceed
+                      the on-curve tolerance
 
         Returns:
             (x3, y3): P + Q
@@ -530,10 +1890,11 @@ class RealEllipticCurve:
             raise ValueError("Invalid point coordinates")
 
         # Verify points are on curve
-        if not self.is_point_on_curve(x1, y1):
-            raise ValueError(f"P = {P} is not on the curve")
-        if not self.is_point_on_curve(x2, y2):
-            raise ValueError(f"Q = {Q} is not on the curve")
+        if validate:
+            if not self.is_point_on_curve(x1, y1):
+                raise ValueError(f"P = {P} is not on the curve")
+            if not self.is_point_on_curve(x2, y2):
+                raise ValueError(f"Q = {Q} is not on the curve")
 
         # If x1 == x2 and y1 == -y2 -> vertical line: P + Q = infinity
         if abs(x1 - x2) <= tol and abs(y1 + y2) <= tol:
@@ -561,20 +1922,23 @@ class RealEllipticCurve:
 
         return (x3, y3)
 
-    def scalar_multiply(self, k, P):
+    def scalar_multiply(self, k, P, method='auto'):
         """
-        Compute k * P using double-and-add over R.
+        Compute k * P over R.
 
         Args:
             k: integer scalar (can be negative)
             P: point on the curve
+            method: 'binary' (double-and-add), 'wnaf' (width-w NAF with a
+                    cached odd-multiple table for P) or 'auto' to pick wNAF
+                    for large scalars
 
         Returns:
             kP as a point
             
         Raises:
             TypeError: If k is not an integer
-            ValueError: If P is not on the curve
+            ValueError: If P is not on the curve or method is unknown
         """
         if not isinstance(k, int):
             raise TypeError("Scalar k must be an integer for this implementation.")
@@ -593,20 +1957,50 @@ class RealEllipticCurve:
         if k == 0:
             return self.infinity()
 
-        # Handle negative k: kP = -|k|P
-        if k < 0:
-            k = -k
-            P = (x, -y)
+        # Handle negative k: kP = -(|k|P)
+        negative = k < 0
+        k = abs(k)
 
-        result = self.infinity()
-        addend = P
+        if method == 'auto':
+            method = 'wnaf' if k.bit_length() >= EllipticCurve.WNAF_MIN_BITS else 'binary'
 
-        while k > 0:
-            if k & 1:
-                result = self.add_points(result, addend)
-            addend = self.add_points(addend, addend)
-            k >>= 1
+        if method == 'binary':
+            result = self.infinity()
+            addend = P
+
+            while k > 0:
+                if k & 1:
+                    result = self.add_points(result, addend, validate=False)
+                addend = self.add_points(addend, addend, validate=False)
+                k >>= 1
+        elif method == 'wnaf':
+            result = self._multiply_wnaf(k, P, EllipticCurve.WNAF_WIDTH)
+        else:
+            raise ValueError(f"Unknown scalar multiplication method: {method}")
 
+        if negative and not self.is_infinity(result):
+            result = (result[0], -result[1])
+        return result
+
+    def _multiply_wnaf(self, k, P, w):
+        """Width-w NAF multiplication for k > 0 using a cached odd-multiple table."""
+        def build():
+            table = [P]
+            twice = self.add_points(P, P, validate=False)
+            for _ in range((1 << (w - 2)) - 1):
+                table.append(self.add_points(table[-1], twice, validate=False))
+            return table
+
+        table = _WNAF_TABLES.get_or_create(('R', self.a, self.b, P, w), build)
+        result = self.infinity()
+        for d in reversed(_wnaf_digits(k, w)):
+            result = self.add_points(result, result, validate=False)
+            if d > 0:
+                result = self.add_points(result, table[d >> 1], validate=False)
+            elif d < 0:
+                Q = table[(-d) >> 1]
+                if not self.is_infinity(Q):
+                    result = self.add_points(result, (Q[0], -Q[1]), validate=False)
         return result
 
     def __str__(self):
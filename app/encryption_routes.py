@@ -6,7 +6,7 @@ import secrets
 from flask import jsonify, request, session
 
 from .db_helpers import get_current_user, save_history
-from .elliptic_curve import EllipticCurve
+from .elliptic_curve import get_curve
 
 
 def register_encryption_routes(app):
@@ -22,24 +22,18 @@ def register_encryption_routes(app):
             print(f"\n{'='*70}")
             print(f"INIT: Received custom_private_key = {custom_private_key} (type: {type(custom_private_key).__name__})")
 
-            curve = EllipticCurve(a, b, p)
+            curve = get_curve(a, b, p)
 
-            points = curve.find_all_points()
-            valid_points = [pt for pt in points if pt != (None, None)]
-
-            if len(valid_points) < 2:
+            num_points = curve.group_order() - 1
+            if num_points < 2:
                 return jsonify({'success': False, 'error': 'Curve has too few points for encryption'}), 400
 
             # Choose a high-order generator so different private keys do not collapse
             # to the same public key/shared secret (small subgroup problem).
-            curve_info = curve.classify_points()
-            orders = {pt: order for pt, order in curve_info.get('orders', {}).items() if order and order > 1}
-            if orders:
-                generator = max(orders.items(), key=lambda kv: kv[1])[0]
-                generator_order = orders[generator]
-            else:
-                generator = valid_points[0]
-                generator_order = curve.get_order(generator)
+            # The first basis point of E = Z/n1 x Z/n2 has the maximal order n1.
+            structure = curve.group_structure()
+            generator = structure['basis'][0]
+            generator_order = structure['invariants'][0]
 
             # Fallback to safe range if order computation failed
             if not generator_order or generator_order <= 1:
@@ -61,7 +55,7 @@ def register_encryption_routes(app):
                 max_key = (generator_order - 1) if generator_order else (p - 1)
                 private_key = secrets.randbelow(max_key) + 1
 
-            public_key = curve.scalar_multiply(private_key, generator)
+            public_key = curve.scalar_multiply(private_key, generator, method='fixed_base', secret=True)
 
             print(f"INIT: Setting session private_key = {private_key} (source: {key_source})")
 
@@ -86,7 +80,7 @@ def register_encryption_routes(app):
                 'generator': {'x': generator[0], 'y': generator[1]},
                 'private_key': private_key,
                 'public_key': {'x': public_key[0], 'y': public_key[1]},
-                'num_points': len(valid_points),
+                'num_points': num_points,
                 'used_custom_key': key_source == 'custom',
                 'message': f'Encryption system initialized on E_{p}({a}, {b})'
             })
@@ -110,12 +104,12 @@ def register_encryption_routes(app):
             public_key = tuple(enc_params['public_key'])
             generator_order = enc_params.get('generator_order')
 
-            curve = EllipticCurve(a, b, p)
+            curve = get_curve(a, b, p)
 
             max_k = (generator_order - 1) if generator_order and generator_order > 1 else (p - 1)
             k = secrets.randbelow(max_k) + 1
-            R = curve.scalar_multiply(k, generator)
-            S = curve.scalar_multiply(k, public_key)
+            R = curve.scalar_multiply(k, generator, method='fixed_base', secret=True)
+            S = curve.scalar_multiply(k, public_key, secret=True)
             shared_secret = S[0] if S[0] is not None else 0
 
             payload_bytes = plaintext.encode('utf-8')
@@ -225,7 +219,7 @@ def register_encryption_routes(app):
                 print(f"DECRYPTION: Using session key (no different key provided or key equals session key)")
             print(f"{'='*70}\n")
 
-            curve = EllipticCurve(a, b, p)
+            curve = get_curve(a, b, p)
 
             R = (ciphertext['R']['x'], ciphertext['R']['y'])
             encrypted_bytes = ciphertext['encrypted']
@@ -235,7 +229,7 @@ def register_encryption_routes(app):
             if not stored_hmac_tag:
                 return jsonify({'success': False, 'error': 'CRITICAL: No HMAC tag found in ciphertext. This ciphertext is in old format or corrupted. Please re-encrypt your message with the current system.'}), 400
 
-            S = curve.scalar_multiply(private_key, R)
+            S = curve.scalar_multiply(private_key, R, secret=True)
             shared_secret = S[0] if S[0] is not None else 0
 
             decrypted_chars = []
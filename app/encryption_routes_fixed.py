@@ -17,7 +17,7 @@ from Crypto.Cipher import AES
 from flask import jsonify, request, session
 
 from .db_helpers import get_current_user, save_history
-from .elliptic_curve import EllipticCurve
+from .elliptic_curve import get_curve
 
 
 def kdf_sha256(shared_secret_point, salt=b"ECIES-KDF", info=b"encryption-key"):
@@ -79,15 +79,13 @@ def register_encryption_routes(app):
             custom_private_key = data.get('private_key')
 
             # SECURITY: Initialize curve (validates discriminant, primality, etc.)
-            curve = EllipticCurve(a, b, p)
+            curve = get_curve(a, b, p)
 
-            points = curve.find_all_points()
-            valid_points = [pt for pt in points if pt != (None, None)]
-
-            if len(valid_points) < 2:
+            num_points = curve.group_order() - 1
+            if num_points < 2:
                 return jsonify({'success': False, 'error': 'Curve has too few points for ECIES'}), 400
 
-            generator = valid_points[0]
+            generator = next(curve.iter_points())
 
             # SECURITY: Validate generator point is on curve
             if not curve.is_point_on_curve(generator[0], generator[1]):
@@ -114,7 +112,7 @@ def register_encryption_routes(app):
                 private_key = secrets.randbelow(p - 1) + 1
 
             # SECURITY: Compute public key using scalar multiplication
-            public_key = curve.scalar_multiply(private_key, generator)
+            public_key = curve.scalar_multiply(private_key, generator, method='fixed_base', secret=True)
 
             # SECURITY: Verify public key is on curve
             if not curve.is_point_on_curve(public_key[0], public_key[1]):
@@ -138,7 +136,7 @@ def register_encryption_routes(app):
                 'generator': {'x': generator[0], 'y': generator[1]},
                 'private_key': private_key,
                 'public_key': {'x': public_key[0], 'y': public_key[1]},
-                'num_points': len(valid_points),
+                'num_points': num_points,
                 'used_custom_key': key_source == 'custom',
                 'message': f'ECIES initialized on E_{p}({a}, {b})'
             })
@@ -180,7 +178,7 @@ def register_encryption_routes(app):
             public_key = tuple(enc_params['public_key'])
 
             # SECURITY: Reinitialize curve to validate parameters
-            curve = EllipticCurve(a, b, p)
+            curve = get_curve(a, b, p)
 
             # Prepare payload
             payload_bytes = plaintext.encode('utf-8')
@@ -203,14 +201,14 @@ def register_encryption_routes(app):
             steps.append(f"Step 1: Generate random ephemeral private key k = {k}")
 
             # === ECIES ENCRYPTION STEP 2: Compute ephemeral public key ===
-            R = curve.scalar_multiply(k, generator)
+            R = curve.scalar_multiply(k, generator, method='fixed_base', secret=True)
             steps.append(f"Step 2: Compute ephemeral public key R = k × G")
             steps.append(f"        R = {k} × ({generator[0]}, {generator[1]})")
             steps.append(f"        R = ({R[0]}, {R[1]})")
 
             # === ECIES ENCRYPTION STEP 3: Compute shared secret ===
             # SECURITY: S = k * Q (not k * G)
-            S = curve.scalar_multiply(k, public_key)
+            S = curve.scalar_multiply(k, public_key, secret=True)
             steps.append(f"Step 3: Compute shared secret S = k × PublicKey")
             steps.append(f"        S = {k} × ({public_key[0]}, {public_key[1]})")
             steps.append(f"        S = ({S[0]}, {S[1]})")
@@ -307,7 +305,7 @@ def register_encryption_routes(app):
             private_key = enc_params['private_key']
 
             # SECURITY: Reinitialize curve to validate parameters
-            curve = EllipticCurve(a, b, p)
+            curve = get_curve(a, b, p)
 
             steps = []
 
@@ -325,7 +323,7 @@ def register_encryption_routes(app):
 
             # === ECIES DECRYPTION STEP 2: Compute shared secret ===
             # SECURITY: S = private_key * R (matches encryption's k * Q)
-            S = curve.scalar_multiply(private_key, R)
+            S = curve.scalar_multiply(private_key, R, secret=True)
             steps.append(f"Step 2: Compute shared secret S = PrivateKey × R")
             steps.append(f"        S = {private_key} × ({R[0]}, {R[1]})")
             steps.append(f"        S = ({S[0]}, {S[1]})")
@@ -0,0 +1,91 @@
+"""
+Integer factorization for group orders
+
+Point orders, group structure and Pohlig-Hellman all work from the
+factored group order N = #E(F_p). N is at most p + 1 + 2*sqrt(p), so
+trial division by small primes followed by Pollard's rho (Brent's
+variant) splits it quickly for the curve sizes the app handles.
+"""
+
+import math
+import random
+
+from .prime_field import _is_prime
+
+# Trial-divide by every prime below this bound before running rho.
+TRIAL_DIVISION_BOUND = 1000
+
+_SMALL_PRIMES = [q for q in range(2, TRIAL_DIVISION_BOUND) if _is_prime(q)]
+
+
+def _pollard_brent(n, rng):
+    """
+    Non-trivial factor of the odd composite n (Brent's cycle detection)
+
+    Batches the gcd over runs of steps so each iteration costs one modular
+    multiplication; a failed batch is replayed one step at a time.
+    """
+    while True:
+        y, c, m = rng.randrange(1, n), rng.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+def factorize(n):
+    """
+    Prime factorization of a positive integer
+
+    Args:
+        n: Integer >= 1
+
+    Returns:
+        dict: {prime: exponent}, ordered by increasing prime (empty for 1)
+
+    Raises:
+        ValueError: If n < 1
+    """
+    if n < 1:
+        raise ValueError("Can only factor positive integers")
+
+    factors = {}
+    for q in _SMALL_PRIMES:
+        if q * q > n:
+            break
+        while n % q == 0:
+            factors[q] = factors.get(q, 0) + 1
+            n //= q
+
+    rng = random.Random(n)
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if _is_prime(m):
+            factors[m] = factors.get(m, 0) + 1
+            continue
+        root = math.isqrt(m)
+        if root * root == m:
+            stack.extend((root, root))
+            continue
+        d = _pollard_brent(m, rng)
+        stack.extend((d, m // d))
+
+    return dict(sorted(factors.items()))
@@ -0,0 +1,169 @@
+"""
+Group structure of E(F_p) without pairings
+
+E(F_p) is isomorphic to Z/n1 x Z/n2 with n2 | n1 (and n2 | p - 1). The
+decomposition is assembled one Sylow subgroup at a time: for each prime
+power q^e exactly dividing N = #E, random points are pushed into the
+q-part by the cofactor N / q^e and reduced against the current basis
+with discrete logarithms in a cyclic q-group (Pohlig-Hellman digits,
+baby-step giant-step per digit). The q-part has rank at most two, so a
+basis (P1, P2) of orders (q^a, q^b) is complete once a + b = e. Summing
+the per-prime basis points gives generators of Z/n1 and Z/n2.
+"""
+
+import math
+import random
+
+from .point_counting import _random_point
+
+INFINITY = (None, None)
+
+
+def _q_order(curve, T, q, e):
+    """Return c <= e such that q^c is the order of T, a point of q-power order."""
+    for c in range(e + 1):
+        if T == INFINITY:
+            return c
+        T = curve.scalar_multiply(q, T, validate=False, method='binary')
+    raise ValueError(f"Point order is not a divisor of {q}^{e}")
+
+
+class _CyclicQLog:
+    """
+    Discrete logarithms in the cyclic group <P> of order q^a
+
+    Each base-q digit is a logarithm in the order-q subgroup generated by
+    q^(a-1) * P, found by baby-step giant-step (the baby-step table is
+    built once, on first use) or, for large q, by Pollard's rho. steps
+    counts the point additions spent so far; an optional progress
+    callable is kept informed of it.
+    """
+
+    def __init__(self, curve, P, q, a, solver='bsgs'):
+        self.curve = curve
+        self.P = P
+        self.q = q
+        self.a = a
+        self.solver = solver
+        self.H = curve.scalar_multiply(q ** (a - 1), P, validate=False)
+        self.baby = None
+        self.steps = 0
+        self.progress = None
+        self.reported = 0
+
+    def _build_table(self):
+        curve = self.curve
+        self.m = math.isqrt(self.q) + 1
+        self.baby = {INFINITY: 0}
+        for j, R in enumerate(curve.multiples(self.H, self.m - 1), 1):
+            self.baby.setdefault(R, j)
+        self.giant = curve.scalar_multiply(-self.m, self.H, validate=False)
+        self.steps += self.m
+
+    def _digit(self, Y):
+        """d in [0, q) with Y = d * H, or None if Y is not in <H>."""
+        curve = self.curve
+        if self.solver == 'rho':
+            done = self.steps
+            progress = self.progress and (lambda steps: self.progress(done + steps))
+            solved = curve.discrete_log_rho(self.H, Y, order=self.q, cycle='distinguished',
+                                            validate=False, progress=progress)
+            self.steps += solved['steps']
+            return None if solved['k'] is None else solved['k'] % self.q
+        if self.baby is None:
+            self._build_table()
+        for i in range(self.m + 1):
+            j = self.baby.get(Y)
+            if j is not None:
+                d = i * self.m + j
+                if d < self.q:
+                    return d
+            Y = curve._add(Y, self.giant)
+            self.steps += 1
+            # steps jumps by m when the table is built, so compare against
+            # the last report rather than testing for a multiple.
+            if self.progress is not None and self.steps - self.reported >= curve.PROGRESS_INTERVAL:
+                self.reported = self.steps
+                self.progress(self.steps)
+        return None
+
+    def log(self, Y):
+        """Return k with Y = k * P, or None if Y is not in <P>."""
+        curve, q, a = self.curve, self.q, self.a
+        k = 0
+        for i in range(a):
+            # Remove the digits found so far and project onto <H>.
+            rest = curve._add(Y, curve.scalar_multiply(-k, self.P, validate=False))
+            d = self._digit(curve.scalar_multiply(q ** (a - 1 - i), rest, validate=False))
+            if d is None:
+                return None
+            k += d * q ** i
+        return k if curve.scalar_multiply(k, self.P, validate=False) == Y else None
+
+
+def _sylow_basis(curve, q, e, cofactor, rng):
+    """
+    Basis of the Sylow q-subgroup of E(F_p), of order q^e
+
+    Returns:
+        tuple: (P1, a, P2, b) with ord(P1) = q^a, ord(P2) = q^b, b <= a,
+               a + b = e and <P1> and <P2> meeting only in O
+    """
+    P1, a = INFINITY, 0
+    P2, b = INFINITY, 0
+    dlog = None
+
+    while a + b < e:
+        T = curve.scalar_multiply(cofactor, _random_point(curve, rng), validate=False)
+        t = _q_order(curve, T, q, e)
+        if t > a:
+            # Larger than the current P1: restart the basis from T.
+            P1, a = T, t
+            P2, b = INFINITY, 0
+            dlog = None
+            continue
+        if t <= b:
+            continue
+        if dlog is None:
+            # Only needed when the q-part is not cyclic, where q^2 | p - 1
+            # keeps q (and the baby-step table) small.
+            dlog = _CyclicQLog(curve, P1, q, a)
+
+        # Smallest c with q^c * T in <P1>; since ord(T) <= ord(P1) the
+        # logarithm k of q^c * T is a multiple of q^c. Membership is
+        # monotone in c, so c <= b means T adds nothing new.
+        for c in range(b, t + 1):
+            k = dlog.log(curve.scalar_multiply(q ** c, T, validate=False))
+            if k is not None:
+                break
+        if c > b:
+            P2 = curve._add(T, curve.scalar_multiply(-(k // q ** c), P1, validate=False))
+            b = c
+
+    return P1, a, P2, b
+
+
+def group_structure(curve):
+    """
+    Invariant factors and basis of E(F_p)
+
+    Args:
+        curve: EllipticCurve
+
+    Returns:
+        tuple: (n1, n2, P1, P2) with E(F_p) = <P1> x <P2>, ord(P1) = n1,
+               ord(P2) = n2 and n2 | n1; P2 is the point at infinity when
+               the group is cyclic
+    """
+    N = curve.group_order()
+    rng = random.Random(f"structure:{curve.a},{curve.b},{curve.p}")
+
+    n1 = n2 = 1
+    P1 = P2 = INFINITY
+    for q, e in curve.group_order_factors().items():
+        Q1, a, Q2, b = _sylow_basis(curve, q, e, N // q ** e, rng)
+        n1 *= q ** a
+        n2 *= q ** b
+        P1 = curve._add(P1, Q1)
+        P2 = curve._add(P2, Q2)
+    return n1, n2, P1, P2
@@ -0,0 +1,96 @@
+"""
+Bounded, thread-safe LRU cache
+
+Shared by the ECC engine for precomputation that is expensive to build
+but reused across requests (e.g. per-point scalar multiplication tables).
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Least-recently-used mapping with a fixed maximum number of entries
+
+    Optionally also bounded by total weight, for caches whose entries vary
+    widely in size (point sets, lookup tables): weight(value) is summed
+    over the entries and the oldest are evicted while it exceeds max_weight.
+    """
+
+    def __init__(self, maxsize=128, max_weight=None, weight=None):
+        """
+        Args:
+            maxsize: Maximum number of entries kept before evicting the
+                     least recently used one
+            max_weight: Optional bound on the summed weight of all entries;
+                        a single value heavier than this is not kept
+            weight: Callable giving a value's weight (default 1 each)
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.max_weight = max_weight
+        self._weigh = weight or (lambda value: 1)
+        self._data = OrderedDict()
+        self._weights = {}
+        self._total_weight = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the cached value for key (marking it recently used) or default."""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def put(self, key, value):
+        """Insert or replace key, evicting the oldest entries when full."""
+        weight = self._weigh(value)
+        with self._lock:
+            self._total_weight += weight - self._weights.get(key, 0)
+            self._weights[key] = weight
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while self._data and (len(self._data) > self.maxsize or
+                                  (self.max_weight is not None and self._total_weight > self.max_weight)):
+                oldest, _ = self._data.popitem(last=False)
+                self._total_weight -= self._weights.pop(oldest)
+
+    def get_or_create(self, key, factory):
+        """
+        Return the cached value for key, building it with factory() on a miss
+
+        The factory runs outside the lock, so two threads missing on the same
+        key may both build it; the last one wins, which is harmless for the
+        pure precomputation stored here.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+            self._weights.clear()
+            self._total_weight = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    @property
+    def total_weight(self):
+        """Summed weight of the cached values."""
+        with self._lock:
+            return self._total_weight
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
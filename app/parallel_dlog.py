@@ -0,0 +1,142 @@
+"""
+Distinguished-point collision search across processes
+
+Parallel collision search (van Oorschot-Wiener): every walk follows the
+same r-adding iteration function, so walks that ever meet stay merged and
+reach the same distinguished point. Workers only report the distinguished
+points they meet; the parent keeps the one collision table and solves the
+logarithm from the first informative collision. Walk states travel with
+each chunk of work, so worker tasks are stateless and any free process in
+the pool can pick up the next chunk. With w workers the number of
+additions per second grows w-fold while the expected total stays about
+sqrt(pi*n/2), so the wall time falls almost linearly.
+"""
+
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+# Upper bound on the processes one search may use (the per-request core
+# budget is clipped to this).
+MAX_WORKERS = int(os.environ.get('DLP_MAX_WORKERS') or os.cpu_count() or 1)
+
+# Rounds per chunk handed to a worker, at least this many and about two
+# distinguished points per walk, to keep the pickling overhead small.
+CHUNK_MIN_ROUNDS = 256
+
+_POOL = None
+
+
+def _get_pool():
+    """The shared process pool, created on first use."""
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=MAX_WORKERS)
+    return _POOL
+
+
+def dp_parameters(curve, n):
+    """
+    Distinguishing bits and walks per worker for a group of order n
+
+    About n^(1/4) distinguished points get stored, and the walks waste
+    lanes * 2^d additions reaching their next one after a collision,
+    well below the sqrt(n) total.
+    """
+    bits = n.bit_length()
+    d = max(0, bits // 4 - 1)
+    lanes = max(1, min(curve.RHO_LANES, 1 << max(0, bits // 4 - 2)))
+    return d, lanes
+
+
+def _walk_chunk(curve, G, Q, n, walk, states, d, rounds, seed):
+    """Worker task: advance the walks; returns (states, dps, steps)."""
+    dps, steps = curve._rho_advance(G, Q, n, walk, states, d, rounds, random.Random(seed))
+    return states, dps, steps
+
+
+def collision_search(curve, G, Q, n, rng, max_steps, workers=1, progress=None):
+    """
+    Solve Q = k*G with distinguished-point rho walks
+
+    Args:
+        curve: EllipticCurve
+        G: Base point of order n, reduced mod p
+        Q: Target point, reduced mod p
+        n: Order of G
+        rng: Random source for the walk and the starting points
+        max_steps: Stop after about this many additions in total
+        workers: Processes to spread the walks over; 1 runs in-process
+        progress: Optional callable receiving the additions done so far
+
+    Returns:
+        tuple: (k, steps) with k in [1, n] or None if not found
+    """
+    workers = max(1, min(workers, MAX_WORKERS))
+    d, lanes = dp_parameters(curve, n)
+    walk = curve._rho_walk(G, Q, n, rng)
+
+    def fresh_walk():
+        return list(curve._rho_start(G, Q, n, rng)) + [0]
+
+    slots = [[fresh_walk() for _ in range(lanes)] for _ in range(workers)]
+    seen = {}
+    steps = 0
+    report_at = curve.PROGRESS_INTERVAL
+
+    def absorb(slot, dps):
+        """Record distinguished points; k on an informative collision."""
+        for i, R, a, b in dps:
+            other = seen.get(R)
+            if other is None:
+                seen[R] = (a, b)
+                continue
+            if other != (a, b):
+                k = curve._rho_solve(G, Q, n, a, b, *other)
+                if k is not None:
+                    return k
+            # Uninformative collision: move this walk somewhere new.
+            slots[slot][i] = fresh_walk()
+        return None
+
+    if workers == 1:
+        while steps < max_steps:
+            dps, done = curve._rho_advance(G, Q, n, walk, slots[0], d, 1, rng)
+            steps += done
+            k = absorb(0, dps)
+            if k is not None:
+                return k, steps
+            if progress is not None and steps >= report_at:
+                progress(steps)
+                report_at = steps + curve.PROGRESS_INTERVAL
+        return None, steps
+
+    pool = _get_pool()
+    rounds = max(CHUNK_MIN_ROUNDS, 2 << d)
+    futures = {}
+
+    def submit(slot):
+        future = pool.submit(_walk_chunk, curve, G, Q, n, walk, slots[slot], d, rounds,
+                             rng.getrandbits(64))
+        futures[future] = slot
+
+    for slot in range(workers):
+        submit(slot)
+    try:
+        while futures:
+            finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in finished:
+                slot = futures.pop(future)
+                slots[slot], dps, done = future.result()
+                steps += done
+                k = absorb(slot, dps)
+                if k is not None:
+                    return k, steps
+                if progress is not None:
+                    progress(steps)
+                if steps < max_steps:
+                    submit(slot)
+        return None, steps
+    finally:
+        for future in futures:
+            future.cancel()
@@ -0,0 +1,465 @@
+"""
+Group order computation without enumerating the curve
+
+EllipticCurve.group_order() picks one of:
+
+- Mestre's baby-step giant-step search: random points on E and on its
+  quadratic twist pin #E down inside the Hasse interval
+  [p + 1 - 2*sqrt(p), p + 1 + 2*sqrt(p)] in O(p^(1/4)) group operations.
+- Schoof's algorithm: the Frobenius trace t is recovered modulo small
+  primes l from the action of Frobenius on the l-torsion, computed in
+  F_p[x] / (psi_l) with division polynomials, then combined by CRT.
+  Polynomial products use Kronecker substitution (packing a polynomial
+  into one big integer) so CPython's bigint multiplication does the work.
+
+Pure-Python Schoof only pays off for small l (the cost grows with the
+degree (l^2 - 1) / 2 of psi_l), so for large p the two are combined: t mod
+M from the first few primes restricts #E to one residue class mod M, and
+Mestre's search only visits that class, in O((sqrt(p) / M)^(1/2)) group
+operations. Both only touch O(1) points in memory.
+"""
+
+import math
+import random
+
+# Published group orders for standard curves (cofactor 1), keyed by
+# (a mod p, b mod p, p). Sizes this large are out of reach for pure-Python
+# Schoof within a request.
+SECP256K1_P = 2**256 - 2**32 - 977
+P256_P = 2**256 - 2**224 + 2**192 + 2**96 - 1
+KNOWN_ORDERS = {
+    (0, 7, SECP256K1_P):
+        0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141,
+    (P256_P - 3, 0x5AC635D8AA3A93E7B3EBBD55769886BC651D06B0CC53B0F63BCE3C3E27D2604B, P256_P):
+        0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551,
+}
+
+
+def hasse_interval(p):
+    """Return (lo, hi), the inclusive range that must contain #E(F_p)."""
+    r = math.isqrt(4 * p)  # floor(2 * sqrt(p))
+    return p + 1 - r, p + 1 + r
+
+
+# ----------------------------------------------------------------------
+# Mestre baby-step giant-step
+# ----------------------------------------------------------------------
+
+def _random_point(curve, rng):
+    """Uniform-ish random affine point: random x until x^3 + ax + b is a square."""
+    p = curve.p
+    while True:
+        x = rng.randrange(p)
+        roots = curve.field.sqrt(x * x * x + curve.a * x + curve.b)
+        if roots:
+            return (x, rng.choice(roots))
+
+
+def _hasse_multiples(curve, P, residue=0, modulus=1):
+    """
+    All N = residue (mod modulus) in the Hasse interval with N*P = O,
+    found by baby-step giant-step over the multiples of modulus * P
+
+    Returns:
+        tuple: ('set', candidates) or, when modulus * P has order r below
+               the baby step count, ('order', r) so the caller can filter
+               lazily (r divides ord(P), so r | N still holds)
+    """
+    lo, hi = hasse_interval(curve.p)
+    first = lo + (residue - lo) % modulus
+    m = math.isqrt(max(hi - first, 0) // modulus) + 1
+
+    S = curve.scalar_multiply(modulus, P, validate=False)
+    baby = {(None, None): 0}
+    for j, R in enumerate(curve.multiples(S, m - 1), 1):
+        if R == (None, None):
+            return 'order', j
+        baby[R] = j
+
+    # giant steps: (first + i*m*modulus) * P for i = 0, 1, ...
+    step = curve.scalar_multiply(m, S, validate=False)
+    G = curve.scalar_multiply(first, P, validate=False)
+    candidates = set()
+    base = first
+    while base - m * modulus < hi:
+        j = baby.get(G)
+        if j is not None and lo <= base - j * modulus <= hi:
+            candidates.add(base - j * modulus)
+        G = curve._add(G, step)
+        base += m * modulus
+    return 'set', candidates
+
+
+def mestre_order(curve, twist, max_points=64, residue=0, modulus=1):
+    """
+    Count points with Mestre's BSGS over E and its quadratic twist
+
+    Each random point P on E restricts #E to the multiples of ord(P) in the
+    Hasse interval; a point on the twist E' does the same for
+    #E' = 2p + 2 - #E. For p > 229 the intersection shrinks to one value
+    after a few points.
+
+    Args:
+        curve: EllipticCurve E
+        twist: EllipticCurve for the quadratic twist of E over the same p
+        max_points: Random points to try before giving up
+        residue, modulus: #E = residue (mod modulus), if known (see
+                          schoof_trace()); only that class is searched
+
+    Returns:
+        int: #E(F_p)
+    """
+    p = curve.p
+    rng = random.Random(f"{curve.a},{curve.b},{p}")
+    candidates = None
+
+    for attempt in range(max_points):
+        on_twist = attempt % 2 == 1
+        E = twist if on_twist else curve
+        # #E' = 2p + 2 - #E fixes the twist's residue class too.
+        r = (2 * p + 2 - residue) % modulus if on_twist else residue
+        kind, value = _hasse_multiples(E, _random_point(E, rng), r, modulus)
+        if kind == 'order':
+            if candidates is None:
+                continue  # too weak a constraint to materialize
+            if on_twist:
+                candidates = {N for N in candidates if (2 * p + 2 - N) % value == 0}
+            else:
+                candidates = {N for N in candidates if N % value == 0}
+        else:
+            if on_twist:
+                value = {2 * p + 2 - M for M in value}
+            candidates = value if candidates is None else candidates & value
+        if candidates is not None and len(candidates) == 1:
+            return candidates.pop()
+
+    raise RuntimeError(f"Point counting did not converge for {curve}")
+
+
+# ----------------------------------------------------------------------
+# Polynomial arithmetic over F_p (lists of coefficients, low degree first)
+# ----------------------------------------------------------------------
+
+def _trim(f):
+    while f and f[-1] == 0:
+        f.pop()
+    return f
+
+
+def _pack(f, width):
+    return int.from_bytes(b''.join(c.to_bytes(width, 'little') for c in f), 'little')
+
+
+def _poly_mul(f, g, p):
+    """Product of two polynomials via Kronecker substitution."""
+    if not f or not g:
+        return []
+    n = len(f) + len(g) - 1
+    width = (2 * p.bit_length() + min(len(f), len(g)).bit_length()) // 8 + 1
+    data = (_pack(f, width) * _pack(g, width)).to_bytes(width * n, 'little')
+    return _trim([int.from_bytes(data[i:i + width], 'little') % p
+                  for i in range(0, width * n, width)])
+
+
+def _poly_sub(f, g, p):
+    if len(f) < len(g):
+        f = f + [0] * (len(g) - len(f))
+    return _trim([(c - (g[i] if i < len(g) else 0)) % p for i, c in enumerate(f)])
+
+
+def _poly_scale(f, c, p):
+    return _trim([(c * x) % p for x in f])
+
+
+def _poly_divmod_naive(f, g, p):
+    """Remainder of f modulo g (schoolbook); used for gcds only."""
+    f = list(f)
+    inv = pow(g[-1], -1, p)
+    dg = len(g) - 1
+    while len(f) - 1 >= dg and f:
+        c = f[-1] * inv % p
+        shift = len(f) - 1 - dg
+        for i, gc in enumerate(g):
+            f[shift + i] = (f[shift + i] - c * gc) % p
+        _trim(f)
+    return f
+
+
+def _poly_gcd(f, g, p):
+    """Monic gcd of two polynomials."""
+    while g:
+        f, g = g, _poly_divmod_naive(f, g, p)
+    return _poly_scale(f, pow(f[-1], -1, p), p) if f else f
+
+
+def _series_inverse(f, n, p):
+    """g with f * g = 1 (mod x^n), by Newton iteration; f[0] must be non-zero."""
+    g = [pow(f[0], -1, p)]
+    k = 1
+    while k < n:
+        k = min(2 * k, n)
+        e = [(-c) % p for c in _poly_mul(f[:k], g, p)[:k]]
+        e += [0] * (k - len(e))
+        e[0] = (e[0] + 2) % p
+        g = _poly_mul(g, e, p)[:k]
+    return g
+
+
+class _QuotientRing:
+    """F_p[x] / (m) for a monic modulus m, with Barrett reduction."""
+
+    def __init__(self, m, p):
+        self.m = m
+        self.p = p
+        self.d = len(m) - 1
+        # Inverse of the reversed modulus, to read quotients off one product
+        self.m_rev_inv = _series_inverse(m[::-1], max(1, self.d - 1), p)
+
+    def reduce(self, f):
+        d, p = self.d, self.p
+        if len(f) <= d:
+            return f
+        nq = len(f) - d
+        if nq > len(self.m_rev_inv):
+            # Only inputs longer than a product of two residues (e.g. the
+            # curve cubic after the modulus split below degree 3).
+            return _poly_divmod_naive(f, self.m, p)
+        q = _poly_mul(f[::-1][:nq], self.m_rev_inv[:nq], p)[:nq]
+        q = q + [0] * (nq - len(q))
+        qm = _poly_mul(q[::-1], self.m, p)
+        return _poly_sub(f[:d], qm[:d], p)
+
+    def mul(self, f, g):
+        return self.reduce(_poly_mul(f, g, self.p))
+
+    def pow(self, f, e):
+        result = [1]
+        base = self.reduce(f)
+        while e:
+            if e & 1:
+                result = self.mul(result, base)
+            e >>= 1
+            if e:
+                base = self.mul(base, base)
+        return result
+
+    def sub(self, f, g):
+        return _poly_sub(f, g, self.p)
+
+    def add(self, f, g):
+        return self.sub(f, [(-c) % self.p for c in g])
+
+
+# ----------------------------------------------------------------------
+# Schoof
+# ----------------------------------------------------------------------
+
+class _SplitModulus(Exception):
+    """A non-trivial factor of the current modulus showed up; restart with it."""
+
+    def __init__(self, factor):
+        super().__init__()
+        self.factor = factor
+
+
+def _division_polynomials(a, b, p, n_max):
+    """
+    f_0 .. f_n_max with psi_n = f_n (n odd) and psi_n = y * f_n (n even)
+
+    Uses y^2 = F(x) = x^3 + ax + b to keep every f_n in F_p[x].
+    """
+    F = _trim([b % p, a % p, 0, 1])
+    F2 = _poly_mul(F, F, p)
+    mul = lambda f, g: _poly_mul(f, g, p)
+    f = [[], [1], [2],
+         _trim([(-a * a) % p, 12 * b % p, 6 * a % p, 0, 3]),
+         _poly_scale(_trim([(-8 * b * b - a ** 3) % p, (-4 * a * b) % p, (-5 * a * a) % p,
+                            20 * b % p, 5 * a % p, 0, 1]), 4, p)]
+    half = pow(2, -1, p)
+    for n in range(5, n_max + 1):
+        m = n // 2
+        if n % 2:
+            t1 = mul(f[m + 2], mul(f[m], mul(f[m], f[m])))
+            t2 = mul(f[m - 1], mul(f[m + 1], mul(f[m + 1], f[m + 1])))
+            if m % 2 == 0:
+                t1 = mul(t1, F2)
+            else:
+                t2 = mul(t2, F2)
+            f.append(_poly_sub(t1, t2, p))
+        else:
+            t1 = mul(f[m + 2], mul(f[m - 1], f[m - 1]))
+            t2 = mul(f[m - 2], mul(f[m + 1], f[m + 1]))
+            f.append(_poly_scale(mul(f[m], _poly_sub(t1, t2, p)), half, p))
+    return f
+
+
+class _TorsionArithmetic:
+    """
+    Projective point arithmetic on E[l] over R = F_p[x] / (m)
+
+    A point is (X, Y, Z) meaning x = X / Z and y = y0 * Y / Z, where y0 is
+    the generic point's y (y0^2 = F). Keeping y0 symbolic lets every
+    coordinate live in R, and projective formulas avoid inversions in R.
+    """
+
+    def __init__(self, ring, a, F):
+        self.R = ring
+        self.a = a
+        self.F = ring.reduce(F)
+
+    def add(self, P1, P2):
+        """P1 + P2 for points that are distinct and not opposite everywhere."""
+        R, mul = self.R, self.R.mul
+        X1, Y1, Z1 = P1
+        X2, Y2, Z2 = P2
+        Z1Z2 = mul(Z1, Z2)
+        u = R.sub(mul(Y2, Z1), mul(Y1, Z2))
+        v = R.sub(mul(X2, Z1), mul(X1, Z2))
+        vv = mul(v, v)
+        vvv = mul(v, vv)
+        Rv = mul(vv, mul(X1, Z2))
+        A = R.sub(R.sub(mul(mul(self.F, mul(u, u)), Z1Z2), vvv), R.add(Rv, Rv))
+        X3 = mul(v, A)
+        Y3 = R.sub(mul(u, R.sub(Rv, A)), mul(vvv, mul(Y1, Z2)))
+        Z3 = mul(vvv, Z1Z2)
+        return (X3, Y3, Z3)
+
+    def double(self, P):
+        R, mul, p = self.R, self.R.mul, self.R.p
+        X, Y, Z = P
+        XX = mul(X, X)
+        ZZ = mul(Z, Z)
+        w = R.add(_poly_scale(ZZ, self.a, p), _poly_scale(XX, 3, p))
+        s = _poly_scale(mul(Y, Z), 2, p)
+        Rr = mul(self.F, mul(Y, s))
+        RR = mul(Rr, Rr)
+        B = R.sub(R.sub(mul(R.add(X, Rr), R.add(X, Rr)), XX), RR)
+        h = R.sub(mul(w, w), R.add(B, B))
+        ss = mul(s, s)
+        X3 = mul(self.F, mul(h, s))
+        Y3 = R.sub(mul(w, R.sub(B, h)), R.add(RR, RR))
+        Z3 = mul(mul(self.F, self.F), mul(s, ss))
+        return (X3, Y3, Z3)
+
+    def multiply(self, k, P):
+        """k * P for 1 <= k < l (no intermediate multiple can degenerate)."""
+        result = P
+        for bit in bin(k)[3:]:
+            result = self.double(result)
+            if bit == '1':
+                result = self.add(result, P)
+        return result
+
+    def same_x(self, P1, P2):
+        return self.R.sub(self.R.mul(P1[0], P2[2]), self.R.mul(P2[0], P1[2])) == []
+
+    def same_y(self, P1, P2):
+        return self.R.sub(self.R.mul(P1[1], P2[2]), self.R.mul(P2[1], P1[2])) == []
+
+
+def _trace_mod_l(a, b, p, l, psi):
+    """Frobenius trace t mod odd prime l, from pi^2 + (p mod l) = t * pi on E[l]."""
+    F = _trim([b % p, a % p, 0, 1])
+    modulus = _poly_scale(psi, pow(psi[-1], -1, p), p)
+    while True:
+        try:
+            return _trace_mod_l_in(a, p, l, modulus, F)
+        except _SplitModulus as split:
+            modulus = split.factor
+
+
+def _trace_mod_l_in(a, p, l, modulus, F):
+    ring = _QuotientRing(modulus, p)
+    E = _TorsionArithmetic(ring, a % p, F)
+
+    Fm = ring.reduce(F)
+    xp = ring.pow([0, 1], p)
+    yp = ring.pow(Fm, (p - 1) // 2)          # y^p = y0 * F^((p-1)/2)
+    xp2 = ring.pow(xp, p)
+    yp2 = ring.mul(yp, ring.pow(yp, p))      # Frobenius applied twice
+    pi = (xp, yp, [1])
+    pi2 = (xp2, yp2, [1])
+
+    q = E.multiply(p % l, ([0, 1], [1], [1]))
+
+    # S = pi^2 P + (p mod l) P, splitting the modulus if the points
+    # coincide (or cancel) on only part of E[l].
+    v = ring.sub(ring.mul(q[0], pi2[2]), ring.mul(pi2[0], q[2]))
+    if v == []:
+        u = ring.sub(ring.mul(q[1], pi2[2]), ring.mul(pi2[1], q[2]))
+        if u == []:
+            S = E.double(pi2)
+        elif ring.add(ring.mul(q[1], pi2[2]), ring.mul(pi2[1], q[2])) == []:
+            return 0
+        else:
+            raise _SplitModulus(_poly_gcd(modulus, u, p))
+    else:
+        g = _poly_gcd(modulus, v, p)
+        if len(g) > 1:
+            raise _SplitModulus(g)
+        S = E.add(pi2, q)
+
+    T = pi
+    for tau in range(1, (l - 1) // 2 + 1):
+        if tau == 2:
+            T = E.double(pi)
+        elif tau > 2:
+            T = E.add(T, pi)
+        if E.same_x(T, S):
+            return tau if E.same_y(T, S) else l - tau
+    raise RuntimeError(f"Schoof: no trace found modulo {l}")
+
+
+def schoof_trace(a, b, p, bound):
+    """
+    Frobenius trace of y^2 = x^3 + ax + b (p > 3) modulo small primes
+
+    Args:
+        a, b, p: Curve parameters
+        bound: Primes 2, 3, 5, ... (skipping p) are used until their
+               product M exceeds this
+
+    Returns:
+        tuple: (t mod M, M)
+    """
+    a %= p
+    b %= p
+
+    # t mod 2: #E is even iff x^3 + ax + b has a root in F_p
+    F = _trim([b, a, 0, 1])
+    xp = _QuotientRing(F, p).pow([0, 1], p)
+    has_root = len(_poly_gcd(F, _poly_sub(xp, [0, 1], p), p)) > 1
+    residues, moduli = [0 if has_root else 1], [2]
+
+    primes = []
+    product, l = 2, 3
+    while product <= bound:
+        if all(l % q for q in primes) and l != p:
+            primes.append(l)
+            product *= l
+        l += 2
+
+    psi = _division_polynomials(a, b, p, max(primes, default=4))
+    for l in primes:
+        residues.append(_trace_mod_l(a, b, p, l, psi[l]))
+        moduli.append(l)
+
+    t = 0
+    for r, m in zip(residues, moduli):
+        n = product // m
+        t += r * n * pow(n, -1, m)
+    return t % product, product
+
+
+def schoof_order(a, b, p):
+    """
+    #E(F_p) for y^2 = x^3 + ax + b with Schoof's algorithm (p > 3)
+
+    Returns:
+        int: p + 1 - t
+    """
+    # |t| <= 2 sqrt(p), so t mod M > 4 sqrt(p) pins it down.
+    t, product = schoof_trace(a, b, p, 4 * math.isqrt(p) + 4)
+    if t > product // 2:
+        t -= product
+    return p + 1 - t
@@ -0,0 +1,258 @@
+"""
+Fast point enumeration strategies for EllipticCurve.find_all_points
+
+Two engines replace the per-x Tonelli-Shanks loop:
+
+- Square-root tables (p <= SQRT_TABLE_MAX_P): one pass over y fills a
+  compact array mapping each residue n = y^2 mod p to its root. Tables are
+  cached per p, so every curve on the same field reuses them and
+  enumeration becomes a lookup per x.
+- Vectorized Tonelli-Shanks (NumPy, larger p): evaluates x^3 + ax + b for
+  every x at once, tests residuosity with a batched Euler criterion and
+  takes roots with a batched Tonelli-Shanks.
+
+Both return the root EllipticCurve.tonelli_shanks lists first, so the
+point list is identical to the pure-Python enumeration, order included.
+Results come back as a PointSet, filled straight from the arrays.
+NumPy is optional: without it the tables are built and scanned in plain
+Python, and larger p fall back to the per-x loop.
+"""
+
+from array import array
+
+from .lru_cache import LRUCache
+from .point_set import PointSet
+from .prime_field import get_prime_field
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+# Residues are < p and products of two of them must fit in int64 with
+# headroom for the additions in the curve equation.
+NUMPY_MAX_P = 2**31
+
+# Below this size the array setup costs more than the Python loop.
+NUMPY_MIN_P = 1024
+
+# x values evaluated per vectorized block: keeps the temporaries to some
+# tens of MB instead of several int64 arrays the size of the field.
+NUMPY_CHUNK = 2**20
+
+# Largest p served from a square-root table (4 bytes per residue class).
+SQRT_TABLE_MAX_P = 2**22
+
+# Square-root tables keyed by p; each holds p int32 entries.
+_SQRT_TABLES = LRUCache(maxsize=4)
+
+
+def numpy_available(p):
+    """Return True if the vectorized enumeration can handle modulus p."""
+    return np is not None and NUMPY_MIN_P <= p <= NUMPY_MAX_P
+
+
+def sqrt_table_available(p):
+    """Return True if modulus p is enumerated from a square-root table."""
+    return 3 <= p <= SQRT_TABLE_MAX_P
+
+
+def _pow_vec(base, e, p):
+    """Elementwise base^e mod p for an int64 array and a scalar exponent."""
+    result = np.ones_like(base)
+    base = base.copy()
+    while e:
+        if e & 1:
+            result = result * base % p
+        base = base * base % p
+        e >>= 1
+    return result
+
+
+def _sqrt_vec(n, p):
+    """
+    Square roots of the non-zero quadratic residues n (mod p)
+
+    Returns the same root the scalar Tonelli-Shanks returns first, so the
+    second root is always p - r.
+    """
+    if p % 4 == 3:
+        return _pow_vec(n, (p + 1) // 4, p)
+
+    field = get_prime_field(p)
+    Q, S = field.Q, field.S
+
+    M = np.full(n.shape, S, dtype=np.int64)
+    c = np.full(n.shape, field.c, dtype=np.int64)
+    t = _pow_vec(n, Q, p)
+    R = _pow_vec(n, (Q + 1) // 2, p)
+
+    active = np.flatnonzero(t != 1)
+    while active.size:
+        tt = t[active]
+        Mi = M[active]
+
+        # Lowest i >= 1 with tt^(2^i) == 1, capped at M
+        i = np.ones_like(tt)
+        temp = tt * tt % p
+        while True:
+            step = (temp != 1) & (i < Mi)
+            if not step.any():
+                break
+            temp = np.where(step, temp * temp % p, temp)
+            i += step
+
+        # b = c^(2^(M - i - 1)), with a per-element number of squarings
+        e = Mi - i - 1
+        b = c[active]
+        for j in range(int(e.max())):
+            b = np.where(j < e, b * b % p, b)
+
+        b2 = b * b % p
+        M[active] = i
+        c[active] = b2
+        t[active] = tt * b2 % p
+        R[active] = R[active] * b % p
+        active = active[t[active] != 1]
+    return R
+
+
+def _assemble_points(x, rhs, roots, p, xs=None, ys=None):
+    """
+    Turn per-x roots into the find_all_points PointSet
+
+    Args:
+        x: Array of increasing x-coordinates
+        rhs: x^3 + ax + b (mod p) for each x
+        roots: First square root of each rhs, -1 for non-residues
+        p: Prime modulus
+        xs, ys: Coordinate arrays to extend, for blocks of x
+    """
+    zero = rhs == 0
+    residue = roots > 0
+    xs_zero = x[zero]
+    xs_res = x[residue]
+    r = roots[residue].astype(np.int64)
+
+    # Order by x, and within an x by root slot (r before p - r).
+    px = np.concatenate([xs_zero, xs_res, xs_res])
+    py = np.concatenate([np.zeros_like(xs_zero), r, p - r])
+    slot = np.concatenate([np.zeros_like(xs_zero), np.zeros_like(xs_res), np.ones_like(xs_res)])
+    order = np.argsort(px * 2 + slot, kind='stable')
+
+    if xs is None:
+        xs, ys = array('q'), array('q')
+    xs.frombytes(px[order].astype(np.int64).tobytes())
+    ys.frombytes(py[order].astype(np.int64).tobytes())
+    return PointSet(xs, ys)
+
+
+def _curve_rhs(a, b, p, start=0, stop=None):
+    """Return (x, x^3 + ax + b mod p) as int64 arrays over x in [start, stop) (default all of F_p)."""
+    x = np.arange(start, p if stop is None else stop, dtype=np.int64)
+    return x, (x * x % p * x % p + a * x % p + b) % p
+
+
+def enumerate_points_numpy(a, b, p):
+    """
+    All points of y^2 = x^3 + ax + b over F_p, in find_all_points order
+
+    Args:
+        a: Curve coefficient, already reduced mod p
+        b: Curve constant, already reduced mod p
+        p: Prime modulus with numpy_available(p)
+
+    Returns:
+        PointSet: The point at infinity followed by the finite points,
+                  sorted by x with roots in Tonelli-Shanks order
+    """
+    xs, ys = array('q'), array('q')
+    for start in range(0, p, NUMPY_CHUNK):
+        x, rhs = _curve_rhs(a, b, p, start, min(start + NUMPY_CHUNK, p))
+        residue = _pow_vec(rhs, (p - 1) // 2, p) == 1
+        roots = np.full(x.size, -1, dtype=np.int64)
+        roots[residue] = _sqrt_vec(rhs[residue], p)
+        _assemble_points(x, rhs, roots, p, xs, ys)
+    return PointSet(xs, ys)
+
+
+def sqrt_table(p, tonelli_shanks):
+    """
+    Square-root table for odd prime p, built once and cached per p
+
+    Entry n holds the first root tonelli_shanks(n) returns (0 for n = 0)
+    or -1 if n is a non-residue.
+
+    Args:
+        p: Odd prime with sqrt_table_available(p)
+        tonelli_shanks: Scalar square-root function for F_p, used only
+                        without NumPy when p = 1 (mod 4)
+
+    Returns:
+        array: Typed array('i') of length p
+    """
+    def build():
+        table = array('i', [-1]) * p
+        table[0] = 0
+        half = (p + 1) // 2
+
+        if np is not None:
+            view = np.frombuffer(table, dtype=np.int32)
+            y = np.arange(1, half, dtype=np.int64)
+            n = y * y % p
+            if p % 4 == 3:
+                # The root n^((p+1)/4) is the one of {y, p - y} that is
+                # itself a square; -1 is a non-residue, so exactly one is.
+                view[n] = y
+                view[n] = np.where(view[y] != -1, y, p - y)
+            else:
+                view[n] = _sqrt_vec(n, p)
+            return table
+
+        for y in range(1, half):
+            table[y * y % p] = y
+        if p % 4 == 3:
+            for y in range(1, half):
+                if table[y] == -1:
+                    table[y * y % p] = p - y
+        else:
+            for n in range(1, p):
+                if table[n] != -1:
+                    table[n] = tonelli_shanks(n)[0]
+        return table
+
+    return _SQRT_TABLES.get_or_create(p, build)
+
+
+def cached_sqrt_table(p):
+    """Return the square-root table for p if one is already cached, else None."""
+    return _SQRT_TABLES.get(p)
+
+
+def enumerate_points_table(a, b, p, table):
+    """
+    All points of y^2 = x^3 + ax + b over F_p using a square-root table
+
+    Args:
+        a: Curve coefficient, already reduced mod p
+        b: Curve constant, already reduced mod p
+        p: Prime modulus with sqrt_table_available(p)
+        table: sqrt_table(p, ...) for the same p
+
+    Returns:
+        PointSet: Same points, in the same order, as find_all_points
+    """
+    if np is not None:
+        x, rhs = _curve_rhs(a, b, p)
+        return _assemble_points(x, rhs, np.frombuffer(table, dtype=np.int32)[rhs], p)
+
+    xs, ys = array('q'), array('q')
+    for x in range(p):
+        r = table[(x * x * x + a * x + b) % p]
+        if r == 0:
+            xs.append(x)
+            ys.append(0)
+        elif r > 0:
+            xs.extend((x, x))
+            ys.extend((r, p - r))
+    return PointSet(xs, ys)
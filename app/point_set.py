@@ -0,0 +1,164 @@
+"""
+Compact storage for large sets of curve points
+
+A list of (x, y) tuples costs ~100 bytes per point before any JSON
+formatting; PointSet keeps the coordinates in two typed arrays (16 bytes
+per point) and the point at infinity as a flag. It behaves like the
+find_all_points list -- O first, then finite points in enumeration order
+-- and serializes to JSON or CSV straight from the arrays.
+"""
+
+import bisect
+import json
+from array import array
+
+INFINITY = (None, None)
+
+
+class PointSet:
+    """
+    Read-only sequence of curve points backed by array('q') storage
+
+    Finite points must be sorted by x (as every enumeration engine
+    produces them), which makes membership a binary search. Slicing with
+    step 1 returns a PointSet viewing the same buffers without copying.
+    """
+
+    __slots__ = ('xs', 'ys', 'has_infinity')
+
+    def __init__(self, xs, ys, has_infinity=True):
+        """
+        Args:
+            xs: array('q') (or memoryview of one) of x-coordinates
+            ys: Matching y-coordinates, same length as xs
+            has_infinity: Whether the point at infinity leads the sequence
+        """
+        if len(xs) != len(ys):
+            raise ValueError("xs and ys must have the same length")
+        self.xs = memoryview(xs)
+        self.ys = memoryview(ys)
+        self.has_infinity = bool(has_infinity)
+
+    @classmethod
+    def from_points(cls, points):
+        """
+        Build a PointSet from (x, y) tuples
+
+        Args:
+            points: Iterable of points; (None, None) may only come first
+
+        Returns:
+            PointSet: Copy of the points in compact form
+        """
+        xs, ys = array('q'), array('q')
+        has_infinity = False
+        for pt in points:
+            if pt == INFINITY:
+                if has_infinity or xs:
+                    raise ValueError("The point at infinity may only appear first")
+                has_infinity = True
+                continue
+            xs.append(pt[0])
+            ys.append(pt[1])
+        return cls(xs, ys, has_infinity)
+
+    @property
+    def finite_count(self):
+        """Number of points other than the point at infinity."""
+        return len(self.xs)
+
+    def __len__(self):
+        return len(self.xs) + self.has_infinity
+
+    def __iter__(self):
+        if self.has_infinity:
+            yield INFINITY
+        yield from zip(self.xs, self.ys)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("PointSet slices must have step 1")
+            stop = max(stop, start)
+            offset = self.has_infinity
+            lo, hi = max(start - offset, 0), max(stop - offset, 0)
+            keep_infinity = self.has_infinity and start == 0 and stop > 0
+            return PointSet(self.xs[lo:hi], self.ys[lo:hi], keep_infinity)
+
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("PointSet index out of range")
+        if self.has_infinity:
+            if index == 0:
+                return INFINITY
+            index -= 1
+        return (self.xs[index], self.ys[index])
+
+    def __contains__(self, point):
+        if point == INFINITY:
+            return self.has_infinity
+        try:
+            x, y = point
+        except (TypeError, ValueError):
+            return False
+        i = bisect.bisect_left(self.xs, x)
+        while i < len(self.xs) and self.xs[i] == x:
+            if self.ys[i] == y:
+                return True
+            i += 1
+        return False
+
+    def __eq__(self, other):
+        if isinstance(other, PointSet):
+            return (self.has_infinity == other.has_infinity
+                    and self.xs == other.xs and self.ys == other.ys)
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"PointSet({len(self)} points)"
+
+    def iter_json(self):
+        """Yield each point as the JSON object the point-list API returns."""
+        if self.has_infinity:
+            yield '{"x": null, "y": null, "display": "O"}'
+        for x, y in zip(self.xs, self.ys):
+            yield f'{{"x": {x}, "y": {y}, "display": "({x}, {y})"}}'
+
+    def to_json(self):
+        """The whole set as a JSON array of {x, y, display} objects."""
+        return '[' + ', '.join(self.iter_json()) + ']'
+
+    def to_csv(self):
+        """The whole set as 'x,y' CSV, with the point at infinity as O,O."""
+        rows = ['x,y']
+        if self.has_infinity:
+            rows.append('O,O')
+        rows.extend(f"{x},{y}" for x, y in zip(self.xs, self.ys))
+        return '\n'.join(rows) + '\n'
+
+
+def format_point(point):
+    """The {x, y, display} dict for a single point (display 'O' for infinity)."""
+    if point == INFINITY:
+        return {'x': None, 'y': None, 'display': 'O'}
+    return {'x': point[0], 'y': point[1], 'display': f'({point[0]}, {point[1]})'}
+
+
+def dumps(payload):
+    """
+    json.dumps for response payloads that may contain PointSets
+
+    PointSet values (at any depth inside dicts) are written with
+    PointSet.to_json(), so no per-point dicts are ever built.
+    """
+    if isinstance(payload, PointSet):
+        return payload.to_json()
+    if isinstance(payload, dict):
+        return '{' + ', '.join(f'{json.dumps(str(key))}: {dumps(value)}'
+                               for key, value in payload.items()) + '}'
+    return json.dumps(payload)
@@ -0,0 +1,153 @@
+"""
+Per-prime field context shared by every curve over the same F_p
+
+Route handlers rebuild EllipticCurve objects on each request, usually with
+a fixed p and varying a, b. Everything that depends on p alone -- the
+primality verdict and the square-root constants -- lives here and is
+computed once per p.
+"""
+
+from .lru_cache import LRUCache
+
+_FIELDS = LRUCache(maxsize=256)
+
+
+def _is_prime(n):
+    """Miller-Rabin primality test with fixed bases (deterministic below 3.3e24)."""
+    # Quick checks for small numbers
+    if n < 2:
+        return False
+    small_primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37]
+    for sp in small_primes:
+        if n == sp:
+            return True
+        if n % sp == 0:
+            return False
+    # write n-1 = d * 2^s with d odd
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    def _check(a, d, n, s):
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            return True
+        for _ in range(s - 1):
+            x = (x * x) % n
+            if x == n - 1:
+                return True
+        return False
+
+    for a in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37):
+        if not _check(a % n, d, n, s):
+            return False
+    return True
+
+
+class PrimeField:
+    """
+    Constants of F_p shared across curves
+
+    Attributes:
+        p: Modulus
+        is_prime: Primality verdict for p
+        sqrt_method: 'p3mod4', 'p5mod8' or 'tonelli' (None unless p is an
+                     odd prime); picks the square-root fast path
+        Q, S: p - 1 = Q * 2^S with Q odd
+        z: Smallest quadratic non-residue
+        c: z^Q, the generator of the 2-Sylow subgroup used by Tonelli-Shanks
+    """
+
+    def __init__(self, p):
+        self.p = p
+        self.is_prime = _is_prime(p)
+        self.sqrt_method = None
+        self.Q = self.S = self.z = self.c = None
+
+        if not self.is_prime or p == 2:
+            return
+
+        Q, S = p - 1, 0
+        while Q % 2 == 0:
+            Q //= 2
+            S += 1
+        z = 2
+        while pow(z, (p - 1) // 2, p) != p - 1:
+            z += 1
+        self.Q, self.S, self.z = Q, S, z
+        self.c = pow(z, Q, p)
+
+        if p % 4 == 3:
+            self.sqrt_method = 'p3mod4'
+        elif p % 8 == 5:
+            self.sqrt_method = 'p5mod8'
+        else:
+            self.sqrt_method = 'tonelli'
+
+    def sqrt(self, n):
+        """
+        Square roots of n modulo p (Tonelli-Shanks with cached constants)
+
+        Each path costs a single modular exponentiation: the Legendre
+        symbol falls out of the same power instead of a separate Euler
+        test. Roots come back in the same order as the textbook algorithm.
+
+        Returns:
+            list: All square roots (empty if none exist, 2 roots or 1 if n=0)
+        """
+        p = self.p
+        n %= p
+        if n == 0:
+            return [0]
+        if p == 2:
+            return [n]
+
+        if self.sqrt_method == 'p3mod4':
+            R = pow(n, (p + 1) // 4, p)
+            if R * R % p != n:
+                return []
+            return [R, p - R]
+
+        # u = n^((Q-1)/2) gives R = n^((Q+1)/2) and t = n^Q = R^2 / n.
+        u = pow(n, (self.Q - 1) // 2, p)
+        R = u * n % p
+        t = u * R % p
+
+        if self.sqrt_method == 'p5mod8':
+            # S = 2, so t = +-1 and one Tonelli-Shanks step fixes the sign.
+            if t == 1:
+                return [R, p - R]
+            if t != p - 1:
+                return []
+            R = R * self.c % p
+            return [R, p - R]
+
+        # Legendre symbol: t^(2^(S-1)) = n^((p-1)/2)
+        legendre = t
+        for _ in range(self.S - 1):
+            legendre = legendre * legendre % p
+        if legendre != 1:
+            return []
+
+        M, c = self.S, self.c
+        while t != 1:
+            # Find lowest i such that t^(2^i) = 1
+            i = 1
+            temp = t * t % p
+            while temp != 1 and i < M:
+                temp = temp * temp % p
+                i += 1
+
+            b = pow(c, 1 << (M - i - 1), p)
+            M = i
+            c = b * b % p
+            t = t * c % p
+            R = R * b % p
+        return [R, p - R]
+
+
+def get_prime_field(p):
+    """Return the shared PrimeField for modulus p, building it on first use."""
+    return _FIELDS.get_or_create(p, lambda: PrimeField(p))
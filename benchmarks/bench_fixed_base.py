@@ -0,0 +1,54 @@
+"""
+Benchmark: fixed-base tables vs. the ladder for a reused generator
+
+Times secret k*G with the default secret=True method (the x-only ladder)
+against the 'fixed_base' method, which reads one addition per window from a
+per-(curve, generator) table with a masked full-row scan and performs no
+doublings. The one-off table build is reported separately.
+
+Usage:
+    python -m benchmarks.bench_fixed_base [--repeat N]
+"""
+
+import argparse
+import random
+import time
+
+from app.elliptic_curve import EllipticCurve, _FIXED_BASE_TABLES
+from benchmarks.bench_scalar_multiply import CURVES, find_point
+
+
+def _time(fn, scalars):
+    start = time.perf_counter()
+    for k in scalars:
+        fn(k)
+    return (time.perf_counter() - start) / len(scalars)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50, help="scalars per curve")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    print(f"{'curve':<22}{'table (ms)':>12}{'ladder (ms)':>12}{'fixed (ms)':>12}{'speedup':>10}")
+    for label, a, b, p in CURVES:
+        curve = EllipticCurve(a, b, p)
+        G = find_point(curve)
+        scalars = [rng.randrange(1, p) for _ in range(args.repeat)]
+
+        _FIXED_BASE_TABLES.clear()
+        start = time.perf_counter()
+        curve.scalar_multiply(1, G, method='fixed_base')
+        build = time.perf_counter() - start
+
+        for k in scalars[:3]:
+            assert curve.scalar_multiply(k, G, method='fixed_base', secret=True) == curve.scalar_multiply(k, G)
+
+        ladder = _time(lambda k: curve.scalar_multiply(k, G, secret=True), scalars)
+        fixed = _time(lambda k: curve.scalar_multiply(k, G, method='fixed_base', secret=True), scalars)
+        print(f"{label:<22}{build * 1e3:>12.3f}{ladder * 1e3:>12.3f}{fixed * 1e3:>12.3f}{ladder / fixed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark: Montgomery ladders vs. double-and-add
+
+Throughput: mean time of k*P with random full-length scalars for
+double-and-add ('binary'), the Jacobian Montgomery ladder ('ladder') and
+the x-only ladder ('xladder', the secret=True default).
+
+Uniformity: mean time for sparse scalars (top bit only, Hamming weight 1)
+over dense scalars (all bits set) of the same length. Double-and-add
+skips the addition for zero bits, so its ratio is well below 1; the
+ladders do the same work for every bit and stay close to 1.
+
+Usage:
+    python -m benchmarks.bench_ladder [--repeat N]
+"""
+
+import argparse
+import random
+import time
+
+from app.elliptic_curve import EllipticCurve
+from benchmarks.bench_scalar_multiply import CURVES, find_point
+
+METHODS = ('binary', 'ladder', 'xladder')
+
+
+def _time(fn, scalars):
+    start = time.perf_counter()
+    for k in scalars:
+        fn(k)
+    return (time.perf_counter() - start) / len(scalars)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20, help="scalars per curve and method")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    header = ''.join(f"{m + ' (ms)':>15}" for m in METHODS)
+    ratios = ''.join(f"{m + ' s/d':>15}" for m in METHODS)
+    print(f"{'curve':<22}{header}{ratios}")
+    for label, a, b, p in CURVES:
+        curve = EllipticCurve(a, b, p)
+        P = find_point(curve)
+        bits = p.bit_length()
+        scalars = [rng.randrange(1 << (bits - 1), 1 << bits) for _ in range(args.repeat)]
+        sparse = [1 << (bits - 1)] * args.repeat
+        dense = [(1 << bits) - 1] * args.repeat
+
+        for k in scalars[:3]:
+            expected = curve.scalar_multiply(k, P, method='binary')
+            for method in METHODS[1:]:
+                assert curve.scalar_multiply(k, P, method=method) == expected
+
+        row, uniformity = '', ''
+        for method in METHODS:
+            def run(k, method=method):
+                curve.scalar_multiply(k, P, validate=False, method=method)
+            row += f"{_time(run, scalars) * 1e3:>15.3f}"
+            uniformity += f"{_time(run, sparse) / _time(run, dense):>15.2f}"
+        print(f"{label:<22}{row}{uniformity}")
+
+
+if __name__ == "__main__":
+    main()
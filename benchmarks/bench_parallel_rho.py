@@ -0,0 +1,71 @@
+"""
+Benchmark: distinguished-point rho across worker processes
+
+Solves the same batch of discrete logarithms in a prime-order group with
+1, 2, 4, ... worker processes (up to the machine's core count, or
+--max-workers) and reports the mean wall time, the additions per second
+and the speedup over one worker. The expected number of additions does
+not depend on the worker count, so the speedup tracks the added
+throughput and should stay close to linear while there are idle cores.
+
+Usage:
+    python -m benchmarks.bench_parallel_rho [--bits {32,40}] [--repeat N] [--max-workers W]
+"""
+
+import argparse
+import os
+import random
+import time
+
+from app import parallel_dlog
+from app.elliptic_curve import EllipticCurve
+
+# Curves with prime group order: (a, b, p, #E).
+CURVES = {
+    32: (1, 13, 4294967291, 4295040499),
+    40: (1, 5, 1099511627689, 1099513388453),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bits", type=int, choices=sorted(CURVES), default=32, help="field size")
+    parser.add_argument("--repeat", type=int, default=5, help="logarithms per worker count")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1,
+                        help="largest worker count to try")
+    args = parser.parse_args()
+
+    parallel_dlog.MAX_WORKERS = max(parallel_dlog.MAX_WORKERS, args.max_workers)
+    a, b, p, n = CURVES[args.bits]
+    curve = EllipticCurve(a, b, p)
+    assert curve.group_order() == n
+    G = next(curve.iter_points())
+
+    rng = random.Random(1)
+    keys = [rng.randrange(1, n) for _ in range(args.repeat)]
+    targets = [curve.scalar_multiply(k, G) for k in keys]
+
+    counts = [1]
+    while counts[-1] * 2 <= args.max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != args.max_workers:
+        counts.append(args.max_workers)
+
+    print(f"{args.bits}-bit group, {args.repeat} logarithms per row")
+    print(f"{'workers':>8}{'time (s)':>12}{'adds/s':>14}{'speedup':>10}")
+    baseline = None
+    for workers in counts:
+        start = time.perf_counter()
+        steps = 0
+        for seed, (k, Q) in enumerate(zip(keys, targets)):
+            result = curve.discrete_log_rho(G, Q, order=n, cycle='distinguished', seed=seed,
+                                            validate=False, workers=workers)
+            assert result['k'] == k
+            steps += result['steps']
+        elapsed = (time.perf_counter() - start) / args.repeat
+        baseline = baseline or elapsed
+        print(f"{workers:>8}{elapsed:>12.3f}{steps / args.repeat / elapsed:>14.0f}{baseline / elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
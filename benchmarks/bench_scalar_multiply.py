@@ -0,0 +1,78 @@
+"""
+Benchmark: affine vs. Jacobian scalar multiplication
+
+Compares the original affine double-and-add (one modular inversion per
+group operation) against EllipticCurve.scalar_multiply, which runs in
+Jacobian coordinates and inverts only once at the end.
+
+Usage:
+    python -m benchmarks.bench_scalar_multiply [--repeat N]
+"""
+
+import argparse
+import random
+import time
+
+from app.elliptic_curve import EllipticCurve
+
+# (label, a, b, p) -- primes of increasing bit length
+CURVES = [
+    ("16-bit", 2, 3, 65521),
+    ("32-bit", 2, 3, 4294967291),
+    ("64-bit", 2, 3, 18446744073709551557),
+    ("127-bit", 2, 3, 2**127 - 1),
+    ("256-bit (secp256k1)", 0, 7, 2**256 - 2**32 - 977),
+]
+
+
+def find_point(curve):
+    """Return the first affine point on the curve with a non-zero y."""
+    x = 1
+    while True:
+        roots = curve.tonelli_shanks(x**3 + curve.a * x + curve.b)
+        if roots and roots[0] != 0:
+            return (x, roots[0])
+        x += 1
+
+
+def affine_scalar_multiply(curve, k, P):
+    """Reference right-to-left double-and-add on affine tuples."""
+    result = (None, None)
+    addend = P
+    while k:
+        if k & 1:
+            result = curve.add_points(result, addend)
+        addend = curve.add_points(addend, addend)
+        k >>= 1
+    return result
+
+
+def _time(fn, scalars):
+    start = time.perf_counter()
+    for k in scalars:
+        fn(k)
+    return (time.perf_counter() - start) / len(scalars)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20, help="scalars per curve")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    print(f"{'curve':<22}{'affine (ms)':>14}{'jacobian (ms)':>16}{'speedup':>10}")
+    for label, a, b, p in CURVES:
+        curve = EllipticCurve(a, b, p)
+        P = find_point(curve)
+        scalars = [rng.randrange(1, p) for _ in range(args.repeat)]
+
+        for k in scalars[:3]:
+            assert affine_scalar_multiply(curve, k, P) == curve.scalar_multiply(k, P)
+
+        affine = _time(lambda k: affine_scalar_multiply(curve, k, P), scalars)
+        jacobian = _time(lambda k: curve.scalar_multiply(k, P), scalars)
+        print(f"{label:<22}{affine * 1e3:>14.3f}{jacobian * 1e3:>16.3f}{affine / jacobian:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
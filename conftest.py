@@ -0,0 +1,15 @@
+"""Run the test suite against a throwaway database, never the checked-out app.db."""
+
+import os
+import tempfile
+
+# db_helpers reads DB_PATH when the app package is first imported, which
+# creates the app and its schema, so this has to be set before any test
+# module is collected.
+_handle, _path = tempfile.mkstemp(prefix='ecc-test-', suffix='.db')
+os.close(_handle)
+os.environ['DB_PATH'] = _path
+
+
+def pytest_unconfigure(config):
+    os.remove(_path)
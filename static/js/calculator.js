@@ -958,6 +958,29 @@
             }
         }
 
+        // Read a streamed (NDJSON) response, calling onRecord for each line as
+        // it arrives. A plain JSON reply (validation errors are sent before
+        // any streaming starts) is passed on as a single record.
+        async function readNdjson(response, onRecord) {
+            if (!(response.headers.get('Content-Type') || '').includes('ndjson')) {
+                const data = await response.json();
+                onRecord({type: data.success ? 'result' : 'error', ...data});
+                return;
+            }
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffered = '';
+            for (;;) {
+                const {done, value} = await reader.read();
+                buffered += decoder.decode(value || new Uint8Array(), {stream: !done});
+                const lines = buffered.split('\n');
+                buffered = lines.pop();
+                lines.filter(line => line.trim()).forEach(line => onRecord(JSON.parse(line)));
+                if (done) break;
+            }
+            if (buffered.trim()) onRecord(JSON.parse(buffered));
+        }
+
         // NO IMPLEMENTATION CODE HERE!
         // All calculations are done by the backend
 
@@ -1405,14 +1428,28 @@
                         b: currentCurve.b,
                         p: currentCurve.p,
                         k: k,
-                        point: currentPoints[pointIndex]
+                        point: currentPoints[pointIndex],
+                        stream: true
                     })
                 });
-
-                const data = await response.json();
                 hideLoading();
 
-                if (data.success) {
+                // Show the steps as they are streamed, then the full result.
+                const steps = [];
+                let data = null;
+                resultDiv.innerHTML = '<div class="steps-container"></div>';
+                const liveSteps = resultDiv.querySelector('.steps-container');
+                await readNdjson(response, record => {
+                    if (record.type === 'step') {
+                        steps.push(record.text);
+                        liveSteps.insertAdjacentHTML('beforeend',
+                            `<div class="step-item"><div class="step-header"><span>Step ${steps.length}: ${record.text}</span></div></div>`);
+                    } else {
+                        data = {...record, steps};
+                    }
+                });
+
+                if (data && data.success) {
                     // Show only final result coordinates
                     const resultText = `P = ${currentPoints[pointIndex].display}, k = ${k}, ${k} × P = ${data.result.display}`;
                     let stepsHtml = '';
@@ -1454,7 +1491,7 @@
                     const scalarVisible = document.getElementById('scalarToggleStepsBtn')?.getAttribute('data-visible') !== 'false';
                     applyStepsVisibility('scalar', scalarVisible);
                 } else {
-                    resultDiv.innerHTML = `<div class="error">${data.error}</div>`;
+                    resultDiv.innerHTML = `<div class="error">${data ? data.error : 'Empty response'}</div>`;
                 }
             } catch (error) {
                 hideLoading();
@@ -7445,6 +7482,37 @@ function getOperationIcon(type){
         }
         }
 
+        function dlogAttemptRowHtml(attempt, idx) {
+        const isFound = attempt.found;
+        const isSecret = attempt.k_attempt === dlogPrivateKey;
+        const resultPoint = `(${attempt.result_x}, ${attempt.result_y})`;
+
+        let bgColor = 'transparent';
+        let borderColor = 'transparent';
+        let textColor = '#666';
+
+        if (isFound) {
+            bgColor = 'rgba(239, 68, 68, 0.15)';
+            borderColor = '#dc2626';
+            textColor = '#dc2626';
+        } else if (isSecret) {
+            bgColor = 'rgba(249, 115, 22, 0.15)';
+            borderColor = '#ea580c';
+            textColor = '#ea580c';
+        }
+
+        return `
+            <div style="padding: 10px; background: ${bgColor}; border-left: 3px solid ${borderColor}; display: grid; grid-template-columns: 60px 80px 200px 80px; gap: 10px; align-items: center; font-size: 0.85em; font-family: monospace; border-bottom: 1px solid #e5e7eb;">
+                <div style="font-weight: 600;">${idx + 1}</div>
+                <div style="color: ${textColor}; font-weight: 600;">${attempt.k_attempt}</div>
+                <div style="color: #666; word-break: break-all;">${resultPoint}</div>
+                <div style="font-weight: 600; color: ${textColor};">
+                    ${isFound ? '✓ FOUND' : isSecret ? '⚡ Secret' : '✗'}
+                </div>
+            </div>
+        `;
+        }
+
         async function bruteForceDiscreteLog() {
         console.log('[Discrete Log] Step 3: Launching attack', { dlogCurrentCurve, dlogBasePoint, dlogPublicKey, dlogPrivateKey });
         if (!dlogCurrentCurve || !dlogBasePoint || !dlogPublicKey) {
@@ -7462,6 +7530,7 @@ function getOperationIcon(type){
         resultDiv.innerHTML = '';
         stepsDiv.innerHTML = '<div style="text-align: center; padding: 20px; color: var(--text-muted);">Searching for k...</div>';
 
+        // Attempts arrive as NDJSON lines while the server computes them.
         const response = await fetch('/api/discrete_log_solve', {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
@@ -7473,22 +7542,80 @@ function getOperationIcon(type){
                 gy: dlogBasePoint.y,
                 qx: dlogPublicKey.x,
                 qy: dlogPublicKey.y,
-                use_bsgs: useBsgs
+                use_bsgs: useBsgs,
+                stream: true
             })
         });
-
-        const data = await response.json();
         hideLoading();
 
-        if (!data.success) {
-            showToast(data.error || 'Attack failed', 'error');
-            resultDiv.innerHTML = `<div class="result-box error" style="color: #dc2626;">❌ Error: ${data.error}</div>`;
+        const targetPoint = `(${dlogPublicKey.x}, ${dlogPublicKey.y})`;
+        let attemptCount = 0;
+        let rowsDiv = null;
+        let pendingRows = '';
+        let data = null;
+
+        const flushRows = () => {
+            if (rowsDiv && pendingRows) {
+                rowsDiv.insertAdjacentHTML('beforeend', pendingRows);
+                pendingRows = '';
+            }
+        };
+
+        await readNdjson(response, record => {
+            if (record.type !== 'attempt') {
+                data = record;
+                return;
+            }
+            if (!rowsDiv) {
+                stepsDiv.innerHTML = `
+                    <div style="background: linear-gradient(135deg, rgba(59, 130, 246, 0.1) 0%, rgba(59, 130, 246, 0.05) 100%); padding: 15px; border-radius: 8px; margin-bottom: 15px; border-left: 4px solid #3b82f6;">
+                        <h4 style="margin: 0 0 10px 0; color: #2563eb;">🔍 Brute Force Attack - Finding the Secret Key</h4>
+                        <p style="margin: 5px 0; font-size: 0.9em; color: #555;">
+                            <strong>Goal:</strong> Find which k satisfies: k × G = Q
+                        </p>
+                        <p style="margin: 5px 0; font-size: 0.9em; color: #555;">
+                            <strong>Target Q:</strong> <span style="font-family: monospace; background: #f3f4f6; padding: 2px 6px; border-radius: 3px;">${targetPoint}</span>
+                        </p>
+                        <p class="dlog-found-in" style="margin: 5px 0; font-size: 0.9em; color: #555;">
+                            <strong>Searching:</strong> <span class="dlog-attempt-count">0</span> keys tried so far
+                        </p>
+                    </div>
+
+                    <div style="background: rgba(251, 191, 36, 0.05); padding: 12px; border-radius: 8px; margin-bottom: 12px; border-left: 3px solid #f59e0b;">
+                        <strong style="color: #d97706;">💡 Educational Note:</strong> Each attempt computes k × G and checks if it equals Q. The attacker must try many values before finding the secret key - this is why discrete log is computationally hard!
+                    </div>
+
+                    <div style="border: 1px solid var(--border-color); border-radius: 8px; overflow: hidden;">
+                        <div style="background: #f9fafb; padding: 10px; border-bottom: 1px solid var(--border-color); font-weight: 600; font-size: 0.9em; display: grid; grid-template-columns: 60px 80px 200px 80px; gap: 10px;">
+                            <div>#</div>
+                            <div>Try k</div>
+                            <div>Computed: k × G</div>
+                            <div>Result</div>
+                        </div>
+                        <div class="dlog-attempt-rows" style="max-height: 450px; overflow-y: auto;"></div>
+                    </div>
+                `;
+                rowsDiv = stepsDiv.querySelector('.dlog-attempt-rows');
+            }
+            pendingRows += dlogAttemptRowHtml(record, attemptCount);
+            attemptCount++;
+            if (attemptCount % 200 === 0) {
+                flushRows();
+                stepsDiv.querySelector('.dlog-attempt-count').textContent = attemptCount;
+            }
+        });
+        flushRows();
+
+        if (!data || !data.success) {
+            const error = data ? data.error : 'Empty response';
+            showToast(error || 'Attack failed', 'error');
+            resultDiv.innerHTML = `<div class="result-box error" style="color: #dc2626;">❌ Error: ${error}</div>`;
             return;
         }
 
         const foundKey = data.found_key;
-        const attempts = data.attempts || [];
         const isCorrect = foundKey === dlogPrivateKey;
+        const algorithmLabel = data.algorithm === 'brute_force' ? 'Brute Force (O(n))' : `${data.algorithm} (planner choice)`;
 
         // Display result
         const resultHtml = `
@@ -7499,7 +7626,7 @@ function getOperationIcon(type){
                 <p><strong>Found k:</strong> ${foundKey || 'Not found'}</p>
                 <p><strong>Correct k:</strong> ${dlogPrivateKey}</p>
                 <p><strong>Attempts:</strong> ${data.total_attempts} computations</p>
-                ${useBsgs ? `<p><strong>Algorithm:</strong> Baby-step Giant-step (O(√n))</p>` : `<p><strong>Algorithm:</strong> Brute Force (O(n))</p>`}
+                <p><strong>Algorithm:</strong> ${algorithmLabel}</p>
                 <p style="margin-top: 12px; color: var(--text-secondary);">
                     ${isCorrect
                         ? '⚠️ This shows why ECC is secure: even small keys are infeasible to crack with brute force!'
@@ -7510,82 +7637,17 @@ function getOperationIcon(type){
 
         resultDiv.innerHTML = resultHtml;
 
-        // Display all attack attempts with educational context
-        if (attempts.length > 0) {
-            const targetPoint = `(${dlogPublicKey.x}, ${dlogPublicKey.y})`;
+        // Complete the attempt listing with educational context
+        if (attemptCount > 0) {
             const totalAttempts = data.total_attempts;
-            const efficiency = Math.round((attempts.length / totalAttempts) * 100);
-
-            let stepsHtml = `
-                <div style="background: linear-gradient(135deg, rgba(59, 130, 246, 0.1) 0%, rgba(59, 130, 246, 0.05) 100%); padding: 15px; border-radius: 8px; margin-bottom: 15px; border-left: 4px solid #3b82f6;">
-                    <h4 style="margin: 0 0 10px 0; color: #2563eb;">🔍 Brute Force Attack - Finding the Secret Key</h4>
-                    <p style="margin: 5px 0; font-size: 0.9em; color: #555;">
-                        <strong>Goal:</strong> Find which k satisfies: k × G = Q
-                    </p>
-                    <p style="margin: 5px 0; font-size: 0.9em; color: #555;">
-                        <strong>Target Q:</strong> <span style="font-family: monospace; background: #f3f4f6; padding: 2px 6px; border-radius: 3px;">${targetPoint}</span>
-                    </p>
-                    <p style="margin: 5px 0; font-size: 0.9em; color: #555;">
-                        <strong>Found in:</strong> ${attempts.length} of ${totalAttempts} possible keys (${efficiency}% efficiency)
-                    </p>
-                </div>
-
-                <div style="background: rgba(251, 191, 36, 0.05); padding: 12px; border-radius: 8px; margin-bottom: 12px; border-left: 3px solid #f59e0b;">
-                    <strong style="color: #d97706;">💡 Educational Note:</strong> Each attempt computes k × G and checks if it equals Q. The attacker must try many values before finding the secret key - this is why discrete log is computationally hard!
-                </div>
-
-                <div style="border: 1px solid var(--border-color); border-radius: 8px; overflow: hidden;">
-                    <div style="background: #f9fafb; padding: 10px; border-bottom: 1px solid var(--border-color); font-weight: 600; font-size: 0.9em; display: grid; grid-template-columns: 60px 80px 200px 80px; gap: 10px;">
-                        <div>#</div>
-                        <div>Try k</div>
-                        <div>Computed: k × G</div>
-                        <div>Result</div>
-                    </div>
-                    <div style="max-height: 450px; overflow-y: auto;">
-            `;
-
-            attempts.forEach((attempt, idx) => {
-                const isFound = attempt.found;
-                const isSecret = attempt.k_attempt === dlogPrivateKey;
-                const resultPoint = `(${attempt.result_x}, ${attempt.result_y})`;
-                const matches = isFound ? '✓ MATCH!' : '✗ No match';
-
-                let bgColor = 'transparent';
-                let borderColor = 'transparent';
-                let textColor = '#666';
-
-                if (isFound) {
-                    bgColor = 'rgba(239, 68, 68, 0.15)';
-                    borderColor = '#dc2626';
-                    textColor = '#dc2626';
-                } else if (isSecret) {
-                    bgColor = 'rgba(249, 115, 22, 0.15)';
-                    borderColor = '#ea580c';
-                    textColor = '#ea580c';
-                }
-
-                stepsHtml += `
-                    <div style="padding: 10px; background: ${bgColor}; border-left: 3px solid ${borderColor}; display: grid; grid-template-columns: 60px 80px 200px 80px; gap: 10px; align-items: center; font-size: 0.85em; font-family: monospace; border-bottom: 1px solid #e5e7eb;">
-                        <div style="font-weight: 600;">${idx + 1}</div>
-                        <div style="color: ${textColor}; font-weight: 600;">${attempt.k_attempt}</div>
-                        <div style="color: #666; word-break: break-all;">${resultPoint}</div>
-                        <div style="font-weight: 600; color: ${textColor};">
-                            ${isFound ? '✓ FOUND' : isSecret ? '⚡ Secret' : '✗'}
-                        </div>
-                    </div>
-                `;
-            });
-
-            stepsHtml += `
-                    </div>
-                </div>
-
+            const efficiency = Math.round((attemptCount / totalAttempts) * 100);
+            stepsDiv.querySelector('.dlog-found-in').innerHTML =
+                `<strong>Found in:</strong> ${attemptCount} of ${totalAttempts} possible keys (${efficiency}% efficiency)`;
+            stepsDiv.insertAdjacentHTML('beforeend', `
                 <div style="background: rgba(16, 185, 129, 0.05); padding: 12px; border-radius: 8px; margin-top: 12px; border-left: 3px solid #10b981;">
-                    <strong style="color: #059669;">✓ Key Insight:</strong> The attacker had to try ${attempts.length} different values before finding the secret key. In real cryptography with large numbers, this search is computationally infeasible!
+                    <strong style="color: #059669;">✓ Key Insight:</strong> The attacker had to try ${attemptCount} different values before finding the secret key. In real cryptography with large numbers, this search is computationally infeasible!
                 </div>
-            `;
-
-            stepsDiv.innerHTML = stepsHtml;
+            `);
         } else {
             stepsDiv.innerHTML = '<div style="text-align: center; padding: 20px; color: var(--text-muted);">No attack attempts recorded.</div>';
         }
@@ -0,0 +1,1303 @@
+"""
+Test Suite for the EllipticCurve arithmetic engine
+
+Cross-checks the optimized internal representations and algorithms
+against straightforward affine reference computations.
+"""
+
+import itertools
+import math
+import os
+import random
+import unittest
+from app import point_enumeration
+from app.factorization import factorize
+from app.lru_cache import LRUCache
+from app.elliptic_curve import EllipticCurve, RealEllipticCurve, get_curve, _BSGS_TABLES, _FIXED_BASE_TABLES, _GROUP_ORDERS, _POINT_SETS, _WNAF_TABLES, _wnaf_digits
+from app.point_set import PointSet, dumps
+from app.point_counting import hasse_interval, mestre_order, schoof_order, schoof_trace
+from app.prime_field import get_prime_field
+
+
+SECP256K1_P = 2**256 - 2**32 - 977
+SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+SECP256K1_G = (
+    0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+    0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8,
+)
+
+
+def naive_multiply(curve, k, P):
+    """k*P by repeated affine addition."""
+    result = (None, None)
+    for _ in range(k):
+        result = curve.add_points(result, P)
+    return result
+
+
+def python_points(curve):
+    """Pure-Python enumeration: one Tonelli-Shanks call per x."""
+    points = [(None, None)]
+    for x in range(curve.p):
+        points.extend((x, y) for y in curve.tonelli_shanks((x**3 + curve.a * x + curve.b) % curve.p))
+    return points
+
+
+def reference_sqrt(n, p):
+    """Textbook Tonelli-Shanks with an Euler test, recomputing every constant."""
+    n %= p
+    if n == 0:
+        return [0]
+    if pow(n, (p - 1) // 2, p) != 1:
+        return []
+    Q, S = p - 1, 0
+    while Q % 2 == 0:
+        Q //= 2
+        S += 1
+    z = 2
+    while pow(z, (p - 1) // 2, p) != p - 1:
+        z += 1
+    M, c, t, R = S, pow(z, Q, p), pow(n, Q, p), pow(n, (Q + 1) // 2, p)
+    while t != 1:
+        i, temp = 1, t * t % p
+        while temp != 1 and i < M:
+            temp, i = temp * temp % p, i + 1
+        b = pow(c, 1 << (M - i - 1), p)
+        M, c = i, b * b % p
+        t, R = t * c % p, R * b % p
+    return [R, p - R] if R != p - R else [R]
+
+
+class TestJacobianArithmetic(unittest.TestCase):
+    """Jacobian-coordinate scalar multiplication matches affine addition"""
+
+    def setUp(self):
+        self.curve = EllipticCurve(2, 3, 97)
+        self.points = [pt for pt in self.curve.find_all_points() if pt != (None, None)]
+
+    def test_scalar_multiply_matches_repeated_addition(self):
+        for P in self.points[:10]:
+            for k in range(0, 30):
+                self.assertEqual(self.curve.scalar_multiply(k, P), naive_multiply(self.curve, k, P))
+
+    def test_scalar_multiply_negative(self):
+        P = self.points[0]
+        neg = self.curve.scalar_multiply(-7, P)
+        self.assertEqual(self.curve.add_points(neg, self.curve.scalar_multiply(7, P)), (None, None))
+
+    def test_get_order(self):
+        for P in self.points:
+            n = self.curve.get_order(P)
+            self.assertEqual(self.curve.scalar_multiply(n, P), (None, None))
+            self.assertEqual(naive_multiply(self.curve, n, P), (None, None))
+
+    def test_large_prime_group_order(self):
+        curve = EllipticCurve(0, 7, SECP256K1_P)
+        self.assertEqual(curve.scalar_multiply(SECP256K1_N, SECP256K1_G), (None, None))
+        neg_G = (SECP256K1_G[0], (-SECP256K1_G[1]) % SECP256K1_P)
+        self.assertEqual(curve.scalar_multiply(SECP256K1_N - 1, SECP256K1_G), neg_G)
+
+    def test_off_curve_point_rejected(self):
+        with self.assertRaises(ValueError):
+            self.curve.scalar_multiply(3, (1, 1))
+        with self.assertRaises(ValueError):
+            self.curve.get_order((1, 1))
+
+
+class TestTrustedArithmetic(unittest.TestCase):
+    """Unchecked fast paths agree with the validating public API"""
+
+    def setUp(self):
+        self.curve = EllipticCurve(2, 2, 17)
+        self.points = self.curve.find_all_points()
+
+    def test_unchecked_addition_matches_validated(self):
+        for P in self.points:
+            for Q in self.points:
+                self.assertEqual(self.curve.add_points(P, Q, validate=False), self.curve.add_points(P, Q))
+
+    def test_validation_still_enforced_by_default(self):
+        with self.assertRaises(ValueError):
+            self.curve.add_points((5, 1), (1, 1))
+        with self.assertRaises(ValueError):
+            self.curve.validate_point((1, 1))
+        self.curve.validate_point((None, None))
+
+
+class TestWindowedNAF(unittest.TestCase):
+    """wNAF scalar multiplication and its per-point table cache"""
+
+    def test_wnaf_digits_reconstruct_scalar(self):
+        for w in (2, 3, 4, 5, 6):
+            for k in range(1, 2000):
+                digits = _wnaf_digits(k, w)
+                self.assertEqual(sum(d << i for i, d in enumerate(digits)), k)
+                for i, d in enumerate(digits):
+                    if d:
+                        self.assertEqual(d % 2, 1)
+                        self.assertLess(abs(d), 1 << (w - 1))
+                        self.assertTrue(all(x == 0 for x in digits[i + 1:i + w]))
+
+    def test_wnaf_matches_binary_small_curve(self):
+        curve = EllipticCurve(2, 3, 97)
+        for P in curve.find_all_points()[1:20]:
+            for k in range(-40, 120):
+                self.assertEqual(curve.scalar_multiply(k, P, method='wnaf'),
+                                 curve.scalar_multiply(k, P, method='binary'))
+
+    def test_wnaf_matches_binary_large_curve(self):
+        curve = EllipticCurve(0, 7, SECP256K1_P)
+        rng = random.Random(3)
+        for _ in range(5):
+            k = rng.randrange(1, SECP256K1_N)
+            self.assertEqual(curve.scalar_multiply(k, SECP256K1_G, method='wnaf'),
+                             curve.scalar_multiply(k, SECP256K1_G, method='binary'))
+
+    def test_table_cached_across_instances(self):
+        _WNAF_TABLES.clear()
+        EllipticCurve(0, 7, SECP256K1_P).scalar_multiply(2**100 + 1, SECP256K1_G)
+        self.assertEqual(len(_WNAF_TABLES), 1)
+        EllipticCurve(0, 7, SECP256K1_P).scalar_multiply(-(2**90 + 7), SECP256K1_G)
+        self.assertEqual(len(_WNAF_TABLES), 1)
+
+    def test_unknown_method_rejected(self):
+        with self.assertRaises(ValueError):
+            EllipticCurve(2, 3, 97).scalar_multiply(5, (3, 6), method='magic')
+
+    def test_real_curve_wnaf_matches_binary(self):
+        curve = RealEllipticCurve(-1, 1)
+        P = (1.0, 1.0)
+        for k in (1, 2, 3, 7, 11, -5):
+            wnaf = curve.scalar_multiply(k, P, method='wnaf')
+            binary = curve.scalar_multiply(k, P, method='binary')
+            self.assertAlmostEqual(wnaf[0], binary[0], places=6)
+            self.assertAlmostEqual(wnaf[1], binary[1], places=6)
+
+
+class TestFixedBase(unittest.TestCase):
+    """Fixed-base window tables for reused generators"""
+
+    def test_fixed_base_matches_binary_small_curve(self):
+        curve = EllipticCurve(2, 3, 97)
+        for P in curve.find_all_points()[1:20]:
+            for k in range(-40, 300):
+                self.assertEqual(curve.scalar_multiply(k, P, method='fixed_base'),
+                                 curve.scalar_multiply(k, P, method='binary'))
+
+    def test_small_order_bases(self):
+        # Table rows and the offset contain the point at infinity here.
+        for a, b, p in ((2, 2, 17), (-1, 0, 1013)):
+            curve = EllipticCurve(a, b, p)
+            for P in curve.find_all_points()[1:60]:
+                for k in range(1, 3 * curve.get_order(P)):
+                    self.assertEqual(curve.scalar_multiply(k, P, method='fixed_base', secret=True),
+                                     curve.scalar_multiply(k, P, method='binary'))
+
+    def test_fixed_base_matches_binary_large_curve(self):
+        curve = EllipticCurve(0, 7, SECP256K1_P)
+        rng = random.Random(4)
+        for k in [1, 2**252, SECP256K1_N - 1, SECP256K1_N] + [rng.randrange(1, SECP256K1_N) for _ in range(5)]:
+            self.assertEqual(curve.scalar_multiply(k, SECP256K1_G, method='fixed_base', secret=True),
+                             curve.scalar_multiply(k, SECP256K1_G, method='binary'))
+
+    def test_same_additions_for_every_scalar(self):
+        from unittest import mock
+        curve = EllipticCurve(0, 7, SECP256K1_P)
+        counts = set()
+        for k in (1, 2**128, SECP256K1_N - 1, 0xf0f0f0f0):
+            with mock.patch.object(EllipticCurve, '_jacobian_add', autospec=True,
+                                   side_effect=EllipticCurve._jacobian_add) as add:
+                curve.scalar_multiply(k, SECP256K1_G, method='fixed_base', secret=True)
+            counts.add(add.call_count)
+        self.assertEqual(counts, {-(-(SECP256K1_P.bit_length() + 1) // curve.FIXED_BASE_WIDTH) + 1})
+
+    def test_oversized_scalar_falls_back(self):
+        curve = EllipticCurve(2, 3, 97)
+        P = curve.find_all_points()[1]
+        k = 2**40 + 3
+        for secret in (False, True):
+            self.assertEqual(curve.scalar_multiply(k, P, method='fixed_base', secret=secret),
+                             curve.scalar_multiply(k, P, method='binary'))
+
+    def test_table_shared_across_instances(self):
+        _FIXED_BASE_TABLES.clear()
+        EllipticCurve(0, 7, SECP256K1_P).scalar_multiply(12345, SECP256K1_G, method='fixed_base')
+        EllipticCurve(0, 7, SECP256K1_P).scalar_multiply(67890, SECP256K1_G, method='fixed_base')
+        self.assertEqual(len(_FIXED_BASE_TABLES), 1)
+
+
+class TestMontgomeryLadder(unittest.TestCase):
+    """Ladder modes agree with double-and-add"""
+
+    def test_small_curves_all_points(self):
+        rng = random.Random(17)
+        for a, b, p in ((2, 2, 17), (-1, 0, 1013), (0, 7, 1097)):
+            curve = EllipticCurve(a, b, p)
+            for P in curve.find_all_points()[1:120]:
+                for k in (1, 2, 3, 4, rng.randrange(1, 3 * p), curve.get_order(P), curve.get_order(P) - 1):
+                    expected = curve.scalar_multiply(k, P, method='binary')
+                    self.assertEqual(curve.scalar_multiply(k, P, method='ladder'), expected)
+                    self.assertEqual(curve.scalar_multiply(k, P, method='xladder'), expected)
+
+    def test_secp256k1(self):
+        curve = EllipticCurve(0, 7, SECP256K1_P)
+        rng = random.Random(18)
+        for _ in range(5):
+            k = rng.randrange(1, SECP256K1_N)
+            expected = curve.scalar_multiply(k, SECP256K1_G)
+            self.assertEqual(curve.scalar_multiply(k, SECP256K1_G, method='ladder'), expected)
+            self.assertEqual(curve.scalar_multiply(k, SECP256K1_G, secret=True), expected)
+            self.assertEqual(curve.scalar_multiply(-k, SECP256K1_G, secret=True), curve.scalar_multiply(-k, SECP256K1_G))
+        self.assertEqual(curve.scalar_multiply(SECP256K1_N, SECP256K1_G, secret=True), (None, None))
+
+    def test_cswap(self):
+        self.assertEqual(EllipticCurve._cswap((1, 2), (3, 4), 0), ((1, 2), (3, 4)))
+        self.assertEqual(EllipticCurve._cswap((1, 2), (3, 4), 1), ((3, 4), (1, 2)))
+
+
+class TestMultiScalarMultiply(unittest.TestCase):
+    """Shamir, Straus and Pippenger agree with summed scalar_multiply calls"""
+
+    def reference(self, curve, terms):
+        result = (None, None)
+        for k, P in terms:
+            result = curve.add_points(result, curve.scalar_multiply(k, P))
+        return result
+
+    def test_methods_match_reference_small_curve(self):
+        curve = EllipticCurve(2, 3, 97)
+        points = curve.find_all_points()
+        rng = random.Random(5)
+        for n, methods in ((2, ('shamir', 'straus', 'pippenger')), (5, ('straus', 'pippenger')),
+                           (20, ('straus', 'pippenger'))):
+            for _ in range(20):
+                terms = [(rng.randrange(-200, 200), rng.choice(points)) for _ in range(n)]
+                expected = self.reference(curve, terms)
+                self.assertEqual(curve.multi_scalar_multiply(terms), expected)
+                for method in methods:
+                    self.assertEqual(curve.multi_scalar_multiply(terms, method=method), expected)
+
+    def test_large_curve(self):
+        curve = EllipticCurve(0, 7, SECP256K1_P)
+        rng = random.Random(6)
+        Q = curve.scalar_multiply(rng.randrange(1, SECP256K1_N), SECP256K1_G)
+        k, l = rng.randrange(1, SECP256K1_N), rng.randrange(1, SECP256K1_N)
+        self.assertEqual(curve.multi_scalar_multiply([(k, SECP256K1_G), (l, Q)]),
+                         self.reference(curve, [(k, SECP256K1_G), (l, Q)]))
+        terms = [(rng.randrange(1, SECP256K1_N), curve.scalar_multiply(i + 2, SECP256K1_G)) for i in range(16)]
+        self.assertEqual(curve.multi_scalar_multiply(terms, method='pippenger'), self.reference(curve, terms))
+
+    def test_cancelling_terms_and_edge_cases(self):
+        curve = EllipticCurve(2, 3, 97)
+        P = curve.find_all_points()[1]
+        self.assertEqual(curve.multi_scalar_multiply([(5, P), (-5, P)]), (None, None))
+        self.assertEqual(curve.multi_scalar_multiply([]), (None, None))
+        self.assertEqual(curve.multi_scalar_multiply([(0, P), (3, (None, None))]), (None, None))
+        self.assertEqual(curve.multi_scalar_multiply([(7, P)]), curve.scalar_multiply(7, P))
+
+    def test_invalid_input_rejected(self):
+        curve = EllipticCurve(2, 3, 97)
+        P = curve.find_all_points()[1]
+        with self.assertRaises(ValueError):
+            curve.multi_scalar_multiply([(2, P), (3, (1, 1))])
+        with self.assertRaises(ValueError):
+            curve.multi_scalar_multiply([(2, P), (3, P), (4, P)], method='shamir')
+        with self.assertRaises(TypeError):
+            curve.multi_scalar_multiply([(2.5, P), (3, P)])
+
+    def test_route_matches_separate_scalar_multiplies(self):
+        from app import app
+        client = app.test_client()
+        curve = get_curve(2, 3, 1000003)
+        rng = random.Random(8)
+        points = list(itertools.islice(curve.iter_points(x_start=1000), 24))
+        for n in (2, 5, 20):
+            terms = [{'k': rng.randrange(-10**6, 10**6), 'point': {'x': x, 'y': y}}
+                     for x, y in rng.sample(points, n)]
+            reply = client.post('/api/multi_scalar_multiply',
+                                json={'a': 2, 'b': 3, 'p': 1000003, 'terms': terms}).get_json()
+            self.assertTrue(reply['success'], reply)
+            self.assertEqual(reply['num_terms'], n)
+
+            expected = (None, None)
+            for term in terms:
+                single = client.post('/api/scalar_multiply', json={
+                    'a': 2, 'b': 3, 'p': 1000003, 'k': term['k'],
+                    'point': {**term['point'], 'display': ''}}).get_json()['result']
+                expected = curve.add_points(expected, (single['x'], single['y']))
+            self.assertEqual((reply['result']['x'], reply['result']['y']), expected)
+
+    def test_route_rejects_bad_terms(self):
+        from app import app
+        client = app.test_client()
+        P = get_curve(2, 3, 97).find_all_points()[1]
+        body = {'a': 2, 'b': 3, 'p': 97, 'terms': [{'k': 2, 'point': {'x': P[0], 'y': P[1]}},
+                                                   {'k': 3, 'point': {'x': 1, 'y': 1}}]}
+        for bad in (body, {**body, 'terms': body['terms'][:1] * 3, 'method': 'shamir'},
+                    {**body, 'terms': [{'k': 'two', 'point': {'x': P[0], 'y': P[1]}}]},
+                    {key: value for key, value in body.items() if key != 'terms'}):
+            response = client.post('/api/multi_scalar_multiply', json=bad)
+            self.assertEqual(response.status_code, 400, bad)
+            self.assertFalse(response.get_json()['success'])
+
+
+@unittest.skipIf(point_enumeration.np is None, "NumPy not installed")
+class TestVectorizedEnumeration(unittest.TestCase):
+    """NumPy enumeration returns exactly the pure-Python point list"""
+
+    def test_matches_python_enumeration(self):
+        # p = 3 mod 4, p = 5 mod 8 and p = 1 mod 8 (deep Tonelli-Shanks loop)
+        for a, b, p in ((2, 3, 1031), (1, 1, 1033), (0, 7, 1097), (3, 5, 7681), (5, 11, 65537)):
+            curve = EllipticCurve(a, b, p)
+            self.assertTrue(point_enumeration.numpy_available(p))
+            self.assertEqual(curve.find_all_points(), python_points(curve))
+
+    def test_blocks_match_single_pass(self):
+        from unittest import mock
+        curve = EllipticCurve(5, 11, 65537)
+        whole = point_enumeration.enumerate_points_numpy(5, 11, 65537)
+        with mock.patch.object(point_enumeration, 'NUMPY_CHUNK', 1000):
+            self.assertEqual(point_enumeration.enumerate_points_numpy(5, 11, 65537), whole)
+        self.assertEqual(whole, python_points(curve))
+
+    def test_coordinates_are_python_ints(self):
+        points = EllipticCurve(2, 3, 1031).find_all_points()
+        self.assertTrue(all(type(x) is int and type(y) is int for x, y in points[1:]))
+
+    def test_matches_python_enumeration_above_table_range(self):
+        p = 4194353  # first prime past SQRT_TABLE_MAX_P, p = 1 mod 4
+        self.assertFalse(point_enumeration.sqrt_table_available(p))
+        x, rhs = point_enumeration._curve_rhs(3, 7, p)
+        residue = point_enumeration._pow_vec(rhs, (p - 1) // 2, p) == 1
+        roots = point_enumeration._sqrt_vec(rhs[residue][:2000], p).tolist()
+        curve = EllipticCurve(3, 7, p)
+        self.assertEqual(roots, [curve.tonelli_shanks(n)[0] for n in rhs[residue][:2000].tolist()])
+
+    def test_small_and_huge_p_use_python_path(self):
+        self.assertFalse(point_enumeration.numpy_available(97))
+        self.assertFalse(point_enumeration.numpy_available(2**61 - 1))
+
+
+class TestSqrtTableEnumeration(unittest.TestCase):
+    """Square-root tables reproduce Tonelli-Shanks enumeration exactly"""
+
+    CURVES = ((2, 2, 17), (2, 3, 97), (1, 1, 1033), (0, 7, 1097), (3, 5, 7681))
+
+    def check_all(self):
+        for a, b, p in self.CURVES:
+            curve = EllipticCurve(a, b, p)
+            self.assertTrue(point_enumeration.sqrt_table_available(p))
+            self.assertEqual(curve.find_all_points(), python_points(curve))
+
+    def test_matches_python_enumeration(self):
+        point_enumeration._SQRT_TABLES.clear()
+        self.check_all()
+
+    def test_matches_python_enumeration_without_numpy(self):
+        saved = point_enumeration.np
+        point_enumeration.np = None
+        point_enumeration._SQRT_TABLES.clear()
+        try:
+            self.check_all()
+        finally:
+            point_enumeration.np = saved
+            point_enumeration._SQRT_TABLES.clear()
+
+    def test_table_shared_across_curves_on_same_prime(self):
+        point_enumeration._SQRT_TABLES.clear()
+        EllipticCurve(2, 3, 1031).find_all_points()
+        EllipticCurve(5, 8, 1031).find_all_points()
+        self.assertEqual(len(point_enumeration._SQRT_TABLES), 1)
+
+
+class TestPrimeField(unittest.TestCase):
+    """Cached per-prime constants and square-root fast paths"""
+
+    def test_sqrt_matches_reference_for_each_fast_path(self):
+        # 1031 = 3 mod 4, 1033 = 1 mod 8, 1069 = 5 mod 8, 7681 = 1 mod 2^9
+        for p, method in ((1031, 'p3mod4'), (1033, 'tonelli'), (1069, 'p5mod8'), (7681, 'tonelli')):
+            field = get_prime_field(p)
+            self.assertEqual(field.sqrt_method, method)
+            for n in range(p):
+                self.assertEqual(field.sqrt(n), reference_sqrt(n, p))
+
+    def test_large_prime_sqrt(self):
+        field = get_prime_field(SECP256K1_P)
+        y_squared = (SECP256K1_G[0] ** 3 + 7) % SECP256K1_P
+        self.assertIn(SECP256K1_G[1], field.sqrt(y_squared))
+
+    def test_field_shared_across_curves(self):
+        self.assertIs(EllipticCurve(2, 3, 97).field, EllipticCurve(5, 7, 97).field)
+
+    def test_composite_modulus_rejected(self):
+        self.assertFalse(get_prime_field(91).is_prime)
+        with self.assertRaises(ValueError):
+            EllipticCurve(2, 3, 91)
+
+
+class TestIterPoints(unittest.TestCase):
+    """Lazy x-range enumeration agrees with find_all_points"""
+
+    def test_full_range_matches_find_all_points(self):
+        for a, b, p in ((2, 2, 17), (1, 1, 1033), (0, 7, 1097)):
+            curve = EllipticCurve(a, b, p)
+            self.assertEqual([(None, None)] + list(curve.iter_points()), curve.find_all_points())
+
+    def test_x_window(self):
+        curve = EllipticCurve(3, 5, 7681)
+        points = curve.find_all_points()
+        window = [pt for pt in points[1:] if 100 <= pt[0] < 250]
+        self.assertEqual(list(curve.iter_points(100, 250)), window)
+        self.assertEqual(list(curve.iter_points(-5, 3)), [pt for pt in points[1:] if pt[0] < 3])
+        self.assertEqual(list(curve.iter_points(7000, 10**9)), [pt for pt in points[1:] if pt[0] >= 7000])
+
+    def test_large_prime_window_is_lazy(self):
+        curve = EllipticCurve(0, 7, SECP256K1_P)
+        first = next(curve.iter_points(SECP256K1_G[0]))
+        self.assertEqual(first[0], SECP256K1_G[0])
+        self.assertTrue(curve.is_point_on_curve(*first))
+
+
+class TestFindPointsPaging(unittest.TestCase):
+    """Paged /api/find_points queries against the full listing"""
+
+    CURVE = {'a': 2, 'b': 3, 'p': 97}
+
+    def setUp(self):
+        from app import app
+        self.client = app.test_client()
+
+    def _post(self, **params):
+        response = self.client.post('/api/find_points', json={**self.CURVE, **params})
+        return response.status_code, response.get_json()
+
+    def _pages(self, limit, **window):
+        """Follow has_more page by page, advancing offset by each page's count."""
+        pages, offset = [], 0
+        while True:
+            status, page = self._post(offset=offset, limit=limit, **window)
+            self.assertEqual(status, 200, page)
+            self.assertLessEqual(page['count'], limit)
+            pages.append(page['points'])
+            offset += page['count']
+            if not page['has_more']:
+                return pages
+
+    def test_pages_cover_listing(self):
+        _, whole = self._post()
+        self.assertEqual(whole['count'], 100)
+        pages = self._pages(limit=7)
+        self.assertEqual(len(pages), 15)
+        # Disjoint and complete: the pages concatenate to the listing.
+        flat = [point for page in pages for point in page]
+        self.assertEqual(flat, whole['points'])
+        self.assertEqual(len({point['display'] for point in flat}), len(flat))
+
+    def test_x_window_pages(self):
+        _, whole = self._post()
+        expected = [point for point in whole['points'] if point['x'] is not None and 10 <= point['x'] <= 40]
+        pages = self._pages(limit=5, x_min=10, x_max=40)
+        self.assertEqual([point for page in pages for point in page], expected)
+        _, empty = self._post(x_min=50, x_max=10)
+        self.assertEqual((empty['points'], empty['has_more']), ([], False))
+
+    def test_bad_paging_values_rejected(self):
+        for params in ({'offset': -1}, {'limit': -2}, {'offset': 'next'}, {'limit': '1.5'},
+                       {'x_min': 'abc'}, {'x_max': [3]}):
+            status, reply = self._post(**params)
+            self.assertEqual(status, 400, params)
+            self.assertFalse(reply['success'])
+
+
+class TestBatchArithmetic(unittest.TestCase):
+    """Montgomery-batched affine additions agree with add_points"""
+
+    def test_batch_add_special_cases(self):
+        curve = EllipticCurve(-1, 0, 1013)
+        points = curve.find_all_points()
+        rng = random.Random(14)
+        pairs = [(rng.choice(points), rng.choice(points)) for _ in range(300)]
+        pairs += [(P, P) for P in points]
+        pairs += [(P, (P[0], -P[1] % curve.p)) for P in points[1:]]
+        self.assertEqual(curve.batch_add(pairs), [curve.add_points(P, Q) for P, Q in pairs])
+        self.assertEqual(curve.batch_add([]), [])
+
+    def test_multiples(self):
+        curve = EllipticCurve(2, 2, 17)  # cyclic of order 19, so the list wraps
+        P = (5, 1)
+        expected = []
+        R = (None, None)
+        for _ in range(300):
+            R = curve.add_points(R, P)
+            expected.append(R)
+        for count in (0, 1, 2, 3, 19, 129, 300):
+            self.assertEqual(curve.multiples(P, count), expected[:count])
+
+    def test_multiples_large_curve(self):
+        curve = EllipticCurve(0, 7, SECP256K1_P)
+        multiples = curve.multiples(SECP256K1_G, 1000)
+        for j in (1, 2, 128, 129, 500, 1000):
+            self.assertEqual(multiples[j - 1], curve.scalar_multiply(j, SECP256K1_G))
+
+
+class TestGroupOrder(unittest.TestCase):
+    """Point counting without enumeration agrees with find_all_points"""
+
+    def test_matches_enumeration(self):
+        for a, b, p in ((2, 2, 17), (0, 7, 1097), (5, 0, 1109), (1, 1, 1033), (3, 5, 7681), (2, 3, 1000003)):
+            curve = EllipticCurve(a, b, p)
+            self.assertEqual(curve.group_order(), len(curve.find_all_points()))
+
+    def test_mestre_and_schoof_agree(self):
+        rng = random.Random(10)
+        for p in (1031, 65537, 1048573):
+            for _ in range(3):
+                a, b = rng.randrange(p), rng.randrange(p)
+                if (4 * a**3 + 27 * b**2) % p == 0:
+                    continue
+                curve = EllipticCurve(a, b, p)
+                n = len(curve.find_all_points())
+                self.assertEqual(mestre_order(curve, curve._quadratic_twist()), n)
+                self.assertEqual(schoof_order(a, b, p), n)
+                # Mestre restricted to the class Schoof pins down mod M.
+                t, M = schoof_trace(a, b, p, 100)
+                self.assertEqual((p + 1 - t - n) % M, 0)
+                self.assertEqual(mestre_order(curve, curve._quadratic_twist(),
+                                              residue=(p + 1 - t) % M, modulus=M), n)
+
+    def test_schoof_narrows_mestre_above_64_bits(self):
+        p = 2**79 - 67
+        curve = EllipticCurve(3, 7, p)
+        n = curve.group_order()
+        low, high = hasse_interval(p)
+        self.assertTrue(low <= n <= high)
+        P = next(curve.iter_points(x_start=2**40))
+        self.assertEqual(curve.scalar_multiply(n, P), (None, None))
+        # The twist has the complementary order 2p + 2 - n.
+        twist = curve._quadratic_twist()
+        T = next(twist.iter_points(x_start=2**40))
+        self.assertEqual(twist.scalar_multiply(2 * p + 2 - n, T), (None, None))
+
+    def test_order_annihilates_points(self):
+        p = 2**61 - 1
+        curve = EllipticCurve(7, 11, p)
+        n = curve.group_order()
+        low, high = hasse_interval(p)
+        self.assertTrue(low <= n <= high)
+        P = next(curve.iter_points(12345))
+        self.assertEqual(curve.scalar_multiply(n, P), (None, None))
+
+    def test_known_order_and_cache(self):
+        curve = EllipticCurve(0, 7, SECP256K1_P)
+        self.assertEqual(curve.group_order(), SECP256K1_N)
+        self.assertIn((0, 7, SECP256K1_P), _GROUP_ORDERS)
+
+    def test_large_unknown_curve_refused(self):
+        # Point counting would take minutes at 127 bits; known curves are still fine.
+        curve = EllipticCurve(3, 7, 2**127 - 1)
+        self.assertRaises(ValueError, curve.group_order)
+        self.assertNotIn((3, 7, 2**127 - 1), _GROUP_ORDERS)
+
+
+class TestPointOrder(unittest.TestCase):
+    """Lagrange-based get_order agrees with walking P, 2P, 3P, ..."""
+
+    @staticmethod
+    def naive_order(curve, P):
+        k, R = 1, P
+        while R != (None, None):
+            R = curve.add_points(R, P, validate=False)
+            k += 1
+        return k
+
+    def test_factorize(self):
+        rng = random.Random(11)
+        for n in [1, 2, 97, 2**64 + 1, (2**31 - 1) * (2**61 - 1), 3**20 * 1009**2] + [rng.randrange(1, 2**60) for _ in range(50)]:
+            factors = factorize(n)
+            product = 1
+            for q, e in factors.items():
+                self.assertEqual(factorize(q), {q: 1})
+                product *= q ** e
+            self.assertEqual(product, n)
+        self.assertRaises(ValueError, factorize, 0)
+
+    def test_matches_naive_order(self):
+        for a, b, p in ((2, 2, 17), (1, 1, 1033), (0, 7, 1097), (5, 0, 1109)):
+            curve = EllipticCurve(a, b, p)
+            for P in curve.find_all_points()[1:60]:
+                self.assertEqual(curve.get_order(P), self.naive_order(curve, P))
+        self.assertEqual(EllipticCurve(2, 2, 17).get_order((None, None)), 1)
+
+    def test_large_curve(self):
+        curve = EllipticCurve(0, 7, SECP256K1_P)
+        self.assertEqual(curve.get_order(SECP256K1_G), SECP256K1_N)
+        double = curve.scalar_multiply(2, SECP256K1_G)
+        self.assertEqual(curve.get_order(double), SECP256K1_N)
+
+
+    def test_wrong_group_order_raises(self):
+        from unittest import mock
+        from app.group_structure import _q_order
+        # #E = 19 here; a wrong N must not send the order search round forever.
+        curve = EllipticCurve(2, 2, 17)
+        P = (5, 1)
+        with mock.patch.object(EllipticCurve, 'group_order', lambda self: 18), \
+                mock.patch.object(EllipticCurve, 'group_order_factors', lambda self: {2: 1, 3: 2}):
+            self.assertRaises(ValueError, curve.get_order, P)
+        self.assertRaises(ValueError, _q_order, curve, P, 2, 3)
+        self.assertEqual(_q_order(curve, P, 19, 1), 1)
+
+    def test_characteristic_2_and_3_refused(self):
+        for p in (2, 3):
+            self.assertRaises(ValueError, EllipticCurve, 0, 1, p)
+
+class TestClassifyPoints(unittest.TestCase):
+    """Orbit-sweep classification agrees with independent order queries"""
+
+    def test_matches_get_order(self):
+        for a, b, p in ((2, 2, 17), (0, 7, 1097), (5, 0, 1109), (1, 0, 1013)):
+            curve = EllipticCurve(a, b, p)
+            info = curve.classify_points()
+            points = curve.find_all_points()[1:]
+            self.assertEqual(list(info['orders']), points)
+            for pt in points:
+                self.assertEqual(info['orders'][pt], curve.get_order(pt))
+            self.assertEqual(info['group_order'], len(points) + 1)
+            self.assertEqual(info['generators'], [pt for pt in points if info['orders'][pt] == len(points) + 1])
+
+    def test_non_cyclic_group(self):
+        # y^2 = x^3 - x over F_1013 has full 2-torsion, so no point has order #E.
+        curve = EllipticCurve(-1, 0, 1013)
+        info = curve.classify_points()
+        self.assertEqual(info['generators'], [])
+        self.assertEqual(sorted(pt for pt, n in info['orders'].items() if n == 2),
+                         [(0, 0), (1, 0), (1012, 0)])
+
+
+class TestGroupStructure(unittest.TestCase):
+    """Z/n1 x Z/n2 decomposition and its basis"""
+
+    def assert_basis(self, curve):
+        structure = curve.group_structure()
+        n1, n2 = structure['invariants']
+        P1, P2 = structure['basis']
+        self.assertEqual(n1 * n2, curve.group_order())
+        self.assertEqual(n1 % n2, 0)
+        self.assertEqual(curve.get_order(P1), n1)
+        self.assertEqual(1 if P2 == (None, None) else curve.get_order(P2), n2)
+        return structure
+
+    def test_spans_group(self):
+        for a, b, p in ((-1, 0, 1013), (2, 2, 17), (0, 7, 1097), (1, 0, 1013)):
+            curve = EllipticCurve(a, b, p)
+            structure = self.assert_basis(curve)
+            (n1, n2), (P1, P2) = structure['invariants'], structure['basis']
+            span = set()
+            A = (None, None)
+            for _ in range(n1):
+                B = A
+                for _ in range(n2):
+                    span.add(B)
+                    B = curve.add_points(B, P2)
+                A = curve.add_points(A, P1)
+            self.assertEqual(span, set(curve.find_all_points()))
+
+    def test_known_structures(self):
+        # y^2 = x^3 - x over F_1013 has full 2-torsion and p = 1 (mod 4).
+        self.assertEqual(self.assert_basis(EllipticCurve(-1, 0, 1013))['invariants'], (44, 22))
+        self.assertTrue(self.assert_basis(EllipticCurve(2, 2, 17))['cyclic'])
+        self.assertEqual(self.assert_basis(EllipticCurve(-1, 0, 2**61 - 1))['invariants'], (2**60, 2))
+
+    def test_large_prime_order(self):
+        structure = EllipticCurve(0, 7, SECP256K1_P).group_structure()
+        self.assertEqual(structure['invariants'], (SECP256K1_N, 1))
+
+
+class TestGroupStructureRoute(unittest.TestCase):
+    """/api/group_structure, and encryption init's use of its first generator"""
+
+    def setUp(self):
+        from app import app
+        self.client = app.test_client()
+
+    def test_non_cyclic_curve(self):
+        # y^2 = x^3 - x over F_131: Z/66 x Z/2.
+        curve = get_curve(-1, 0, 131)
+        reply = self.client.post('/api/group_structure', json={'a': -1, 'b': 0, 'p': 131}).get_json()
+        self.assertTrue(reply['success'], reply)
+        self.assertEqual(reply['invariants'], [66, 2])
+        self.assertEqual(reply['group_order'], 132)
+        self.assertFalse(reply['cyclic'])
+        self.assertEqual(reply['structure'], 'Z/66 x Z/2')
+
+        (P1, n1), (P2, n2) = [((g['point']['x'], g['point']['y']), g['order']) for g in reply['generators']]
+        self.assertEqual((n1, n2), (66, 2))
+        self.assertEqual(curve.get_order(P1), 66)
+        self.assertEqual(curve.get_order(P2), 2)
+        # P2 is outside <P1>, so together they give all 132 points.
+        self.assertNotEqual(curve.scalar_multiply(33, P1), P2)
+
+        # Encryption init takes the generator of maximal order.
+        init = self.client.post('/api/encryption/init', json={'a': -1, 'b': 0, 'p': 131}).get_json()
+        self.assertTrue(init['success'], init)
+        self.assertEqual((init['generator']['x'], init['generator']['y']), P1)
+
+    def test_cyclic_curve_and_errors(self):
+        reply = self.client.post('/api/group_structure', json={'a': 2, 'b': 2, 'p': 17}).get_json()
+        self.assertEqual((reply['invariants'], reply['cyclic']), ([19, 1], True))
+        self.assertIsNone(reply['generators'][1]['point'])
+        response = self.client.post('/api/group_structure', json={'a': 0, 'b': 0, 'p': 17})
+        self.assertEqual(response.status_code, 400)
+
+
+class TestCurveRegistry(unittest.TestCase):
+    """get_curve hands out shared, immutable curve instances"""
+
+    def test_shared_instance(self):
+        curve = get_curve(2, 3, 97)
+        self.assertIs(get_curve(2 + 97, 3 - 97, 97), curve)
+        self.assertIsNot(get_curve(2, 4, 97), curve)
+        self.assertEqual((curve.a, curve.b, curve.p), (2, 3, 97))
+
+    def test_invalid_parameters_raise(self):
+        self.assertRaises(ValueError, get_curve, 2, 3, 98)
+        self.assertRaises(ValueError, get_curve, 0, 0, 97)
+        self.assertRaises(ValueError, get_curve, 2, 3, 1)
+
+    def test_immutable(self):
+        curve = get_curve(2, 3, 97)
+        with self.assertRaises(AttributeError):
+            curve.a = 5
+        with self.assertRaises(AttributeError):
+            del curve.p
+
+    def test_point_list_cached_and_copied(self):
+        curve = get_curve(1, 1, 1033)
+        points = curve.find_all_points()
+        points.clear()
+        self.assertEqual(curve.find_all_points(), EllipticCurve(1, 1, 1033).find_all_points())
+        self.assertIn((1, 1, 1033), _POINT_SETS)
+
+    def test_point_set_cache_bounded_by_points(self):
+        from unittest import mock
+        small = LRUCache(maxsize=64, max_weight=3000, weight=len)
+        with mock.patch('app.elliptic_curve._POINT_SETS', small):
+            for p in (1033, 1039, 1049, 1051):
+                EllipticCurve(1, 1, p).point_set()
+            self.assertLessEqual(small.total_weight, 3000)
+            self.assertEqual(len(small), 2)
+            self.assertIn((1, 1, 1051), small)
+
+
+class TestPointSet(unittest.TestCase):
+    """Array-backed point storage behaves like the point list"""
+
+    def setUp(self):
+        self.curve = EllipticCurve(3, 5, 7681)
+        self.points = python_points(self.curve)
+        self.point_set = self.curve.point_set()
+
+    def test_matches_list(self):
+        self.assertEqual(self.point_set, self.points)
+        self.assertEqual(list(self.point_set), self.points)
+        self.assertEqual(len(self.point_set), len(self.points))
+        self.assertEqual(PointSet.from_points(self.points), self.point_set)
+        for i in (0, 1, 2, 500, -1, -len(self.points)):
+            self.assertEqual(self.point_set[i], self.points[i])
+        self.assertRaises(IndexError, self.point_set.__getitem__, len(self.points))
+
+    def test_slicing_is_zero_copy(self):
+        for sl in (slice(0, 10), slice(1, 10), slice(5, None), slice(-3, None), slice(0, 0), slice(9, 3)):
+            self.assertEqual(list(self.point_set[sl]), self.points[sl])
+        view = self.point_set[100:200]
+        self.assertIs(view.xs.obj, self.point_set.xs.obj)
+        self.assertRaises(ValueError, self.point_set.__getitem__, slice(0, 10, 2))
+
+    def test_membership(self):
+        for pt in self.points[::97]:
+            self.assertIn(pt, self.point_set)
+        self.assertNotIn((1, 1), PointSet.from_points([(0, 3), (0, 4), (2, 1)]))
+        self.assertNotIn((None, None), self.point_set[1:])
+        self.assertNotIn('O', self.point_set)
+
+    def test_serializers(self):
+        import json
+        small = EllipticCurve(2, 2, 17).point_set()
+        decoded = json.loads(dumps({'points': small, 'nested': {'points': small[:2]}, 'count': len(small)}))
+        self.assertEqual(decoded['points'][0], {'x': None, 'y': None, 'display': 'O'})
+        self.assertEqual(decoded['points'][1], {'x': small[1][0], 'y': small[1][1], 'display': f'({small[1][0]}, {small[1][1]})'})
+        self.assertEqual(len(decoded['nested']['points']), 2)
+        self.assertEqual(small.to_csv().splitlines()[:2], ['x,y', 'O,O'])
+
+
+class TestPollardRho(unittest.TestCase):
+    """Pollard's rho discrete logarithms."""
+
+    MODES = ('brent', 'floyd', 'distinguished')
+
+    def test_recovers_known_scalars(self):
+        rng = random.Random(18)
+        curve = EllipticCurve(2, 3, 1000003)
+        G = curve.find_all_points()[1]
+        n = curve.get_order(G)
+        for cycle in self.MODES:
+            for k in (1, 2, n - 1, rng.randrange(1, n)):
+                Q = curve.scalar_multiply(k, G)
+                result = curve.discrete_log_rho(G, Q, cycle=cycle, seed=k)
+                self.assertEqual(result['k'], k)
+                self.assertEqual(result['order'], n)
+                self.assertLess(result['steps'], 50 * n ** 0.5)
+
+    def test_prime_order_subgroup(self):
+        # 32-bit field with a prime group order of 4295040499.
+        curve = EllipticCurve(1, 13, 4294967291)
+        G = next(curve.iter_points())
+        n = curve.get_order(G)
+        Q = curve.scalar_multiply(123456789, G)
+        result = curve.discrete_log_rho(G, Q, order=n, cycle='distinguished', seed=0)
+        self.assertEqual(result['k'], 123456789)
+
+    def test_small_and_trivial_targets(self):
+        curve = EllipticCurve(2, 2, 17)
+        G = (5, 1)
+        for k in range(1, 20):
+            for cycle in self.MODES:
+                self.assertEqual(curve.discrete_log_rho(G, curve.scalar_multiply(k, G), cycle=cycle)['k'], k)
+        self.assertEqual(curve.discrete_log_rho(G, (None, None))['k'], 19)
+
+    def test_progress_after_table_build(self):
+        from unittest import mock
+        from app.group_structure import _CyclicQLog
+        # #E = 2 * 103; building the baby steps counts m = 11 additions at once.
+        curve = EllipticCurve(2, 3, 193)
+        P = curve.scalar_multiply(2, next(curve.iter_points(x_start=1)))
+        dlog = _CyclicQLog(curve, P, 103, 1)
+        reports = []
+        dlog.progress = reports.append
+        with mock.patch.object(EllipticCurve, 'PROGRESS_INTERVAL', 10):
+            # 25 = 2 * 11 + 3: two giant steps, to 12 and 13 additions.
+            self.assertEqual(dlog.log(curve.scalar_multiply(25, P)), 25)
+        self.assertEqual(dlog.steps, 13)
+        self.assertEqual(reports, [12])
+
+    def test_target_outside_subgroup(self):
+        curve = EllipticCurve(102, 0, 103)  # y^2 = x^3 - x: two-dimensional 2-torsion
+        P1, P2 = curve.group_structure()['basis']
+        for cycle in self.MODES:
+            self.assertIsNone(curve.discrete_log_rho(P1, P2, cycle=cycle)['k'])
+        # ord(Q) does not divide ord(G): rejected before any walking.
+        G = curve.scalar_multiply(26, P1)
+        self.assertEqual(curve.discrete_log_rho(G, P1), {'k': None, 'order': 2, 'steps': 0})
+
+    def test_rejects_unknown_cycle(self):
+        curve = EllipticCurve(2, 2, 17)
+        self.assertRaises(ValueError, curve.discrete_log_rho, (5, 1), (5, 1), cycle='tortoise')
+        self.assertRaises(ValueError, curve.discrete_log_rho, (5, 1), (5, 1), workers=2)
+
+    def test_worker_processes(self):
+        import pickle
+        from unittest import mock
+        from app import parallel_dlog
+        curve = get_curve(2, 3, 1000003)
+        self.assertIs(pickle.loads(pickle.dumps(curve)), curve)
+        G = curve.find_all_points()[1]
+        Q = curve.scalar_multiply(424242, G)
+        n = curve.get_order(G)
+        with mock.patch.object(parallel_dlog, 'MAX_WORKERS', 2):
+            result = curve.discrete_log_rho(G, Q, cycle='distinguished', seed=20, workers=2)
+        self.assertEqual(result['k'], 424242 % n)
+
+
+class TestPohligHellman(unittest.TestCase):
+    """Pohlig-Hellman discrete logarithms over the factored order of G."""
+
+    def test_matches_known_scalars(self):
+        rng = random.Random(19)
+        curve = EllipticCurve(2, 3, 1000003)
+        for _ in range(10):
+            G = next(curve.iter_points(x_start=rng.randrange(curve.p)))
+            n = curve.get_order(G)
+            k = rng.randrange(1, n + 1)
+            Q = curve.scalar_multiply(k, G)
+            for solver in ('auto', 'bsgs', 'rho'):
+                result = curve.discrete_log_pohlig_hellman(G, Q, solver=solver)
+                self.assertEqual(result['k'], k)
+                self.assertEqual(result['order'], n)
+            self.assertEqual(factorize(n), result['factors'])
+
+    def test_smooth_order_61_bit(self):
+        # #E = 4 * 83 * 2179 * 528043 * 6036221 = Z/(#E / 2) x Z/2 over the
+        # Mersenne prime 2^61 - 1.
+        curve = EllipticCurve(-3, 5, 2**61 - 1)
+        self.assertEqual(curve.group_order_factors(), {2: 2, 83: 1, 2179: 1, 528043: 1, 6036221: 1})
+        G, _ = curve.group_structure()['basis']
+        k = 123456789012345678
+        result = curve.discrete_log_pohlig_hellman(G, curve.scalar_multiply(k, G))
+        self.assertEqual(result['k'], k)
+        self.assertLess(result['steps'], 10**5)
+
+    def test_progress_after_table_build(self):
+        from unittest import mock
+        from app.group_structure import _CyclicQLog
+        # #E = 2 * 103; building the baby steps counts m = 11 additions at once.
+        curve = EllipticCurve(2, 3, 193)
+        P = curve.scalar_multiply(2, next(curve.iter_points(x_start=1)))
+        dlog = _CyclicQLog(curve, P, 103, 1)
+        reports = []
+        dlog.progress = reports.append
+        with mock.patch.object(EllipticCurve, 'PROGRESS_INTERVAL', 10):
+            # 25 = 2 * 11 + 3: two giant steps, to 12 and 13 additions.
+            self.assertEqual(dlog.log(curve.scalar_multiply(25, P)), 25)
+        self.assertEqual(dlog.steps, 13)
+        self.assertEqual(reports, [12])
+
+    def test_target_outside_subgroup(self):
+        curve = EllipticCurve(102, 0, 103)
+        P1, P2 = curve.group_structure()['basis']
+        self.assertIsNone(curve.discrete_log_pohlig_hellman(P1, P2)['k'])
+        self.assertRaises(ValueError, curve.discrete_log_pohlig_hellman, P1, P1, solver='kangaroo')
+
+
+class TestKangaroo(unittest.TestCase):
+    """Pollard's kangaroo for scalars in a known interval."""
+
+    def setUp(self):
+        # 40-bit field with a prime group order.
+        self.curve = EllipticCurve(1, 5, 1099511627689)
+        self.G = next(self.curve.iter_points())
+
+    def test_finds_key_in_interval(self):
+        rng = random.Random(21)
+        for width in (10, 1000, 10**6):
+            for _ in range(3):
+                lo = rng.randrange(1, 2**39)
+                k = rng.randrange(lo, lo + width + 1)
+                result = self.curve.discrete_log_kangaroo(self.G, self.curve.scalar_multiply(k, self.G), lo, lo + width)
+                self.assertEqual(result['k'], k)
+                self.assertLess(result['steps'], 20 * width ** 0.5 + 1)
+
+    def test_interval_endpoints(self):
+        for k in (2**30, 2**30 + 10**5):
+            Q = self.curve.scalar_multiply(k, self.G)
+            self.assertEqual(self.curve.discrete_log_kangaroo(self.G, Q, 2**30, 2**30 + 10**5)['k'], k)
+
+    def test_key_outside_interval(self):
+        Q = self.curve.scalar_multiply(5 * 10**6, self.G)
+        result = self.curve.discrete_log_kangaroo(self.G, Q, 0, 10**6, max_steps=10**4)
+        self.assertIsNone(result['k'])
+        self.assertRaises(ValueError, self.curve.discrete_log_kangaroo, self.G, Q, 10, 5)
+
+    def test_interval_wider_than_group(self):
+        # k is only unique mod ord(G); such intervals used to miss often.
+        curve = get_curve(4, 3, 2003)
+        G = (2, 1742)
+        n = curve.get_order(G)
+        self.assertEqual(n, 1027)
+        self.assertEqual(curve.discrete_log_kangaroo(G, curve.scalar_multiply(514, G), 1, 5000)['k'], 514)
+        rng = random.Random(7)
+        for seed in range(100):
+            k_min = rng.randrange(50)
+            k_max = k_min + n + rng.randrange(5000)
+            Q = curve.scalar_multiply(rng.randrange(1, n), G)
+            k = curve.discrete_log_kangaroo(G, Q, k_min, k_max, seed=seed)['k']
+            self.assertTrue(k_min <= k < k_min + n)
+            self.assertEqual(curve.scalar_multiply(k, G), Q)
+
+    def test_key_outside_wide_interval(self):
+        # [0, 300] is more than n/4 wide, so rho solves it, but 700 is not in it.
+        curve = get_curve(4, 3, 2003)
+        G = (2, 1742)
+        for seed in range(20):
+            result = curve.discrete_log_kangaroo(G, curve.scalar_multiply(700, G), 0, 300, seed=seed)
+            self.assertIsNone(result['k'])
+        self.assertEqual(curve.discrete_log_kangaroo(G, curve.scalar_multiply(300, G), 0, 300)['k'], 300)
+
+
+class TestBabyStepGiantStep(unittest.TestCase):
+    """Cached baby-step tables and batched giant steps."""
+
+    def test_batch_of_targets(self):
+        rng = random.Random(22)
+        curve = EllipticCurve(2, 3, 1000003)
+        G = curve.find_all_points()[1]
+        n = curve.get_order(G)
+        keys = [1, 2, n - 1, n] + [rng.randrange(1, n) for _ in range(20)]
+        targets = [curve.scalar_multiply(k, G) for k in keys]
+        self.assertEqual(curve.discrete_log_bsgs(G, targets), keys)
+        self.assertEqual(curve.discrete_log_bsgs(G, []), [])
+
+    def test_table_cached_per_curve_and_base(self):
+        _BSGS_TABLES.clear()
+        curve = get_curve(2, 3, 10007)
+        G, H = curve.find_all_points()[1:3]
+        curve.discrete_log_bsgs(G, [curve.scalar_multiply(5, G)])
+        EllipticCurve(2, 3, 10007).discrete_log_bsgs(G, [curve.scalar_multiply(7, G)])
+        self.assertEqual(len(_BSGS_TABLES), 1)
+        curve.discrete_log_bsgs(H, [H])
+        self.assertEqual(len(_BSGS_TABLES), 2)
+
+    def test_table_cache_bounded_by_entries(self):
+        # Tables are weighed by their entry count, so a few full-size ones
+        # evict the rest however many slots remain.
+        _BSGS_TABLES.clear()
+        curve = get_curve(2, 3, 1000003)
+        G = next(curve.iter_points(x_start=1))
+        curve.discrete_log_bsgs(G, [G])
+        m = math.isqrt(curve.get_order(G) - 1) + 1
+        self.assertEqual(_BSGS_TABLES.total_weight, m)
+        self.assertLessEqual(_BSGS_TABLES.max_weight // curve.BSGS_MAX_TABLE, 2)
+
+    def test_bounded_table(self):
+        curve = EllipticCurve(2, 3, 1000003)
+        G = curve.find_all_points()[1]
+        n = curve.get_order(G)
+        bounded = type('Bounded', (EllipticCurve,), {'BSGS_MAX_TABLE': 64})(2, 3, 1000003)
+        keys = [n - 3, 123457, 64, 65]
+        targets = [curve.scalar_multiply(k, G) for k in keys]
+        self.assertEqual(bounded.discrete_log_bsgs(G, targets), keys)
+        self.assertEqual(bounded._bsgs_table(G, n)[0], 64)
+
+    def test_targets_outside_subgroup(self):
+        curve = EllipticCurve(102, 0, 103)
+        P1, P2 = curve.group_structure()['basis']
+        self.assertEqual(curve.discrete_log_bsgs(P1, [P2, P1, (None, None)]), [None, 1, curve.get_order(P1)])
+
+
+class TestDlpJobs(unittest.TestCase):
+    """Background DLP jobs, run in-process (conftest.py supplies a scratch database)."""
+
+    def setUp(self):
+        self.curve = get_curve(2, 3, 1000003)
+        # Prime group order 4295040499: long enough for progress reports.
+        self.large = get_curve(1, 13, 4294967291)
+
+    def _queue(self, algorithm, curve=None, **extra):
+        import secrets
+        from app.db_helpers import create_dlp_job
+        from app.dlp_planner import plan
+        curve = curve or self.curve
+        G = next(curve.iter_points(x_start=1))
+        Q = curve.scalar_multiply(31337, G)
+        params = {'a': curve.a, 'b': curve.b, 'p': curve.p, 'gx': G[0], 'gy': G[1],
+                  'qx': Q[0], 'qy': Q[1], 'algorithm': algorithm, **extra}
+        n = curve.get_order(G)
+        estimate = plan(curve, G, n, algorithm, extra.get('k_min'), extra.get('k_max'))
+        job_id = f'job-{algorithm}-{secrets.token_hex(4)}'
+        create_dlp_job(job_id, None, 'session', estimate['algorithm'], params,
+                       estimate['estimated_steps'])
+        return job_id
+
+    def test_jobs_run_to_completion(self):
+        from app import dlp_jobs
+        from app.db_helpers import get_dlp_job
+        for algorithm, extra in (('auto', {}), ('rho_distinguished', {}), ('bsgs', {}),
+                                 ('kangaroo', {'k_min': 30000, 'k_max': 40000})):
+            job_id = self._queue(algorithm, **extra)
+            dlp_jobs._run_job(job_id)
+            job = dlp_jobs.describe_job(get_dlp_job(job_id))
+            self.assertEqual(job['status'], 'done', job)
+            self.assertEqual(job['result'], {'found_key': 31337})
+        self.assertEqual(get_dlp_job(job_id)['algorithm'], 'kangaroo')
+
+    def test_finished_bsgs_job_reports_its_steps(self):
+        from app import dlp_jobs
+        from app.db_helpers import get_dlp_job
+        job_id = self._queue('bsgs')
+        dlp_jobs._run_job(job_id)
+        job = dlp_jobs.describe_job(get_dlp_job(job_id))
+        self.assertEqual(job['status'], 'done')
+        self.assertGreater(job['steps'], 0)
+        self.assertEqual(job['progress'], 1.0)
+
+    def test_brute_force_runs_as_bsgs(self):
+        from unittest import mock
+        from app import dlp_jobs
+        from app.db_helpers import get_dlp_job
+        from app.dlp_planner import plan
+        curve = self.curve
+        G = next(curve.iter_points(x_start=1))
+        Q = curve.scalar_multiply(31337, G)
+        params = {'a': curve.a, 'b': curve.b, 'p': curve.p, 'gx': G[0], 'gy': G[1],
+                  'qx': Q[0], 'qy': Q[1], 'algorithm': 'brute_force'}
+        with mock.patch.object(dlp_jobs, '_get_pool') as pool:
+            job_id = dlp_jobs.submit_job(params)
+        pool.return_value.submit.assert_called_once_with(dlp_jobs._run_job, job_id)
+        job = get_dlp_job(job_id)
+        self.assertEqual(job['algorithm'], 'bsgs')
+        self.assertEqual(job['expected_steps'], plan(curve, G, curve.get_order(G), 'bsgs')['estimated_steps'])
+        dlp_jobs._run_job(job_id)
+        self.assertEqual(get_dlp_job(job_id)['result'], {'found_key': 31337})
+
+    def test_stale_running_jobs_fail(self):
+        from datetime import datetime, timedelta
+        from app import dlp_jobs
+        from app.db_helpers import get_dlp_job, update_dlp_job
+        long_ago = (datetime.utcnow() - timedelta(seconds=2 * dlp_jobs.STALE_JOB_SECONDS)).isoformat()
+        orphan, live, queued = self._queue('rho'), self._queue('rho'), self._queue('rho')
+        update_dlp_job(orphan, status='running', started_at=long_ago, updated_at=long_ago)
+        update_dlp_job(live, status='running', started_at=long_ago, updated_at=dlp_jobs._now())
+        dlp_jobs.fail_stale_jobs()
+        job = dlp_jobs.describe_job(get_dlp_job(orphan))
+        self.assertEqual(job['status'], 'failed')
+        self.assertIn('restart', job['error'])
+        self.assertIsNotNone(job['finished_at'])
+        self.assertEqual(get_dlp_job(live)['status'], 'running')
+        self.assertEqual(get_dlp_job(queued)['status'], 'queued')
+
+    def test_cancellation(self):
+        from unittest import mock
+        from app import dlp_jobs
+        from app.db_helpers import get_dlp_job
+        job_id = self._queue('rho')
+        self.assertTrue(dlp_jobs.cancel_job(job_id))
+        dlp_jobs._run_job(job_id)
+        self.assertEqual(get_dlp_job(job_id)['status'], 'cancelled')
+        self.assertFalse(dlp_jobs.cancel_job(job_id))
+
+        # A flag raised while running stops the solver at its next report.
+        job_id = self._queue('rho_floyd', curve=self.large)
+        real_progress_check = dlp_jobs.get_dlp_job
+
+        def cancel_on_progress(jid):
+            job = real_progress_check(jid)
+            if job['status'] == 'running':
+                job['cancel_requested'] = 1
+            return job
+
+        with mock.patch.object(dlp_jobs, 'PROGRESS_SAVE_SECONDS', 0), \
+                mock.patch.object(dlp_jobs, 'get_dlp_job', cancel_on_progress):
+            dlp_jobs._run_job(job_id)
+        job = get_dlp_job(job_id)
+        self.assertEqual(job['status'], 'cancelled')
+        self.assertGreater(job['steps'], 0)
+
+    def test_solvers_report_progress(self):
+        curve = self.large
+        G = next(curve.iter_points())
+        Q = curve.scalar_multiply(10**7, G)
+        for solve in (lambda progress: curve.discrete_log_rho(G, Q, cycle='distinguished', progress=progress),
+                      lambda progress: curve.discrete_log_kangaroo(G, Q, 0, 10**8, progress=progress),
+                      lambda progress: curve.discrete_log_bsgs(G, [Q], progress=progress)):
+            reports = []
+            solve(reports.append)
+            self.assertTrue(reports)
+            self.assertEqual(reports, sorted(reports))
+
+        def stop(steps):
+            raise RuntimeError('stop')
+        self.assertRaises(RuntimeError, curve.discrete_log_rho, G, Q, cycle='floyd', progress=stop)
+
+
+class TestDlpPlanner(unittest.TestCase):
+    def test_calibration(self):
+        from app import dlp_planner
+        table = dlp_planner.calibrate(samples=32)
+        self.assertEqual(sorted(table), [64, 256])
+        for costs in table.values():
+            self.assertTrue(all(cost > 0 for cost in costs.values()), costs)
+        # Field operations get slower with the field size.
+        self.assertGreater(dlp_planner.unit_costs(512)['add'], dlp_planner.unit_costs(32)['add'])
+
+    def test_choices(self):
+        from app.dlp_planner import plan
+        # Smooth 61-bit order: only Pohlig-Hellman is cheap.
+        curve = EllipticCurve(-3, 5, 2**61 - 1)
+        G = next(curve.iter_points(x_start=1))
+        n = curve.get_order(G)
+        chosen = plan(curve, G, n)
+        self.assertEqual(chosen['algorithm'], 'pohlig_hellman')
+        self.assertEqual(chosen['candidates'][0], {k: v for k, v in chosen.items() if k != 'candidates'})
+        brute = next(c for c in chosen['candidates'] if c['algorithm'] == 'brute_force')
+        self.assertFalse(brute['feasible'])
+
+        # Prime order: no Pohlig-Hellman; a narrow interval makes the kangaroo win.
+        curve = get_curve(1, 13, 4294967291)
+        G = next(curve.iter_points(x_start=1))
+        n = curve.get_order(G)
+        names = {c['algorithm'] for c in plan(curve, G, n)['candidates']}
+        self.assertEqual(names, {'brute_force', 'bsgs', 'rho', 'rho_distinguished'})
+        self.assertEqual(plan(curve, G, n, k_min=10**6, k_max=2 * 10**6)['algorithm'], 'kangaroo')
+
+        # A requested algorithm is only costed.
+        forced = plan(curve, G, n, 'rho_floyd')
+        self.assertEqual([c['algorithm'] for c in forced['candidates']], ['rho_floyd'])
+        self.assertGreater(forced['estimated_steps'], math.isqrt(n))
+
+    def test_cached_table_is_cheaper(self):
+        from app.dlp_planner import estimate
+        curve = get_curve(2, 3, 1000003)
+        G = next(curve.iter_points(x_start=5))
+        n = curve.get_order(G)
+        cold = estimate(curve, G, n, 'bsgs')
+        curve.discrete_log_bsgs(G, [G])
+        warm = estimate(curve, G, n, 'bsgs')
+        self.assertLess(warm['estimated_steps'], cold['estimated_steps'])
+        self.assertRaises(ValueError, estimate, curve, G, n, 'guess')
+
+
+class TestStreamingRoutes(unittest.TestCase):
+    def setUp(self):
+        from app import app
+        self.client = app.test_client()
+
+    def _post(self, url, body):
+        import json
+        response = self.client.post(url, json=body)
+        if response.mimetype != 'application/x-ndjson':
+            return response.get_json()
+        return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    def test_brute_force_stream(self):
+        curve = get_curve(2, 3, 97)
+        G = next(curve.iter_points(x_start=1))
+        Q = curve.scalar_multiply(7, G)
+        body = {'a': 2, 'b': 3, 'p': 97, 'gx': G[0], 'gy': G[1], 'qx': Q[0], 'qy': Q[1]}
+        whole = self._post('/api/discrete_log_solve', body)
+        lines = self._post('/api/discrete_log_solve', {**body, 'stream': True})
+        self.assertEqual([line.pop('type') for line in lines], ['attempt'] * 7 + ['result'])
+        *attempts, result = lines
+        self.assertEqual(attempts, whole.pop('attempts'))
+        # Streamed attempts are not kept, so only the plan's memory differs.
+        self.assertEqual(result.pop('plan')['algorithm'], whole.pop('plan')['algorithm'])
+        self.assertEqual(result, whole)
+        self.assertEqual(result['found_key'], 7)
+
+        # Errors found before streaming starts are still plain JSON.
+        error = self._post('/api/discrete_log_solve', {**body, 'gx': 0, 'stream': True})
+        self.assertFalse(error['success'])
+
+    def test_use_bsgs_selects_bsgs(self):
+        for p in (97, 1009):
+            curve = get_curve(2, 3, p)
+            G = next(curve.iter_points(x_start=1))
+            Q = curve.scalar_multiply(5, G)
+            body = {'a': 2, 'b': 3, 'p': p, 'gx': G[0], 'gy': G[1], 'qx': Q[0], 'qy': Q[1],
+                    'use_bsgs': True}
+            result = self._post('/api/discrete_log_solve', body)
+            self.assertEqual(result['algorithm'], 'bsgs')
+            self.assertEqual(result['plan']['algorithm'], 'bsgs')
+            self.assertEqual(curve.scalar_multiply(result['found_key'], G), Q)
+
+    def test_scalar_multiply_stream(self):
+        curve = get_curve(2, 3, 97)
+        G = next(curve.iter_points(x_start=1))
+        body = {'a': 2, 'b': 3, 'p': 97, 'k': 45,
+                'point': {'x': G[0], 'y': G[1], 'display': f'({G[0]}, {G[1]})'}}
+        whole = self._post('/api/scalar_multiply', body)
+        lines = self._post('/api/scalar_multiply', {**body, 'stream': True})
+        self.assertEqual([line['text'] for line in lines[:-1]], whole['steps'])
+        self.assertEqual(lines[-1], {'type': 'result', 'success': True, 'result': whole['result'],
+                                     'points': whole['points']})
+
+        # Both replies leave the same steps in the operation history.
+        import json
+        from app import db_helpers
+        conn = db_helpers.get_db()
+        self.addCleanup(conn.close)
+        rows = conn.execute("SELECT result FROM operation_history WHERE operation_type = 'multiply_fp' "
+                            "ORDER BY id DESC LIMIT 2").fetchall()
+        self.assertEqual([json.loads(row[0])['steps'] for row in rows], [whole['steps']] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()